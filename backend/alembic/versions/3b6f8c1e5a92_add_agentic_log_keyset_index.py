@@ -0,0 +1,29 @@
+"""add_agentic_log_keyset_index
+
+Revision ID: 3b6f8c1e5a92
+Revises: 7d2e4b9f1c60
+Create Date: 2026-10-18 14:20:33.604188
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b6f8c1e5a92'
+down_revision: Union[str, Sequence[str], None] = '7d2e4b9f1c60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_agentic_logs_regulation_fragment_id_created_at_id', 'agentic_logs',
+                    ['regulation_fragment_id', 'created_at', 'id'], unique=False,
+                    postgresql_include=['message_source', 'is_error'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_agentic_logs_regulation_fragment_id_created_at_id', table_name='agentic_logs')
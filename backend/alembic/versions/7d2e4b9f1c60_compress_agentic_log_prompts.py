@@ -0,0 +1,122 @@
+"""compress_agentic_log_prompts
+
+Revision ID: 7d2e4b9f1c60
+Revises: 0c5a9e7d3b18
+Create Date: 2026-10-18 13:41:05.271866
+
+"""
+import hashlib
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2e4b9f1c60'
+down_revision: Union[str, Sequence[str], None] = '0c5a9e7d3b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Number of logs converted per statement while backfilling
+BATCH_SIZE = 1000
+
+prompt_blobs = sa.table(
+    'prompt_blobs',
+    sa.column('hash', sa.String()),
+    sa.column('content', sa.LargeBinary()),
+    sa.column('size', sa.Integer()),
+)
+agentic_logs = sa.table(
+    'agentic_logs',
+    sa.column('id', sa.Integer()),
+    sa.column('user_prompt', sa.String()),
+    sa.column('system_prompt', sa.String()),
+    sa.column('user_prompt_hash', sa.String()),
+    sa.column('system_prompt_hash', sa.String()),
+)
+
+
+def _encode(text):
+    # Same encoding as modules/models/infra/prompt_blob_codec.py, copied so the migration does not depend on app code
+    data = text.encode("utf-8")
+    return hashlib.sha256(data).hexdigest(), zlib.compress(data), len(data)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('prompt_blobs',
+    sa.Column('hash', sa.String(), nullable=False),
+    sa.Column('content', sa.LargeBinary(), nullable=False),
+    sa.Column('size', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('hash')
+    )
+    op.add_column('agentic_logs', sa.Column('user_prompt_hash', sa.String(), nullable=True))
+    op.add_column('agentic_logs', sa.Column('system_prompt_hash', sa.String(), nullable=True))
+
+    # Move the prompts of existing logs into the blob table, batch by batch
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(agentic_logs.c.id, agentic_logs.c.user_prompt, agentic_logs.c.system_prompt)
+            .where(agentic_logs.c.id > last_id)
+            .order_by(agentic_logs.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+
+        blobs = {}
+        updates = []
+        for log_id, user_prompt, system_prompt in rows:
+            hashes = {}
+            for column, prompt in (('user_prompt_hash', user_prompt), ('system_prompt_hash', system_prompt)):
+                if prompt is None:
+                    hashes[column] = None
+                    continue
+                prompt_hash, content, size = _encode(prompt)
+                blobs[prompt_hash] = {'hash': prompt_hash, 'content': content, 'size': size}
+                hashes[column] = prompt_hash
+            updates.append({'log_id': log_id, **hashes})
+
+        connection.execute(insert(prompt_blobs).values(list(blobs.values())).on_conflict_do_nothing())
+        connection.execute(
+            agentic_logs.update()
+            .where(agentic_logs.c.id == sa.bindparam('log_id'))
+            .values(user_prompt_hash=sa.bindparam('user_prompt_hash'),
+                    system_prompt_hash=sa.bindparam('system_prompt_hash')),
+            updates
+        )
+        last_id = rows[-1][0]
+
+    op.alter_column('agentic_logs', 'user_prompt_hash', nullable=False)
+    op.create_foreign_key('agentic_logs_user_prompt_hash_fkey', 'agentic_logs', 'prompt_blobs',
+                          ['user_prompt_hash'], ['hash'])
+    op.create_foreign_key('agentic_logs_system_prompt_hash_fkey', 'agentic_logs', 'prompt_blobs',
+                          ['system_prompt_hash'], ['hash'])
+    op.drop_column('agentic_logs', 'system_prompt')
+    op.drop_column('agentic_logs', 'user_prompt')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('agentic_logs', sa.Column('user_prompt', sa.VARCHAR(), autoincrement=False, nullable=True))
+    op.add_column('agentic_logs', sa.Column('system_prompt', sa.VARCHAR(), autoincrement=False, nullable=True))
+
+    connection = op.get_bind()
+    for prompt_hash, content in connection.execute(sa.select(prompt_blobs.c.hash, prompt_blobs.c.content)):
+        text = zlib.decompress(content).decode("utf-8")
+        connection.execute(agentic_logs.update().where(agentic_logs.c.user_prompt_hash == prompt_hash)
+                           .values(user_prompt=text))
+        connection.execute(agentic_logs.update().where(agentic_logs.c.system_prompt_hash == prompt_hash)
+                           .values(system_prompt=text))
+
+    op.alter_column('agentic_logs', 'user_prompt', nullable=False)
+    op.drop_constraint('agentic_logs_system_prompt_hash_fkey', 'agentic_logs', type_='foreignkey')
+    op.drop_constraint('agentic_logs_user_prompt_hash_fkey', 'agentic_logs', type_='foreignkey')
+    op.drop_column('agentic_logs', 'system_prompt_hash')
+    op.drop_column('agentic_logs', 'user_prompt_hash')
+    op.drop_table('prompt_blobs')
@@ -0,0 +1,58 @@
+"""add_llm_usage_hourly_rollup
+
+Revision ID: 9b3c6d1e4f27
+Revises: 5d8e2f0a7c41
+Create Date: 2026-10-18 17:31:45.602318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3c6d1e4f27'
+down_revision: Union[str, Sequence[str], None] = '5d8e2f0a7c41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    llm_usage_stage = postgresql.ENUM('ATOMS', 'RULES', 'EXAMPLES', 'CHAT', 'OTHER', name='llmusagestage')
+    llm_usage_stage.create(op.get_bind())
+
+    # Calls recorded so far are not attributed to a stage
+    op.add_column('llm_usage', sa.Column('stage', llm_usage_stage, nullable=False, server_default='OTHER'))
+    op.alter_column('llm_usage', 'stage', server_default=None)
+
+    op.create_table('llm_usage_hourly',
+    sa.Column('hour', sa.DateTime(), nullable=False),
+    sa.Column('llm_identifier', postgresql.ENUM(name='llmidentifier', create_type=False), nullable=False),
+    sa.Column('stage', postgresql.ENUM(name='llmusagestage', create_type=False), nullable=False),
+    sa.Column('calls', sa.Integer(), nullable=False),
+    sa.Column('errors', sa.Integer(), nullable=False),
+    sa.Column('input_tokens', sa.BigInteger(), nullable=False),
+    sa.Column('output_tokens', sa.BigInteger(), nullable=False),
+    sa.Column('cached_input_tokens', sa.BigInteger(), nullable=False),
+    sa.Column('latency_ms', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('hour', 'llm_identifier', 'stage')
+    )
+
+    op.execute("""
+        INSERT INTO llm_usage_hourly (hour, llm_identifier, stage, calls, errors, input_tokens, output_tokens,
+                                      cached_input_tokens, latency_ms)
+        SELECT date_trunc('hour', created_at), llm_identifier, stage, count(*), count(*) FILTER (WHERE is_error),
+               sum(input_tokens), sum(output_tokens), sum(cached_input_tokens), sum(latency_ms)
+        FROM llm_usage
+        GROUP BY 1, 2, 3
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('llm_usage_hourly')
+    op.drop_column('llm_usage', 'stage')
+    postgresql.ENUM(name='llmusagestage').drop(op.get_bind())
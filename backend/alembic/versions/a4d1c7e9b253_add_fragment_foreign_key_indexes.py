@@ -0,0 +1,37 @@
+"""add_fragment_foreign_key_indexes
+
+Revision ID: a4d1c7e9b253
+Revises: 3b6f8c1e5a92
+Create Date: 2026-10-18 16:05:12.418730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d1c7e9b253'
+down_revision: Union[str, Sequence[str], None] = '3b6f8c1e5a92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # agentic_logs is already covered by the keyset index, which leads with regulation_fragment_id
+    op.create_index('ix_chat_messages_regulation_fragment_id_created_at', 'chat_messages',
+                    ['regulation_fragment_id', 'created_at'], unique=False)
+    op.create_index(op.f('ix_atoms_regulation_fragment_id'), 'atoms', ['regulation_fragment_id'], unique=False)
+    op.create_index(op.f('ix_atom_spans_atom_id'), 'atom_spans', ['atom_id'], unique=False)
+    op.create_index(op.f('ix_rules_regulation_fragment_id'), 'rules', ['regulation_fragment_id'], unique=False)
+    op.create_index(op.f('ix_jobs_regulation_fragment_id'), 'jobs', ['regulation_fragment_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_jobs_regulation_fragment_id'), table_name='jobs')
+    op.drop_index(op.f('ix_rules_regulation_fragment_id'), table_name='rules')
+    op.drop_index(op.f('ix_atom_spans_atom_id'), table_name='atom_spans')
+    op.drop_index(op.f('ix_atoms_regulation_fragment_id'), table_name='atoms')
+    op.drop_index('ix_chat_messages_regulation_fragment_id_created_at', table_name='chat_messages')
@@ -0,0 +1,29 @@
+"""add_cached_token_field_to_regulation_fragment
+
+Revision ID: f2b8d4e61a37
+Revises: e1f3a7c29b04
+Create Date: 2025-10-18 10:12:43.218409
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b8d4e61a37'
+down_revision: Union[str, Sequence[str], None] = 'e1f3a7c29b04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('regulation_fragments',
+                  sa.Column('used_tokens_in_cached', sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('regulation_fragments', 'used_tokens_in_cached')
@@ -6,9 +6,12 @@ from flask_cors import CORS
 
 from di_container import container
 from modules.models.infra.agentic_log_controller import agentic_log_controller
+from modules.models.infra.llm_usage_controller import llm_usage_controller
 from modules.atoms.infra.atom_controller import atom_controller
 from modules.chat.infra.controllers.chat_controller import chat_controller
 from modules.explanations.infra.explanation_controller import explanation_controller
+from modules.jobs.infra.job_controller import job_controller
+from modules.jobs.infra.pipeline_controller import pipeline_controller
 from modules.reasoning.infra.prolog_reasoner_controller import prolog_reasoner_controller
 from modules.regulation_fragment.infra.regulation_fragment_controller import \
     regulation_fragment_controller
@@ -23,11 +26,14 @@ app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("DATABASE_URL")
 db = container.db()
 CORS(app)
 app.register_blueprint(agentic_log_controller)
+app.register_blueprint(llm_usage_controller)
 app.register_blueprint(chat_controller)
 app.register_blueprint(regulation_fragment_controller)
 app.register_blueprint(atom_controller)
 app.register_blueprint(rule_controller)
 app.register_blueprint(explanation_controller)
+app.register_blueprint(job_controller)
+app.register_blueprint(pipeline_controller)
 
 app.register_blueprint(prolog_reasoner_controller)
 
@@ -39,5 +45,11 @@ with app.app_context():
     _ = db_models
     db.init_app(app)
 
+# Writes the agentic logs of LLM calls in the background
+container.agentic_log_writer().start(app)
+
+# Runs the queued LLM generations (see modules/jobs), every server process contributes JOB_WORKERS threads
+container.job_worker_pool().start(app)
+
 if __name__ == '__main__':
     app.run(debug=True)
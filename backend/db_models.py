@@ -1,11 +1,14 @@
 from datetime import datetime, timezone
 from typing import List
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import BigInteger, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from modules.chat.domain.agent import Agent
+from modules.jobs.domain.job_status import JobStatus
+from modules.jobs.domain.job_type import JobType
 from modules.models.domain.llm_identifier import LLMIdentifier
+from modules.models.domain.llm_usage_stage import LLMUsageStage
 from modules.models.domain.message_source import MessageSource
 from modules.regulation_fragment.domain import Formalism
 
@@ -26,6 +29,8 @@ class RegulationFragment(Base):
     formalism: Mapped[Formalism] = mapped_column(nullable=False, default=Formalism.PROLOG)
     used_tokens_in: Mapped[int] = mapped_column(nullable=False, default=0)
     used_tokens_out: Mapped[int] = mapped_column(nullable=False, default=0)
+    # Part of used_tokens_in which was read from the provider's prompt cache
+    used_tokens_in_cached: Mapped[int] = mapped_column(nullable=False, default=0)
 
     agentic_logs: Mapped[List["AgenticLog"]] = relationship(back_populates="regulation_fragment",
                                                             cascade="all, delete-orphan")
@@ -33,6 +38,7 @@ class RegulationFragment(Base):
                                                               cascade="all, delete-orphan")
     atoms: Mapped[List["Atom"]] = relationship(back_populates="regulation_fragment", cascade="all, delete-orphan")
     rules: Mapped[List["Rule"]] = relationship(back_populates="regulation_fragment", cascade="all, delete-orphan")
+    jobs: Mapped[List["Job"]] = relationship(back_populates="regulation_fragment", cascade="all, delete-orphan")
 
     def __repr__(self):
         return f'<Regulation Fragment {self.title}>'
@@ -40,11 +46,17 @@ class RegulationFragment(Base):
 
 class AgenticLog(Base):
     __tablename__ = 'agentic_logs'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Keyset pagination of the logs of a fragment, covers the metadata so listing it needs no table access
+        Index('ix_agentic_logs_regulation_fragment_id_created_at_id', 'regulation_fragment_id', 'created_at', 'id',
+              postgresql_include=['message_source', 'is_error']),
+        {'extend_existing': True},
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    user_prompt: Mapped[str] = mapped_column(nullable=False)
-    system_prompt: Mapped[str] = mapped_column(nullable=True)  # Optional system prompt
+    # Prompts are stored compressed and deduplicated in prompt_blobs, retries repeat the same prompts many times
+    user_prompt_hash: Mapped[str] = mapped_column(ForeignKey("prompt_blobs.hash"), nullable=False)
+    system_prompt_hash: Mapped[str] = mapped_column(ForeignKey("prompt_blobs.hash"), nullable=True)  # Optional
     message_source: Mapped[MessageSource] = mapped_column(nullable=False)  # Kept for compatibility
     regulation_fragment_id: Mapped[int] = mapped_column(ForeignKey("regulation_fragments.id", ondelete='CASCADE'),
                                                         nullable=False)
@@ -52,14 +64,32 @@ class AgenticLog(Base):
     is_error: Mapped[bool] = mapped_column(default=False)
 
     regulation_fragment: Mapped["RegulationFragment"] = relationship(back_populates="agentic_logs")
+    user_prompt_blob: Mapped["PromptBlob"] = relationship(foreign_keys=[user_prompt_hash])
+    system_prompt_blob: Mapped["PromptBlob"] = relationship(foreign_keys=[system_prompt_hash])
 
     def __repr__(self):
         return f'<AgenticLog {self.id} for Fragment {self.regulation_fragment_id}>'
 
 
+class PromptBlob(Base):
+    __tablename__ = 'prompt_blobs'
+    __table_args__ = {'extend_existing': True}
+
+    hash: Mapped[str] = mapped_column(primary_key=True)  # SHA-256 of the uncompressed text
+    content: Mapped[bytes] = mapped_column(nullable=False)  # zlib compressed UTF-8 text
+    size: Mapped[int] = mapped_column(nullable=False)  # Uncompressed size in bytes
+
+    def __repr__(self):
+        return f'<PromptBlob {self.hash}>'
+
+
 class ChatMessage(Base):
     __tablename__ = 'chat_messages'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # The chat of a fragment is read newest first
+        Index('ix_chat_messages_regulation_fragment_id_created_at', 'regulation_fragment_id', 'created_at'),
+        {'extend_existing': True},
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     regulation_fragment_id: Mapped[int] = mapped_column(ForeignKey("regulation_fragments.id", ondelete='CASCADE'),
@@ -80,7 +110,7 @@ class Atom(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     regulation_fragment_id: Mapped[int] = mapped_column(ForeignKey("regulation_fragments.id", ondelete='CASCADE'),
-                                                        nullable=False)
+                                                        nullable=False, index=True)
     predicate: Mapped[str] = mapped_column(nullable=False)
     description: Mapped[str] = mapped_column(nullable=False)
     is_negated: Mapped[bool] = mapped_column(default=False)
@@ -97,7 +127,7 @@ class AtomSpan(Base):
     __table_args__ = {'extend_existing': True}
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    atom_id: Mapped[int] = mapped_column(ForeignKey("atoms.id", ondelete='CASCADE'), nullable=False)
+    atom_id: Mapped[int] = mapped_column(ForeignKey("atoms.id", ondelete='CASCADE'), nullable=False, index=True)
     atom: Mapped["Atom"] = relationship(back_populates="spans")
     start: Mapped[int] = mapped_column(nullable=False)
     end: Mapped[int] = mapped_column(nullable=False)
@@ -112,7 +142,7 @@ class Rule(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     regulation_fragment_id: Mapped[int] = mapped_column(ForeignKey("regulation_fragments.id", ondelete='CASCADE'),
-                                                        nullable=False)
+                                                        nullable=False, index=True)
     description: Mapped[str] = mapped_column(nullable=False)
     definition: Mapped[str] = mapped_column(nullable=False)
     is_goal: Mapped[bool] = mapped_column(default=False)
@@ -122,3 +152,88 @@ class Rule(Base):
 
     def __repr__(self):
         return f'<Rule {self.id} for Fragment {self.regulation_fragment_id}>'
+
+
+class Job(Base):
+    __tablename__ = 'jobs'
+    __table_args__ = {'extend_existing': True}
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    type: Mapped[JobType] = mapped_column(nullable=False)
+    status: Mapped[JobStatus] = mapped_column(nullable=False, default=JobStatus.PENDING, index=True)
+    regulation_fragment_id: Mapped[int] = mapped_column(ForeignKey("regulation_fragments.id", ondelete='CASCADE'),
+                                                        nullable=False, index=True)
+    # Copied from the fragment when enqueuing, concurrency is bounded per LLM
+    llm_identifier: Mapped[LLMIdentifier] = mapped_column(nullable=False)
+    # Set if the job is a stage of a pipeline, the next stage is queued when it succeeds
+    pipeline_id: Mapped[int] = mapped_column(ForeignKey("pipelines.id", ondelete='CASCADE'), nullable=True,
+                                             index=True)
+    payload: Mapped[str] = mapped_column(nullable=True)  # JSON encoded request body
+    result: Mapped[str] = mapped_column(nullable=True)  # JSON encoded result
+    error: Mapped[str] = mapped_column(nullable=True)
+    created_at: Mapped[datetime] = mapped_column(default=lambda: datetime.now(timezone.utc))
+    started_at: Mapped[datetime] = mapped_column(nullable=True)
+    finished_at: Mapped[datetime] = mapped_column(nullable=True)
+
+    regulation_fragment: Mapped["RegulationFragment"] = relationship(back_populates="jobs")
+    pipeline: Mapped["Pipeline"] = relationship(back_populates="jobs")
+
+    def __repr__(self):
+        return f'<Job {self.id} ({self.type}) for Fragment {self.regulation_fragment_id}>'
+
+
+class Pipeline(Base):
+    __tablename__ = 'pipelines'
+    __table_args__ = {'extend_existing': True}
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(default=lambda: datetime.now(timezone.utc))
+
+    # The stage jobs of all fragments, they are the checkpoints of the pipeline
+    jobs: Mapped[List["Job"]] = relationship(back_populates="pipeline", cascade="all, delete-orphan",
+                                             order_by="Job.id")
+
+    def __repr__(self):
+        return f'<Pipeline {self.id}>'
+
+
+class LLMUsage(Base):
+    __tablename__ = 'llm_usage'
+    __table_args__ = {'extend_existing': True}
+
+    # One row per LLM call, so cost and throughput can be aggregated without the agentic logs
+    id: Mapped[int] = mapped_column(primary_key=True)
+    # Kept when the fragment is deleted, the tokens were paid for nevertheless
+    regulation_fragment_id: Mapped[int] = mapped_column(ForeignKey("regulation_fragments.id", ondelete='SET NULL'),
+                                                        nullable=True, index=True)
+    llm_identifier: Mapped[LLMIdentifier] = mapped_column(nullable=False)
+    stage: Mapped[LLMUsageStage] = mapped_column(nullable=False, default=LLMUsageStage.OTHER)
+    input_tokens: Mapped[int] = mapped_column(nullable=False, default=0)
+    output_tokens: Mapped[int] = mapped_column(nullable=False, default=0)
+    # Part of input_tokens which was read from the provider's prompt cache
+    cached_input_tokens: Mapped[int] = mapped_column(nullable=False, default=0)
+    latency_ms: Mapped[int] = mapped_column(nullable=False)  # Including retries and the whole stream
+    is_error: Mapped[bool] = mapped_column(default=False)
+    created_at: Mapped[datetime] = mapped_column(default=lambda: datetime.now(timezone.utc), index=True)
+
+    def __repr__(self):
+        return f'<LLMUsage {self.id} of {self.llm_identifier} for Fragment {self.regulation_fragment_id}>'
+
+
+class LLMUsageHourly(Base):
+    __tablename__ = 'llm_usage_hourly'
+    __table_args__ = {'extend_existing': True}
+
+    # The ledger rolled up per hour, model and stage while it is written, the analytics sum these instead of the calls
+    hour: Mapped[datetime] = mapped_column(primary_key=True)
+    llm_identifier: Mapped[LLMIdentifier] = mapped_column(primary_key=True)
+    stage: Mapped[LLMUsageStage] = mapped_column(primary_key=True)
+    calls: Mapped[int] = mapped_column(nullable=False, default=0)
+    errors: Mapped[int] = mapped_column(nullable=False, default=0)
+    input_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    output_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    cached_input_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    latency_ms: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)  # Sum over the calls
+
+    def __repr__(self):
+        return f'<LLMUsageHourly {self.hour} of {self.llm_identifier} for {self.stage}>'
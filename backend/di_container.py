@@ -1,3 +1,5 @@
+import os
+
 from dependency_injector import containers, providers
 
 from db import create_db
@@ -5,14 +7,26 @@ from modules.atoms.application.atom_service import AtomService
 from modules.atoms.infra.atom_repository import AtomRepository
 from modules.chat.application.chat_service import ChatService
 from modules.chat.infra.repositories.chat_repository import ChatRepository
+from modules.common.unit_of_work import UnitOfWork
 from modules.explanations.application.explanation_service import ExplanationService
+from modules.jobs.application.job_service import JobService
+from modules.jobs.application.job_worker_pool import JobWorkerPool
+from modules.jobs.infra.job_repository import JobRepository
 from modules.models.application.agentic_log_service import AgenticLogService
+from modules.models.application.agentic_log_writer import AgenticLogWriter
 from modules.models.application.llm_adapter import LLMAdapter
+from modules.models.application.llm_usage_service import LLMUsageService
 from modules.models.infra.agentic_log_repository import AgenticLogRepository
+from modules.models.infra.llm_response_cache import LLMResponseCache
+from modules.models.infra.llm_usage_repository import LLMUsageRepository
+from modules.reasoning.application.knowledge_base_service import KnowledgeBaseService
+from modules.reasoning.application.local_prolog_reasoner import LocalPrologReasoner
 from modules.reasoning.application.prolog_reasoner import PrologReasoner
 from modules.reasoning.application.prolog_reasoning_service import PrologReasoningService
+from modules.reasoning.infra.knowledge_base_cache import KnowledgeBaseCache
 from modules.models.domain.prompt_service import PromptService
 from modules.regulation_fragment.application.export_service import ExportService
+from modules.regulation_fragment.application.fragment_aggregate_service import FragmentAggregateService
 from modules.regulation_fragment.application.regulation_fragment_service import RegulationFragmentService
 from modules.regulation_fragment.infra.regulation_fragment_repository import \
     RegulationFragmentRepository
@@ -23,14 +37,22 @@ from modules.rules.infra.rule_repository import RuleRepository
 class Container(containers.DeclarativeContainer):
     db = providers.Singleton(create_db)
 
-    prolog_reasoner = providers.Singleton(PrologReasoner)
+    # PROLOG_BACKEND selects where Prolog runs: "http" for the pengine service, "local" for swipl processes
+    # next to the backend (single node installations).
+    prolog_reasoner = providers.Selector(
+        providers.Callable(os.getenv, "PROLOG_BACKEND", "http"),
+        http=providers.Singleton(PrologReasoner),
+        local=providers.Singleton(LocalPrologReasoner),
+    )
 
     prompt_service = providers.Singleton(PromptService)
 
     agentic_log_repository = providers.Singleton(AgenticLogRepository, db=db)
+    agentic_log_writer = providers.Singleton(AgenticLogWriter, agentic_log_repository=agentic_log_repository)
     agentic_log_service = providers.Singleton(
         AgenticLogService,
-        agentic_log_repository=agentic_log_repository
+        agentic_log_repository=agentic_log_repository,
+        agentic_log_writer=agentic_log_writer,
     )
 
     regulation_fragment_repository = providers.Singleton(RegulationFragmentRepository, db=db)
@@ -39,13 +61,34 @@ class Container(containers.DeclarativeContainer):
         regulation_fragment_repository=regulation_fragment_repository
     )
 
+    llm_response_cache = providers.Singleton(LLMResponseCache)
+
+    llm_usage_repository = providers.Singleton(LLMUsageRepository, db=db)
+    llm_usage_service = providers.Singleton(LLMUsageService, llm_usage_repository=llm_usage_repository)
+
     llm_adapter = providers.Singleton(
         LLMAdapter,
         agentic_log_service=agentic_log_service,
-        regulation_fragment_service=regulation_fragment_service
+        regulation_fragment_service=regulation_fragment_service,
+        prompt_service=prompt_service,
+        response_cache=llm_response_cache,
+        llm_usage_service=llm_usage_service,
     )
 
-    atom_repository = providers.Singleton(AtomRepository, db=db)
+    knowledge_base_cache = providers.Singleton(KnowledgeBaseCache)
+    unit_of_work = providers.Singleton(UnitOfWork, db=db)
+    fragment_aggregate_service = providers.Singleton(
+        FragmentAggregateService,
+        regulation_fragment_repository=regulation_fragment_repository,
+        knowledge_base_cache=knowledge_base_cache,
+    )
+
+    atom_repository = providers.Singleton(
+        AtomRepository,
+        db=db,
+        knowledge_base_cache=knowledge_base_cache,
+        unit_of_work=unit_of_work,
+    )
     atom_service = providers.Singleton(
         AtomService,
         regulation_fragment_service=regulation_fragment_service,
@@ -53,9 +96,15 @@ class Container(containers.DeclarativeContainer):
         chat_agent=llm_adapter,
         prolog_reasoner=prolog_reasoner,
         prompt_service=prompt_service,
+        unit_of_work=unit_of_work,
     )
 
-    rule_repository = providers.Singleton(RuleRepository, db=db)
+    rule_repository = providers.Singleton(
+        RuleRepository,
+        db=db,
+        knowledge_base_cache=knowledge_base_cache,
+        unit_of_work=unit_of_work,
+    )
     rule_service = providers.Singleton(
         RuleService,
         rule_repository=rule_repository,
@@ -66,38 +115,52 @@ class Container(containers.DeclarativeContainer):
         prompt_service=prompt_service,
     )
 
+    knowledge_base_service = providers.Singleton(
+        KnowledgeBaseService,
+        fragment_aggregate_service=fragment_aggregate_service,
+        knowledge_base_cache=knowledge_base_cache,
+    )
+
     chat_repository = providers.Singleton(ChatRepository, db=db)
     chat_service = providers.Singleton(
         ChatService,
-        atom_service=atom_service,
-        regulation_fragment_service=regulation_fragment_service,
+        knowledge_base_service=knowledge_base_service,
+        fragment_aggregate_service=fragment_aggregate_service,
         chat_repository=chat_repository,
         chat_agent=llm_adapter,
-        rule_service=rule_service,
         prompt_service=prompt_service,
     )
 
     prolog_reasoning_service = providers.Singleton(
         PrologReasoningService,
-        rule_service=rule_service,
-        atom_service=atom_service,
+        knowledge_base_service=knowledge_base_service,
         prolog_reasoner=prolog_reasoner,
     )
 
     explanation_service = providers.Singleton(
         ExplanationService,
-        rule_service=rule_service,
-        atom_service=atom_service,
+        fragment_aggregate_service=fragment_aggregate_service,
         prompt_service=prompt_service,
         llm_adapter=llm_adapter,
+        knowledge_base_service=knowledge_base_service,
     )
 
     export_service = providers.Singleton(
         ExportService,
+        fragment_aggregate_service=fragment_aggregate_service,
+        knowledge_base_service=knowledge_base_service,
+    )
+
+    job_repository = providers.Singleton(JobRepository, db=db)
+    job_service = providers.Singleton(
+        JobService,
+        job_repository=job_repository,
         regulation_fragment_service=regulation_fragment_service,
         atom_service=atom_service,
         rule_service=rule_service,
+        explanation_service=explanation_service,
     )
+    job_worker_pool = providers.Singleton(JobWorkerPool, job_service_factory=job_service.provider)
 
 
 container = Container()
@@ -1,9 +1,13 @@
 from modules.explanations.application.dto.example_generation_dto import ExamplesDTO
 from modules.models.application.dto.agentic_log_dto import AgenticLogDTO
+from modules.models.application.dto.agentic_log_page_dto import AgenticLogPageDTO
+from modules.models.application.dto.llm_usage_summary_dto import LLMUsageSummaryDTO
 from modules.chat.application.dto.create_chat_message_dto import CreateChatMessageDTO
 from modules.chat.application.dto.chat_message_dto import ChatMessageDTO
 from modules.regulation_fragment.application.dto.create_regulation_fragment_dto import CreateRegulationFragmentDTO
 from modules.regulation_fragment.application.dto.regulation_fragment_dto import RegulationFragmentDTO
+from modules.regulation_fragment.application.dto.regulation_fragment_page_dto import RegulationFragmentPageDTO
+from modules.regulation_fragment.application.dto.regulation_fragment_summary_dto import RegulationFragmentSummaryDTO
 from modules.regulation_fragment.application.dto.price_dto import PriceDTO
 from modules.atoms.application.dto.create_atom_dto import CreateAtomDTO
 from modules.atoms.application.dto.update_atom_dto import UpdateAtomDTO
@@ -14,16 +18,24 @@ from modules.rules.application.dto.regenerate_rules_dto import RegenerateRulesDT
 from modules.rules.application.dto.rule_dto import RuleDTO
 from modules.rules.application.dto.create_rule_dto import CreateRuleDTO
 from modules.rules.application.dto.update_rule_dto import UpdateRuleDTO
-from modules.reasoning.application.dto.prolog_result_dto import PrologResultDTO, PrologAnswerDTO, PrologHttpResponseDTO
-from modules.reasoning.application.dto.prolog_query_dto import PrologQueryDTO
+from modules.reasoning.application.dto.prolog_result_dto import PrologResultDTO, PrologAnswerDTO, PrologHttpResponseDTO, \
+    PrologBatchResultDTO
+from modules.jobs.application.dto.job_dto import JobDTO
+from modules.jobs.application.dto.pipeline_dto import PipelineDTO
+from modules.jobs.application.dto.create_pipeline_dto import CreatePipelineDTO
+from modules.reasoning.application.dto.prolog_query_dto import PrologQueryDTO, PrologBatchQueryDTO
 
 # Stop PyCharm from optimizing imports :))))))
 _ = [
     AgenticLogDTO,
+    AgenticLogPageDTO,
+    LLMUsageSummaryDTO,
     CreateChatMessageDTO,
     ChatMessageDTO,
     CreateRegulationFragmentDTO,
     RegulationFragmentDTO,
+    RegulationFragmentPageDTO,
+    RegulationFragmentSummaryDTO,
     PriceDTO,
     CreateAtomDTO,
     UpdateAtomDTO,
@@ -38,5 +50,10 @@ _ = [
     PrologAnswerDTO,
     PrologQueryDTO,
     PrologHttpResponseDTO,
+    PrologBatchQueryDTO,
+    PrologBatchResultDTO,
     ExamplesDTO,
+    JobDTO,
+    PipelineDTO,
+    CreatePipelineDTO,
 ]
@@ -21,25 +21,39 @@ from modules.atoms.application.dto.atom_dto import AtomDTO
 from modules.atoms.application.dto.atom_extraction_result_dto import AtomExtractionResultDTO
 from modules.atoms.application.dto.atom_span_dto import AtomSpanDTO
 from modules.atoms.application.dto.create_atom_dto import CreateAtomDTO
-from modules.atoms.application.dto.create_atom_span_dto import CreateAtomSpanDTO
 from modules.atoms.application.dto.regenerate_atoms_dto import RegenerateAtomsDTO
 from modules.atoms.application.dto.update_atom_dto import UpdateAtomDTO
 from modules.atoms.infra.atom_repository import AtomRepository
+from modules.models.application.dto.chat_agent_message_egress_dto import ChatAgentMessageEgressDTO
 from modules.models.application.dto.chat_agent_message_ingress_dto import ChatAgentMessageIngressDTO
 from modules.models.application.llm_adapter import LLMAdapter
-from modules.reasoning.application.prolog_reasoner import PrologReasoner
+from modules.reasoning.domain.i_prolog_reasoner import IPrologReasoner
+from modules.models.domain.llm_usage_stage import LLMUsageStage
 from modules.models.domain.prompt_service import PromptService
 from modules.regulation_fragment.application.regulation_fragment_service import RegulationFragmentService
 from modules.chat.application.dto.context_message_dto import ContextMessageDTO
 from modules.chat.domain.context_message_type import ContextMessageType
+from modules.common.prolog_syntax import PrologSyntaxError
+from modules.common.unit_of_work import UnitOfWork
+
+
+def _parse_atom_extraction(response: ChatAgentMessageEgressDTO) -> AtomExtractionResultDTO:
+    """
+    Parse an atom extraction response, raising the reason if the response was aborted while streaming.
+    """
+    if response.validation_error:
+        raise ValueError(response.validation_error)
+    return AtomExtractionResultDTO.from_xml(response.message)
 
 
 class AtomService:
     MAX_RETRIES = 5
 
     def __init__(self, regulation_fragment_service: RegulationFragmentService, atom_repository: AtomRepository,
-                 chat_agent: LLMAdapter, prolog_reasoner: PrologReasoner, prompt_service: PromptService):
+                 chat_agent: LLMAdapter, prolog_reasoner: IPrologReasoner, prompt_service: PromptService,
+                 unit_of_work: UnitOfWork):
         self._atom_repository = atom_repository
+        self._unit_of_work = unit_of_work
         self._regulation_fragment_service = regulation_fragment_service
         self._chat_agent = chat_agent
         self._prolog_reasoner = prolog_reasoner
@@ -103,10 +117,15 @@ class AtomService:
         Returns the updated atom as an AtomDTO.
 
         Validates that the predicate is a valid Prolog predicate by replacing variables with wildcards
-        and checking if it can be executed without errors.
+        and checking if it can be executed without errors. Predicates which do not even parse are rejected
+        without asking the Prolog engine.
         """
         if update_atom_dto.predicate is not None:
-            wildcard_predicate, _ = create_wildcard_predicates(update_atom_dto.predicate)
+            try:
+                wildcard_predicate, _ = create_wildcard_predicates(update_atom_dto.predicate)
+            except PrologSyntaxError as e:
+                raise ValueError(f"Invalid Prolog predicate: {str(e)}")
+
             status, answers = self._prolog_reasoner.execute_prolog(f"{wildcard_predicate}.", wildcard_predicate)
 
             # Check if the response is an error
@@ -165,7 +184,9 @@ class AtomService:
             ChatAgentMessageIngressDTO(
                 user_prompt=regeneration_request,
                 regulation_fragment_id=regulation_fragment_id,
-            )
+                stage=LLMUsageStage.ATOMS,
+            ),
+            validator=AtomExtractionResultDTO.streaming_validator()
         )
 
         # Retry logic similar to atom generation
@@ -176,7 +197,7 @@ class AtomService:
 
         while max_retries > 0:
             try:
-                regenerated_result = AtomExtractionResultDTO.from_xml(response.message)
+                regenerated_result = _parse_atom_extraction(response)
                 parsed_result = regenerated_result
                 break
             except Exception as e:
@@ -189,8 +210,10 @@ class AtomService:
                     ChatAgentMessageIngressDTO(
                         user_prompt=current_prompt,
                         regulation_fragment_id=regulation_fragment_id,
+                        stage=LLMUsageStage.ATOMS,
                     ),
-                    context_messages=previous_messages
+                    context_messages=previous_messages,
+                    validator=AtomExtractionResultDTO.streaming_validator()
                 )
                 if response.is_error:
                     # Agent error; proceed to next retry
@@ -198,9 +221,12 @@ class AtomService:
 
         if parsed_result is None:
             raise ValueError("Failed to parse atom regeneration response after retries.")
+        self._chat_agent.accept(response)
 
-        self.delete_atoms_for_regulation_fragment(regulation_fragment_id)
-        self._save_extracted_atoms(parsed_result, regulation_fragment_id)
+        # Swap the atoms in one transaction, so readers never see the fragment without atoms
+        with self._unit_of_work.transaction():
+            self.delete_atoms_for_regulation_fragment(regulation_fragment_id)
+            self._save_extracted_atoms(parsed_result, regulation_fragment_id)
 
     def generate_atoms_for_regulation_fragment(self, regulation_fragment_id: int):
         """
@@ -226,8 +252,10 @@ class AtomService:
             ChatAgentMessageIngressDTO(
                 user_prompt=input_message,
                 system_prompt='',
-                regulation_fragment_id=regulation_fragment_id
-            )
+                regulation_fragment_id=regulation_fragment_id,
+                stage=LLMUsageStage.ATOMS,
+            ),
+            validator=AtomExtractionResultDTO.streaming_validator()
         )
 
         if returned_message.is_error:
@@ -242,7 +270,7 @@ class AtomService:
 
         while max_retries > 0:
             try:
-                parsed_result = AtomExtractionResultDTO.from_xml(returned_message.message)
+                parsed_result = _parse_atom_extraction(returned_message)
                 break
             except Exception as e:
                 max_retries -= 1
@@ -254,8 +282,10 @@ class AtomService:
                     ChatAgentMessageIngressDTO(
                         user_prompt=current_prompt,
                         regulation_fragment_id=regulation_fragment_id,
+                        stage=LLMUsageStage.ATOMS,
                     ),
-                    context_messages=previous_messages
+                    context_messages=previous_messages,
+                    validator=AtomExtractionResultDTO.streaming_validator()
                 )
 
                 if returned_message.is_error:
@@ -264,29 +294,21 @@ class AtomService:
         if parsed_result is None:
             # If we exhausted retries without success, raise the last message
             raise ValueError("Failed to parse atom extraction response after retries.")
+        self._chat_agent.accept(returned_message)
 
         self._save_extracted_atoms(parsed_result, regulation_fragment_id)
 
     def _save_extracted_atoms(self, parsed_result: AtomExtractionResultDTO, regulation_fragment_id: int):
-        local_id_to_global_id = dict()
-
-        for atom in parsed_result.atoms:
-            persisted_atom = self._atom_repository.save(
-                CreateAtomDTO(
+        # The IDs in the response are only local to it, the repository maps them to the persisted atoms
+        self._atom_repository.save_many(
+            [
+                (atom.id, CreateAtomDTO(
                     regulation_fragment_id=regulation_fragment_id,
                     predicate=atom.predicate,
                     description=atom.description,
                     is_negated=False,
                     is_fact=atom.is_fact
-                )
-            )
-            local_id_to_global_id[atom.id] = persisted_atom.id
-
-        for atom_span in find_atom_spans(parsed_result.annotated):
-            self._atom_repository.save_span(
-                CreateAtomSpanDTO(
-                    atom_id=local_id_to_global_id[atom_span.atom_id],
-                    start=atom_span.start,
-                    end=atom_span.end
-                )
-            )
+                )) for atom in parsed_result.atoms
+            ],
+            list(find_atom_spans(parsed_result.annotated)),
+        )
@@ -23,6 +23,8 @@ from pydantic_xml import BaseXmlModel, wrapped, computed_element
 from pydantic_xml import element, attr
 from pydantic_xml.element.native import ElementT as Element
 
+from modules.models.application.streaming_xml_validator import StreamingXmlValidator
+
 
 class ExtractedAtomDTO(BaseXmlModel, tag='atom'):
     id: int = attr(name="id")
@@ -46,3 +48,10 @@ class AtomExtractionResultDTO(BaseXmlModel, tag='result', arbitrary_types_allowe
             etree.tostring(child, encoding='unicode')
             for child in self.annotated_raw
         )).strip()
+
+    @classmethod
+    def streaming_validator(cls) -> StreamingXmlValidator:
+        """
+        Validator for streamed responses. Unknown elements are ignored when parsing, so only the root is checked.
+        """
+        return StreamingXmlValidator(root='result')
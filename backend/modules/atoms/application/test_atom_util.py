@@ -17,7 +17,8 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
 import unittest
-from modules.atoms.application.atom_util import determine_predicate_arity
+from modules.atoms.application.atom_util import determine_predicate_arity, create_wildcard_predicates
+from modules.common.prolog_syntax import PrologSyntaxError
 
 
 class TestAtomUtil(unittest.TestCase):
@@ -37,6 +38,22 @@ class TestAtomUtil(unittest.TestCase):
         self.assertEqual(determine_predicate_arity("complex_predicate(X, Y, Z)"), 3)
         self.assertEqual(determine_predicate_arity("nested(X, nested2(Y, Z))"), 2)
         self.assertEqual(determine_predicate_arity("empty()"), 0)
+        self.assertEqual(determine_predicate_arity("list([a, b], X)"), 2)
+
+    def test_count_variables_in_invalid_predicate(self):
+        """Test that malformed predicates are rejected."""
+        with self.assertRaises(PrologSyntaxError):
+            determine_predicate_arity("test(X, Y")
+
+    def test_create_wildcard_predicates(self):
+        """Test replacing the arguments of predicates with wildcards."""
+        self.assertEqual(create_wildcard_predicates("test(X, nested(Y, a), [1, 2])"),
+                         ("test(_X1, nested(_X2, _X3), _X4)", 5))
+        self.assertEqual(create_wildcard_predicates("test(X)", 3, lambda i: f"X{i}"), ("test(X3)", 4))
+        self.assertEqual(create_wildcard_predicates("test"), ("test", 1))
+
+        with self.assertRaises(PrologSyntaxError):
+            create_wildcard_predicates("Test(X)")
 
 
 if __name__ == "__main__":
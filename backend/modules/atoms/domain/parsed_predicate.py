@@ -0,0 +1,112 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
+
+from modules.common.prolog_syntax import parse_predicate, Compound
+
+
+class ParsedPredicate:
+    """
+    Immutable, parse-once representation of an atom's predicate.
+
+    name: Name of the predicate (without quotes)
+    text: Name of the predicate as written, e.g., quoted
+    arity: Number of arguments
+    args: One entry per argument: the parsed nested predicate for arguments in functional notation,
+        None for everything else (variables, constants, lists, operator terms, ...)
+    """
+    __slots__ = ("name", "text", "arity", "args", "_template", "_wildcard_count")
+
+    def __init__(self, name: str, text: str, args: Tuple[Optional["ParsedPredicate"], ...], template: str,
+                 wildcard_count: int):
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "text", text)
+        object.__setattr__(self, "arity", len(args))
+        object.__setattr__(self, "args", args)
+        # The predicate with a placeholder per wildcard, so masking is a single format call.
+        object.__setattr__(self, "_template", template)
+        object.__setattr__(self, "_wildcard_count", wildcard_count)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"ParsedPredicate({self.text}/{self.arity})"
+
+    @property
+    def indicator(self) -> str:
+        """
+        The predicate indicator, e.g., employee/1.
+        """
+        return f"{self.text}/{self.arity}"
+
+    def with_wildcards(self, index: int = 1,
+                       wildcard_factory: Callable[[int], str] = lambda i: f"_X{i}") -> Tuple[str, int]:
+        """
+        The predicate with its arguments replaced by wildcards, descending into nested predicates.
+
+        Args:
+            index: The index of the first wildcard variable
+            wildcard_factory: Creates the wildcard for an index
+
+        Returns:
+            The predicate with wildcards and the index for the next wildcard variable
+        """
+        end = index + self._wildcard_count
+        return self._template.format(*(wildcard_factory(i) for i in range(index, end))), end
+
+
+@lru_cache(maxsize=4096)
+def parse_atom_predicate(predicate: str) -> ParsedPredicate:
+    """
+    Parse the predicate of an atom. Results are memoized, as the same predicates are parsed for every knowledge base.
+
+    Args:
+        predicate: The predicate string (e.g., "test", "test(X)", "test(X, nested(Y))")
+
+    Returns:
+        The parsed predicate
+
+    Raises:
+        PrologSyntaxError: If the predicate is not valid Prolog
+    """
+    term = parse_predicate(predicate)
+
+    if isinstance(term, Compound) and term.canonical:
+        return _from_compound(term)
+
+    # Atoms and operator terms are kept as they are written.
+    args = (None,) * len(term.args) if isinstance(term, Compound) else ()
+    return ParsedPredicate(term.name, term.text, args, _escape(predicate.strip()), 0)
+
+
+def _from_compound(compound: Compound) -> ParsedPredicate:
+    args = tuple(
+        _from_compound(arg) if isinstance(arg, Compound) and arg.canonical else None
+        for arg in compound.args
+    )
+    template = ", ".join("{}" if parsed is None else parsed._template for parsed in args)
+    wildcard_count = sum(1 if parsed is None else parsed._wildcard_count for parsed in args)
+    return ParsedPredicate(compound.name, compound.text, args, f"{_escape(compound.text)}({template})",
+                           wildcard_count)
+
+
+def _escape(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
@@ -0,0 +1,59 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+from modules.atoms.domain.parsed_predicate import parse_atom_predicate
+
+
+class TestParsedPredicate(unittest.TestCase):
+    """
+    Test cases for the parsed predicate representation in parsed_predicate.py.
+    """
+
+    def test_structure(self):
+        """Test name, arity and argument tree of a parsed predicate."""
+        predicate = parse_atom_predicate("'has role'(X, role(Y, admin), [a])")
+
+        self.assertEqual(predicate.name, "has role")
+        self.assertEqual(predicate.indicator, "'has role'/3")
+        self.assertIsNone(predicate.args[0])
+        self.assertEqual(predicate.args[1].indicator, "role/2")
+        self.assertIsNone(predicate.args[2])
+        self.assertEqual(parse_atom_predicate("allowed").indicator, "allowed/0")
+
+    def test_with_wildcards(self):
+        """Test masking the arguments, continuing the index across calls."""
+        predicate = parse_atom_predicate("test(X, nested(Y, a))")
+
+        self.assertEqual(predicate.with_wildcards(), ("test(_X1, nested(_X2, _X3))", 4))
+        self.assertEqual(predicate.with_wildcards(4, lambda _: "_"), ("test(_, nested(_, _))", 7))
+
+    def test_memoized_and_immutable(self):
+        """The same predicate string is parsed only once, and the result cannot be changed."""
+        predicate = parse_atom_predicate("test(X)")
+
+        self.assertIs(parse_atom_predicate("test(X)"), predicate)
+        with self.assertRaises(AttributeError):
+            predicate.arity = 2
+        with self.assertRaises(AttributeError):
+            predicate.extra = 1
+
+
+if __name__ == "__main__":
+    unittest.main()
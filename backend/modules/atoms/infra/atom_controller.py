@@ -21,6 +21,7 @@ from modules.atoms.application.dto.regenerate_atoms_dto import RegenerateAtomsDT
 from modules.atoms.application.dto.update_atom_dto import UpdateAtomDTO
 from modules.atoms.application.dto.create_atom_dto import CreateAtomDTO
 from di_container import container
+from modules.jobs.domain.job_type import JobType
 
 atom_controller = Blueprint('atom', __name__)
 
@@ -38,11 +39,14 @@ def get_atoms_for_fragment(fragment_id: str):
 @atom_controller.post('/regulation-fragments/<fragment_id>/atoms/generate')
 def generate_atoms_for_fragment(fragment_id: str):
     """
-    Generate atoms for a specific regulation fragment.
+    Queue the generation of atoms for a specific regulation fragment.
     """
-    atom_service = container.atom_service()
-    atom_service.generate_atoms_for_regulation_fragment(fragment_id)
-    return '', 204
+    job_service = container.job_service()
+    try:
+        job = job_service.enqueue(JobType.GENERATE_ATOMS, int(fragment_id))
+    except ValueError as e:
+        return {'error': str(e)}, 404
+    return job.model_dump(mode='json'), 202
 
 
 @atom_controller.delete('/regulation-fragments/<fragment_id>/atoms')
@@ -51,21 +55,25 @@ def delete_atoms_for_fragment(fragment_id: str):
     Delete all atoms for a specific regulation fragment.
     """
     atom_service = container.atom_service()
-    count = atom_service.delete_atoms_for_regulation_fragment(fragment_id)
     rule_service = container.rule_service()
-    rule_service.delete_rules_for_regulation_fragment(fragment_id)
+    with container.unit_of_work().transaction():
+        count = atom_service.delete_atoms_for_regulation_fragment(fragment_id)
+        rule_service.delete_rules_for_regulation_fragment(fragment_id)
     return {'deleted': count}, 200
 
 
 @atom_controller.post('/regulation-fragments/<fragment_id>/atoms/regenerate')
 def regenerate_atoms_for_fragment(fragment_id: str):
     """
-    Regenerate atoms for a specific regulation fragment based on feedback.
+    Queue the regeneration of atoms for a specific regulation fragment based on feedback.
     """
     regenerate_data = RegenerateAtomsDTO(**request.get_json())
-    atom_service = container.atom_service()
-    atom_service.regenerate_atoms_for_regulation_fragment(fragment_id, regenerate_data)
-    return '', 204
+    job_service = container.job_service()
+    try:
+        job = job_service.enqueue(JobType.REGENERATE_ATOMS, int(fragment_id), regenerate_data)
+    except ValueError as e:
+        return {'error': str(e)}, 404
+    return job.model_dump(mode='json'), 202
 
 
 @atom_controller.delete('/atoms/<atom_id>')
@@ -16,15 +16,26 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
+from typing import List, Tuple, Dict
+
+from sqlalchemy import insert, delete, select
+
 from db_models import AtomSpan, Atom
 from modules.atoms.application.dto.create_atom_dto import CreateAtomDTO
 from modules.atoms.application.dto.create_atom_span_dto import CreateAtomSpanDTO
 from modules.atoms.application.dto.update_atom_dto import UpdateAtomDTO
+from modules.common.unit_of_work import UnitOfWork
+from modules.reasoning.infra.knowledge_base_cache import KnowledgeBaseCache
 
 
 class AtomRepository:
-    def __init__(self, db):
+    def __init__(self, db, knowledge_base_cache: KnowledgeBaseCache, unit_of_work: UnitOfWork):
         self.db = db
+        self.knowledge_base_cache = knowledge_base_cache
+        self.unit_of_work = unit_of_work
+
+    def _invalidate(self, regulation_fragment_id: int) -> None:
+        self.unit_of_work.after_commit(lambda: self.knowledge_base_cache.invalidate(regulation_fragment_id))
 
     def save(self, atom: CreateAtomDTO) -> Atom:
         atom = Atom(
@@ -35,8 +46,9 @@ class AtomRepository:
             is_fact=atom.is_fact,
         )
 
-        self.db.session.add(atom)
-        self.db.session.commit()
+        with self.unit_of_work.transaction():
+            self.db.session.add(atom)
+        self._invalidate(atom.regulation_fragment_id)
         return atom
 
     def save_span(self, atom_span: CreateAtomSpanDTO) -> AtomSpan:
@@ -45,10 +57,60 @@ class AtomRepository:
             start=atom_span.start,
             end=atom_span.end,
         )
-        self.db.session.add(atom_span)
-        self.db.session.commit()
+        with self.unit_of_work.transaction():
+            self.db.session.add(atom_span)
         return atom_span
 
+    def save_many(self, atoms: List[Tuple[int, CreateAtomDTO]], atom_spans: List[CreateAtomSpanDTO]) -> Dict[int, int]:
+        """
+        Insert atoms and their spans in a single transaction. If anything fails, nothing of the transaction is
+        persisted.
+
+        :param atoms: The atoms to insert, each with a local ID (e.g., the one used in an LLM response).
+        :param atom_spans: The spans to insert, referencing their atom by its local ID.
+        :return: Mapping from local IDs to the IDs of the persisted atoms.
+        """
+        local_ids = [local_id for local_id, _ in atoms]
+
+        unknown_ids = {span.atom_id for span in atom_spans} - set(local_ids)
+        if unknown_ids:
+            raise ValueError(f"Atom spans reference unknown atoms: {sorted(unknown_ids)}")
+
+        if not atoms:
+            return {}
+
+        with self.unit_of_work.transaction():
+            persisted_ids = self.db.session.scalars(
+                insert(Atom).returning(Atom.id, sort_by_parameter_order=True),
+                [
+                    dict(
+                        regulation_fragment_id=atom.regulation_fragment_id,
+                        description=atom.description,
+                        predicate=atom.predicate,
+                        is_negated=atom.is_negated,
+                        is_fact=atom.is_fact,
+                    ) for _, atom in atoms
+                ]
+            ).all()
+            local_id_to_global_id = dict(zip(local_ids, persisted_ids))
+
+            if atom_spans:
+                self.db.session.execute(
+                    insert(AtomSpan),
+                    [
+                        dict(
+                            atom_id=local_id_to_global_id[span.atom_id],
+                            start=span.start,
+                            end=span.end,
+                        ) for span in atom_spans
+                    ]
+                )
+
+        for regulation_fragment_id in {atom.regulation_fragment_id for _, atom in atoms}:
+            self._invalidate(regulation_fragment_id)
+
+        return local_id_to_global_id
+
     def update(self, atom_id: int, atom: UpdateAtomDTO) -> Atom:
         existing_atom = Atom.query.filter(Atom.id == atom_id).one()
         if not existing_atom:
@@ -63,8 +125,9 @@ class AtomRepository:
         if atom.is_fact is not None:
             existing_atom.is_fact = atom.is_fact
 
-        self.db.session.add(existing_atom)
-        self.db.session.commit()
+        with self.unit_of_work.transaction():
+            self.db.session.add(existing_atom)
+        self._invalidate(existing_atom.regulation_fragment_id)
         return existing_atom
 
     def find_by_regulation_fragment_id(self, regulation_fragment_id: int) -> list[Atom]:
@@ -75,18 +138,15 @@ class AtomRepository:
         Delete all atoms and their spans for a specific regulation fragment.
         Returns the number of atoms deleted.
         """
-        atoms = self.find_by_regulation_fragment_id(regulation_fragment_id)
-        count = 0
-
-        for atom in atoms:
-            # Delete all spans for this atom
-            self.db.session.query(AtomSpan).filter(AtomSpan.atom_id == atom.id).delete()
-            count += 1
+        atom_ids = select(Atom.id).where(Atom.regulation_fragment_id == regulation_fragment_id)
 
-        # Delete all atoms for this fragment
-        self.db.session.query(Atom).filter(Atom.regulation_fragment_id == regulation_fragment_id).delete()
+        with self.unit_of_work.transaction():
+            self.db.session.execute(delete(AtomSpan).where(AtomSpan.atom_id.in_(atom_ids)))
+            count = self.db.session.execute(
+                delete(Atom).where(Atom.regulation_fragment_id == regulation_fragment_id)
+            ).rowcount
 
-        self.db.session.commit()
+        self._invalidate(regulation_fragment_id)
         return count
 
     def delete_by_id(self, atom_id: int) -> bool:
@@ -97,6 +157,8 @@ class AtomRepository:
         atom = Atom.query.filter_by(id=atom_id).one()
         if atom is None:
             return False
-        self.db.session.delete(atom)
-        self.db.session.commit()
+        regulation_fragment_id = atom.regulation_fragment_id
+        with self.unit_of_work.transaction():
+            self.db.session.delete(atom)
+        self._invalidate(regulation_fragment_id)
         return True
@@ -16,9 +16,8 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
-from typing import List
+from typing import List, Generator, Tuple
 
-from modules.atoms.application.atom_service import AtomService
 from modules.chat.application.dto.chat_message_dto import ChatMessageDTO
 from modules.chat.application.dto.context_message_dto import ContextMessageDTO
 from modules.chat.application.dto.create_chat_message_dto import CreateChatMessageDTO
@@ -27,25 +26,24 @@ from modules.chat.domain.context_message_type import ContextMessageType
 from modules.chat.infra.repositories.chat_repository import ChatRepository
 from modules.models.application.dto.chat_agent_message_ingress_dto import ChatAgentMessageIngressDTO
 from modules.models.application.llm_adapter import LLMAdapter
+from modules.models.domain.llm_usage_stage import LLMUsageStage
 from modules.models.domain.prompt_service import PromptService
-from modules.regulation_fragment.application.regulation_fragment_service import RegulationFragmentService
-from modules.rules.application.rule_service import RuleService
+from modules.reasoning.application.knowledge_base_service import KnowledgeBaseService
+from modules.regulation_fragment.application.fragment_aggregate_service import FragmentAggregateService
 
 
 class ChatService:
     def __init__(self,
-                 atom_service: AtomService,
-                 regulation_fragment_service: RegulationFragmentService,
+                 knowledge_base_service: KnowledgeBaseService,
+                 fragment_aggregate_service: FragmentAggregateService,
                  chat_repository: ChatRepository,
                  chat_agent: LLMAdapter,
-                 rule_service: RuleService,
                  prompt_service: PromptService,
                  ):
         self.chat_repository = chat_repository
         self.chat_agent = chat_agent
-        self.atom_service = atom_service
-        self.regulation_fragment_service = regulation_fragment_service
-        self.rules_service = rule_service
+        self.knowledge_base_service = knowledge_base_service
+        self.fragment_aggregate_service = fragment_aggregate_service
         self.prompt_service = prompt_service
 
     def get_by_regulation_id(self, regulation_id: int) -> List[ChatMessageDTO]:
@@ -69,55 +67,97 @@ class ChatService:
         """
         print("Sending message for regulation ID:", regulation_id)
 
-        history = self.get_by_regulation_id(regulation_id)
+        user_message, context_messages = self._save_user_message(regulation_id, dto)
+
+        response = self.chat_agent.send_message(
+            message=user_message,
+            context_messages=context_messages,
+        )
+        if not response.is_error:
+            self.chat_agent.accept(response)
+
+        return self._save_ai_message(regulation_id, response.message)
+
+    def stream_chat_message(self, regulation_id: int, dto: CreateChatMessageDTO) -> Generator[str, None, ChatMessageDTO]:
+        """
+        Send a message to the chat agent and stream the response as it is written. The user message is saved right
+        away, the response once it is complete.
+
+        :return: Generator yielding the chunks of the response and returning the saved response.
+        """
+        print("Streaming message for regulation ID:", regulation_id)
+
+        # Not part of the generator, so that e.g. an unknown regulation fails before anything is streamed
+        user_message, context_messages = self._save_user_message(regulation_id, dto)
+
+        def stream():
+            response = yield from self.chat_agent.stream_message(
+                message=user_message,
+                context_messages=context_messages,
+            )
+            if response.is_error:
+                raise ValueError(f"Error generating chat response: {response.message}")
 
-        atoms = self.atom_service.get_atoms_for_regulation_fragment(regulation_fragment_id=regulation_id)
-        rules = self.rules_service.get_rules_for_regulation_fragment(regulation_fragment_id=regulation_id)
+            return self._save_ai_message(regulation_id, response.message)
 
-        regulation = self.regulation_fragment_service.find_by_id(regulation_id)
+        return stream()
+
+    def _save_user_message(self, regulation_id: int, dto: CreateChatMessageDTO
+                           ) -> Tuple[ChatAgentMessageIngressDTO, List[ContextMessageDTO]]:
+        """
+        Save the message of the user and build the request to the chat agent, including the previous messages.
+        """
+        # Loads the fragment with its atoms and rules, which the knowledge base below reuses on a cache miss
+        aggregate = self.fragment_aggregate_service.get(regulation_id)
+        if not aggregate:
+            raise ValueError(f"Regulation fragment with ID {regulation_id} not found.")
+        regulation = aggregate.fragment
+
+        history = self.get_by_regulation_id(regulation_id)
+
+        knowledge_base = self.knowledge_base_service.get_knowledge_base(regulation_id).knowledge_base
 
         system_prompt = self.prompt_service.get(
             regulation.formalism,
         ).chat_system_prompt(
             regulation.content,
-            atoms,
-            rules,
+            knowledge_base,
         )
 
+        # The history is newest first
         context_messages = [
             ContextMessageDTO(
                 content=h.content,
                 type=_context_message_type_from_agent(h.agent)
-            ) for h in history
-        ].reverse()
+            ) for h in reversed(history)
+        ]
 
         user_message = ChatAgentMessageIngressDTO(
             regulation_fragment_id=regulation_id,
             user_prompt=dto.content,
             system_prompt=system_prompt,
+            stage=LLMUsageStage.CHAT,
         )
 
-        saved_user_message = self.chat_repository.save(
+        self.chat_repository.save(
             agent=Agent.USER,
             regulation_fragment_id=regulation_id,
             chat_data=CreateChatMessageDTO(content=dto.content)
         )
 
-        response = self.chat_agent.send_message(
-            message=user_message,
-            context_messages=context_messages,
-        )
+        return user_message, context_messages
 
-        self.chat_repository.save(
+    def _save_ai_message(self, regulation_id: int, content: str) -> ChatMessageDTO:
+        saved_ai_message = self.chat_repository.save(
             agent=Agent.AI,
             regulation_fragment_id=regulation_id,
-            chat_data=CreateChatMessageDTO(content=response.message)
+            chat_data=CreateChatMessageDTO(content=content)
         )
 
         return ChatMessageDTO(
-            id=saved_user_message.id,
-            content=saved_user_message.content,
-            created_at=saved_user_message.created_at,
+            id=saved_ai_message.id,
+            content=saved_ai_message.content,
+            created_at=saved_ai_message.created_at,
             agent=Agent.AI
         )
 
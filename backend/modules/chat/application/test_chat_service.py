@@ -0,0 +1,106 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from modules.chat.application.chat_service import ChatService
+from modules.chat.application.dto.create_chat_message_dto import CreateChatMessageDTO
+from modules.chat.domain.agent import Agent
+from modules.chat.domain.context_message_type import ContextMessageType
+from modules.models.application.dto.chat_agent_message_egress_dto import ChatAgentMessageEgressDTO
+
+
+def _saved(agent: Agent, content: str, message_id: int):
+    return SimpleNamespace(id=message_id, agent=agent, content=content, created_at=datetime.now(timezone.utc))
+
+
+class TestChatService(unittest.TestCase):
+
+    def setUp(self):
+        self.chat_repository = MagicMock()
+        self.chat_repository.find_by_regulation_fragment_id.return_value = [
+            _saved(Agent.AI, "second", 2),
+            _saved(Agent.USER, "first", 1),
+        ]
+        self.chat_repository.save.side_effect = lambda agent, regulation_fragment_id, chat_data: _saved(
+            agent, chat_data.content, 3 if agent == Agent.USER else 4)
+        self.chat_agent = MagicMock()
+        prompt_service = MagicMock()
+        prompt_service.get.return_value.chat_system_prompt.return_value = "system"
+        self.chat_service = ChatService(
+            knowledge_base_service=MagicMock(),
+            fragment_aggregate_service=MagicMock(),
+            chat_repository=self.chat_repository,
+            chat_agent=self.chat_agent,
+            prompt_service=prompt_service,
+        )
+
+    def _stream(self, *chunks: str, is_error: bool = False):
+        def stream_message(message, context_messages):
+            yield from chunks
+            return ChatAgentMessageEgressDTO(message="".join(chunks), is_error=is_error)
+
+        self.chat_agent.stream_message.side_effect = stream_message
+
+    def test_send_returns_reply(self):
+        self.chat_agent.send_message.return_value = ChatAgentMessageEgressDTO(message="reply")
+
+        reply = self.chat_service.send_chat_message(1, CreateChatMessageDTO(content="question"))
+
+        self.assertEqual((reply.id, reply.content, reply.agent), (4, "reply", Agent.AI))
+        context_messages = self.chat_agent.send_message.call_args.kwargs["context_messages"]
+        self.assertEqual([(m.type, m.content) for m in context_messages],
+                         [(ContextMessageType.USER, "first"), (ContextMessageType.AGENT, "second")])
+
+    def test_stream_saves_reply_once_complete(self):
+        self._stream("Hel", "lo")
+
+        stream = self.chat_service.stream_chat_message(1, CreateChatMessageDTO(content="question"))
+        self.assertEqual(self.chat_repository.save.call_count, 1)
+
+        chunks = []
+        try:
+            while True:
+                chunks.append(next(stream))
+        except StopIteration as done:
+            reply = done.value
+
+        self.assertEqual(chunks, ["Hel", "lo"])
+        self.assertEqual((reply.id, reply.content), (4, "Hello"))
+        self.assertEqual(self.chat_repository.save.call_count, 2)
+
+    def test_stream_error_is_not_saved(self):
+        self._stream(is_error=True)
+
+        with self.assertRaises(ValueError):
+            list(self.chat_service.stream_chat_message(1, CreateChatMessageDTO(content="question")))
+        self.assertEqual(self.chat_repository.save.call_count, 1)
+
+    def test_unknown_regulation(self):
+        self.chat_service.fragment_aggregate_service.get.return_value = None
+
+        with self.assertRaises(ValueError):
+            self.chat_service.stream_chat_message(1, CreateChatMessageDTO(content="question"))
+        self.chat_repository.save.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,13 +16,19 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
-from flask import Blueprint, request
+import json
+
+from flask import Blueprint, request, Response, stream_with_context
 from di_container import container
 from modules.chat.application.dto.create_chat_message_dto import CreateChatMessageDTO
 
 chat_controller = Blueprint('chat', __name__)
 
 
+def _event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
 @chat_controller.get('/regulations/<regulation_id>/chat')
 def get_by_regulation_id(regulation_id: str):
     return [m.model_dump() for m in container.chat_service().get_by_regulation_id(regulation_id)]
@@ -31,4 +37,36 @@ def get_by_regulation_id(regulation_id: str):
 @chat_controller.post('/regulations/<regulation_id>/chat')
 def create(regulation_id: str):
     chat_data = CreateChatMessageDTO(**request.get_json())
-    return container.chat_service().send_chat_message(regulation_id, chat_data).model_dump(), 201
+    try:
+        return container.chat_service().send_chat_message(int(regulation_id), chat_data).model_dump(), 201
+    except ValueError as e:
+        return {'error': str(e)}, 404
+
+
+@chat_controller.post('/regulations/<regulation_id>/chat/stream')
+def create_streamed(regulation_id: str):
+    """
+    Send a chat message and stream the reply as server-sent events: a "token" event per chunk of the reply, then a
+    "message" event with the saved reply, or an "error" event.
+    """
+    chat_data = CreateChatMessageDTO(**request.get_json())
+    try:
+        stream = container.chat_service().stream_chat_message(int(regulation_id), chat_data)
+    except ValueError as e:
+        return {'error': str(e)}, 404
+
+    @stream_with_context
+    def events():
+        try:
+            while True:
+                yield _event('token', {'content': next(stream)})
+        except StopIteration as done:
+            yield _event('message', done.value.model_dump(mode='json'))
+        except ValueError as e:
+            yield _event('error', {'error': str(e)})
+        finally:
+            # If the client went away, abort the request to the model while the app context is still there
+            stream.close()
+
+    return Response(events(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
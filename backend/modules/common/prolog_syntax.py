@@ -0,0 +1,592 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from dataclasses import dataclass
+from typing import List, Tuple, Optional
+
+# Default operator table of SWI-Prolog (the relevant part of it): name -> (priority, type)
+# The pre-validation must never reject what the engine accepts, so "not" is included like "\+" as our prompts use it.
+PREFIX_OPERATORS = {
+    ":-": (1200, "fx"), "?-": (1200, "fx"),
+    "dynamic": (1150, "fx"), "discontiguous": (1150, "fx"), "initialization": (1150, "fx"),
+    "meta_predicate": (1150, "fx"), "module_transparent": (1150, "fx"), "multifile": (1150, "fx"),
+    "public": (1150, "fx"), "thread_local": (1150, "fx"), "table": (1150, "fx"),
+    "\\+": (900, "fy"), "not": (900, "fy"), "?": (500, "fx"),
+    "-": (200, "fy"), "+": (200, "fy"), "\\": (200, "fy"),
+    "$": (1, "fx"),
+}
+
+INFIX_OPERATORS = {
+    ":-": (1200, "xfx"), "-->": (1200, "xfx"),
+    ";": (1100, "xfy"), "|": (1100, "xfy"),
+    "->": (1050, "xfy"), "*->": (1050, "xfy"),
+    ",": (1000, "xfy"),
+    ":=": (990, "xfx"),
+    "=": (700, "xfx"), "\\=": (700, "xfx"), "==": (700, "xfx"), "\\==": (700, "xfx"),
+    "@<": (700, "xfx"), "@>": (700, "xfx"), "@=<": (700, "xfx"), "@>=": (700, "xfx"),
+    "=..": (700, "xfx"), "is": (700, "xfx"), "=:=": (700, "xfx"), "=\\=": (700, "xfx"),
+    "<": (700, "xfx"), ">": (700, "xfx"), "=<": (700, "xfx"), ">=": (700, "xfx"),
+    ">:<": (700, "xfx"), ":<": (700, "xfx"), "as": (700, "xfx"),
+    ":": (200, "xfy"),
+    "+": (500, "yfx"), "-": (500, "yfx"), "/\\": (500, "yfx"), "\\/": (500, "yfx"), "xor": (500, "yfx"),
+    "*": (400, "yfx"), "/": (400, "yfx"), "//": (400, "yfx"), "mod": (400, "yfx"), "rem": (400, "yfx"),
+    "<<": (400, "yfx"), ">>": (400, "yfx"), "div": (400, "yfx"), "rdiv": (400, "yfx"), "divmod": (400, "yfx"),
+    "**": (200, "xfx"), "^": (200, "xfy"),
+}
+
+SYMBOL_CHARS = set("+-*/\\^<>=~:.?@#&$")
+SOLO_CHARS = set("!;")
+PUNCTUATION_CHARS = set("()[]{},|")
+DIGITS = "0123456789"
+
+# Arguments are read up to priority 1200 like SWI-Prolog does, e.g., f(a :- b), ending at these punctuation tokens
+_ARGUMENT_END = frozenset(",")
+_LIST_ITEM_END = frozenset(",|")
+
+_ESCAPES = {
+    "n": "\n", "t": "\t", "r": "\r", "a": "\a", "b": "\b", "f": "\f", "v": "\v", "0": "\0",
+    "\\": "\\", "'": "'", '"': '"', "`": "`", "e": "\x1b", "s": " ",
+}
+
+
+class PrologSyntaxError(ValueError):
+    """
+    Raised if a text is not valid Prolog syntax. The position points to the offending token.
+    """
+
+    def __init__(self, message: str, text: str, position: int):
+        self.message = message
+        self.position = position
+        self.line = text.count("\n", 0, position) + 1
+        self.column = position - (text.rfind("\n", 0, position) + 1) + 1
+        super().__init__(f"Syntax error: {message} (line {self.line}, column {self.column})")
+
+
+@dataclass(frozen=True, slots=True)
+class Token:
+    """
+    A token of Prolog text.
+
+    kind: One of "name", "variable", "number", "string", "punctuation", "end" (the terminating period) and "eof"
+    text: The token as written in the source
+    value: The name of an atom without quotes, otherwise the same as text
+    start: Offset of the token in the source
+    layout_before: Whether the token is preceded by whitespace or a comment
+    """
+    kind: str
+    text: str
+    value: str
+    start: int
+    layout_before: bool
+
+
+@dataclass(frozen=True, slots=True)
+class Variable:
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class Atom:
+    name: str
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class Number:
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class String:
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class Compound:
+    """
+    A compound term. Canonical compounds are written as name(arg, ...), the others are operator terms,
+    lists (named '[|]') or curly terms (named '{}').
+    """
+    name: str
+    text: str
+    args: Tuple["Term", ...]
+    canonical: bool
+
+
+Term = Variable | Atom | Number | String | Compound
+
+
+def tokenize(text: str) -> List[Token]:
+    """
+    Split Prolog text into tokens. The last token is always of kind "eof".
+
+    Args:
+        text: The Prolog text
+
+    Returns:
+        The tokens of the text
+
+    Raises:
+        PrologSyntaxError: If the text contains an illegal character, an unterminated quoted item or comment
+    """
+    tokens = []
+    position = 0
+    length = len(text)
+
+    while True:
+        start = _skip_layout(text, position)
+        layout_before = start > position or start == 0
+
+        if start >= length:
+            tokens.append(Token("eof", "", "", length, layout_before))
+            return tokens
+
+        char = text[start]
+
+        if char in DIGITS:
+            end = _scan_number(text, start)
+            tokens.append(Token("number", text[start:end], text[start:end], start, layout_before))
+
+        elif char == "_" or char.isupper():
+            end = _scan_alphanumeric(text, start)
+            tokens.append(Token("variable", text[start:end], text[start:end], start, layout_before))
+
+        elif char.isalpha():
+            end = _scan_alphanumeric(text, start)
+            tokens.append(Token("name", text[start:end], text[start:end], start, layout_before))
+
+        elif char in "'\"`":
+            end, value = _scan_quoted(text, start)
+            kind = "name" if char == "'" else "string"
+            tokens.append(Token(kind, text[start:end], value, start, layout_before))
+
+        elif char == "|" and text.startswith("||", start):
+            end = start + 2
+            tokens.append(Token("name", "||", "||", start, layout_before))
+
+        elif char in PUNCTUATION_CHARS:
+            end = start + 1
+            tokens.append(Token("punctuation", char, char, start, layout_before))
+
+        elif char in SOLO_CHARS:
+            end = start + 1
+            tokens.append(Token("name", char, char, start, layout_before))
+
+        elif char == "." and (start + 1 >= length or text[start + 1].isspace() or text[start + 1] == "%"):
+            end = start + 1
+            tokens.append(Token("end", ".", ".", start, layout_before))
+
+        elif char in SYMBOL_CHARS:
+            end = start
+            while end < length and text[end] in SYMBOL_CHARS:
+                end += 1
+            tokens.append(Token("name", text[start:end], text[start:end], start, layout_before))
+
+        else:
+            raise PrologSyntaxError(f"Illegal character {char!r}", text, start)
+
+        position = end
+
+
+def parse_term(text: str) -> Term:
+    """
+    Parse a single term, e.g., a predicate. A terminating period is allowed but not required.
+
+    Args:
+        text: The term as Prolog text
+
+    Returns:
+        The parsed term
+
+    Raises:
+        PrologSyntaxError: If the text is not exactly one valid term
+    """
+    parser = _Parser(text)
+    term = parser.parse_clause(require_end=False)
+    parser.expect_eof()
+    return term
+
+
+def parse_clauses(text: str) -> List[Term]:
+    """
+    Parse Prolog program text, i.e., clauses and directives each terminated by a period.
+
+    Args:
+        text: The program text
+
+    Returns:
+        The parsed clauses, in order
+
+    Raises:
+        PrologSyntaxError: If any clause is not valid Prolog or not terminated by a period
+    """
+    parser = _Parser(text)
+    clauses = []
+    while not parser.at_eof():
+        clauses.append(parser.parse_clause(require_end=True))
+    return clauses
+
+
+def split_clauses(text: str) -> List[str]:
+    """
+    Split Prolog text into the source of its clauses without the terminating periods, without parsing them.
+    Comments are dropped and layout is collapsed to a single space, so every clause fits on one line. A last clause
+    without a terminating period is kept.
+
+    Args:
+        text: The program text
+
+    Returns:
+        The clauses, in order
+
+    Raises:
+        PrologSyntaxError: If the text contains an illegal character, an unterminated quoted item or comment
+    """
+    clauses = []
+    current = []
+    for token in tokenize(text):
+        if token.kind in ("end", "eof"):
+            if current:
+                clauses.append("".join(current).strip())
+            current = []
+        else:
+            current.append(" " + token.text if token.layout_before else token.text)
+    return clauses
+
+
+def parse_predicate(text: str) -> Term:
+    """
+    Parse a predicate, i.e., a term which can be called. Variables, numbers and strings are rejected.
+
+    Args:
+        text: The predicate as Prolog text, e.g., "is_adult(Person)"
+
+    Returns:
+        The parsed predicate, an atom or a compound term
+
+    Raises:
+        PrologSyntaxError: If the text is not a valid predicate
+    """
+    term = parse_term(text)
+    if not isinstance(term, (Atom, Compound)):
+        position = len(text) - len(text.lstrip())
+        raise PrologSyntaxError("Predicate must be an atom or a compound term", text, position)
+    return term
+
+
+class _Parser:
+    """
+    Operator precedence parser over the tokens of a text.
+    """
+
+    def __init__(self, text: str):
+        self._text = text
+        self._tokens = tokenize(text)
+        self._index = 0
+
+    def at_eof(self) -> bool:
+        return self._peek().kind == "eof"
+
+    def expect_eof(self) -> None:
+        token = self._peek()
+        if token.kind != "eof":
+            self._unexpected(token)
+
+    def parse_clause(self, require_end: bool) -> Term:
+        term, _ = self._parse(1200)
+
+        token = self._peek()
+        if token.kind == "end":
+            self._index += 1
+        elif token.kind == "eof":
+            if require_end:
+                self._error("Missing terminating period", token)
+        else:
+            self._unexpected(token)
+
+        return term
+
+    def _parse(self, max_priority: int, terminators: frozenset = frozenset()) -> Tuple[Term, int]:
+        left, left_priority = self._parse_primary(max_priority, terminators)
+        return self._parse_infix(left, left_priority, max_priority, terminators)
+
+    def _parse_argument(self, terminators: frozenset = _ARGUMENT_END) -> Term:
+        term, _ = self._parse(1200, terminators)
+        return term
+
+    def _parse_primary(self, max_priority: int, terminators: frozenset) -> Tuple[Term, int]:
+        token = self._next()
+
+        if token.kind == "number":
+            return Number(token.text), 0
+
+        if token.kind == "variable":
+            return Variable(token.text), 0
+
+        if token.kind == "string":
+            return String(token.text), 0
+
+        if token.kind == "punctuation" and token.text == "(":
+            term, _ = self._parse(1200)
+            self._expect_closing(")", token)
+            return term, 0
+
+        if token.kind == "punctuation" and token.text == "[":
+            if self._peek_punctuation("]"):
+                self._index += 1
+                return Atom("[]", "[]"), 0
+
+            items = self._parse_arguments(_LIST_ITEM_END)
+            if self._peek_punctuation("|"):
+                self._index += 1
+                items.append(self._parse_argument(_LIST_ITEM_END))
+            self._expect_closing("]", token)
+            return Compound("[|]", "[|]", tuple(items), canonical=False), 0
+
+        if token.kind == "punctuation" and token.text == "{":
+            if self._peek_punctuation("}"):
+                self._index += 1
+                return Atom("{}", "{}"), 0
+
+            term, _ = self._parse(1200)
+            self._expect_closing("}", token)
+            return Compound("{}", "{}", (term,), canonical=False), 0
+
+        if token.kind == "name":
+            return self._parse_name(token, max_priority, terminators)
+
+        if token.kind == "end":
+            self._error("Unexpected end of clause", token)
+        if token.kind == "eof":
+            self._error("Unexpected end of file", token)
+        self._error(f"Illegal start of term {token.text!r}", token)
+
+    def _parse_name(self, token: Token, max_priority: int, terminators: frozenset) -> Tuple[Term, int]:
+        following = self._peek()
+
+        # Functional notation requires the opening bracket to follow the name immediately.
+        if following.kind == "punctuation" and following.text == "(" and not following.layout_before:
+            self._index += 1
+            args = [] if self._peek_punctuation(")") else self._parse_arguments()
+            self._expect_closing(")", following)
+            return Compound(token.value, token.text, tuple(args), canonical=True), 0
+
+        if token.value == "-" and following.kind == "number" and not following.layout_before:
+            self._index += 1
+            return Number(f"-{following.text}"), 0
+
+        if token.value in PREFIX_OPERATORS and self._can_start_term(following):
+            priority, operator_type = PREFIX_OPERATORS[token.value]
+            priority = min(priority, max_priority)
+            operand, _ = self._parse(priority if operator_type == "fy" else priority - 1, terminators)
+            return Compound(token.value, token.text, (operand,), canonical=False), priority
+
+        return Atom(token.value, token.text), 0
+
+    def _parse_infix(self, left: Term, left_priority: int, max_priority: int,
+                     terminators: frozenset) -> Tuple[Term, int]:
+        while True:
+            token = self._peek()
+            if token.kind not in ("name", "punctuation") or token.value not in INFIX_OPERATORS:
+                return left, left_priority
+            if token.kind == "punctuation" and token.value in terminators:
+                return left, left_priority
+
+            priority, operator_type = INFIX_OPERATORS[token.value]
+            left_max = priority if operator_type == "yfx" else priority - 1
+            right_max = priority if operator_type == "xfy" else priority - 1
+            if priority > max_priority or left_priority > left_max:
+                return left, left_priority
+
+            self._index += 1
+            right, _ = self._parse(right_max, terminators)
+            left = Compound(token.value, token.text, (left, right), canonical=False)
+            left_priority = priority
+
+    def _parse_arguments(self, terminators: frozenset = _ARGUMENT_END) -> List[Term]:
+        args = [self._parse_argument(terminators)]
+        while self._peek_punctuation(","):
+            self._index += 1
+            args.append(self._parse_argument(terminators))
+        return args
+
+    def _can_start_term(self, token: Token) -> bool:
+        if token.kind in ("number", "variable", "string"):
+            return True
+        if token.kind == "punctuation":
+            return token.text in "([{"
+        if token.kind == "name":
+            return token.value not in INFIX_OPERATORS or token.value in PREFIX_OPERATORS
+        return False
+
+    def _expect_closing(self, closing: str, opening: Token) -> None:
+        token = self._peek()
+        if token.kind == "punctuation" and token.text == closing:
+            self._index += 1
+            return
+
+        if token.kind in ("end", "eof") or token.kind == "punctuation" and token.text in ")]}":
+            self._error(f"Missing {closing!r} for this {opening.text!r}", opening)
+        self._error("Operator expected", token)
+
+    def _unexpected(self, token: Token):
+        if token.kind == "punctuation" and token.text in ")]}":
+            self._error(f"Unbalanced {token.text!r}", token)
+        self._error("Operator expected", token)
+
+    def _peek(self) -> Token:
+        return self._tokens[self._index]
+
+    def _peek_punctuation(self, text: str) -> bool:
+        token = self._peek()
+        return token.kind == "punctuation" and token.text == text
+
+    def _next(self) -> Token:
+        token = self._tokens[self._index]
+        if token.kind != "eof":
+            self._index += 1
+        return token
+
+    def _error(self, message: str, token: Token):
+        raise PrologSyntaxError(message, self._text, token.start)
+
+
+def _skip_layout(text: str, position: int) -> int:
+    length = len(text)
+    while position < length:
+        char = text[position]
+        if char.isspace():
+            position += 1
+        elif char == "%":
+            end = text.find("\n", position)
+            position = length if end == -1 else end + 1
+        elif text.startswith("/*", position):
+            end = text.find("*/", position + 2)
+            if end == -1:
+                raise PrologSyntaxError("Unterminated block comment", text, position)
+            position = end + 2
+        else:
+            break
+    return position
+
+
+def _scan_alphanumeric(text: str, position: int) -> int:
+    length = len(text)
+    position += 1
+    while position < length and (text[position].isalnum() or text[position] == "_"):
+        position += 1
+    return position
+
+
+def _scan_digits(text: str, position: int, digits: str = DIGITS) -> int:
+    length = len(text)
+    while position < length and (
+            text[position] in digits
+            or text[position] == "_" and position + 1 < length and text[position + 1] in digits
+    ):
+        position += 1
+    return position
+
+
+def _scan_number(text: str, start: int) -> int:
+    length = len(text)
+
+    if text.startswith("0'", start):
+        # Character code, e.g., 0'a or 0'\n
+        position = start + 2
+        if position >= length:
+            raise PrologSyntaxError("Unterminated character code", text, start)
+        if text[position] == "\\":
+            return position + 2
+        if text.startswith("''", position):
+            return position + 2
+        return position + 1
+
+    for prefix, digits in (("0x", "0123456789abcdefABCDEF"), ("0o", "01234567"), ("0b", "01")):
+        if text.startswith(prefix, start) and start + 2 < length and text[start + 2] in digits:
+            return _scan_digits(text, start + 2, digits)
+
+    position = _scan_digits(text, start)
+
+    # Rational number, e.g., 1r3
+    if position + 1 < length and text[position] == "r" and text[position + 1] in DIGITS:
+        return _scan_digits(text, position + 1)
+
+    # A period is only part of a number if a digit follows, otherwise it might terminate the clause.
+    is_float = position + 1 < length and text[position] == "." and text[position + 1] in DIGITS
+    if is_float:
+        position = _scan_digits(text, position + 1)
+
+    if position < length and text[position] in "eE":
+        exponent = position + 1
+        if exponent < length and text[exponent] in "+-":
+            exponent += 1
+        if exponent < length and text[exponent] in DIGITS:
+            position = _scan_digits(text, exponent)
+            is_float = True
+
+    # Infinite and not-a-number floats, e.g., 1.0Inf or 1.5NaN
+    if is_float and text.startswith(("Inf", "NaN"), position):
+        position += 3
+
+    return position
+
+
+def _scan_quoted(text: str, start: int) -> Tuple[int, str]:
+    quote = text[start]
+    length = len(text)
+    position = start + 1
+    value = []
+
+    while position < length:
+        char = text[position]
+
+        if char == quote:
+            if text.startswith(quote * 2, position):
+                value.append(quote)
+                position += 2
+                continue
+            return position + 1, "".join(value)
+
+        if char == "\\":
+            if position + 1 >= length:
+                break
+            escape = text[position + 1]
+            if escape == "\n":
+                position += 2
+            elif escape in _ESCAPES:
+                value.append(_ESCAPES[escape])
+                position += 2
+            elif escape == "x" or escape in DIGITS:
+                end = text.find("\\", position + 2)
+                if end == -1:
+                    break
+                code = text[position + 2:end] if escape == "x" else text[position + 1:end]
+                try:
+                    value.append(chr(int(code, 16 if escape == "x" else 8)))
+                except ValueError:
+                    raise PrologSyntaxError(f"Illegal character code {code!r}", text, position)
+                position = end + 1
+            else:
+                raise PrologSyntaxError(f"Undefined escape sequence \\{escape}", text, position)
+            continue
+
+        value.append(char)
+        position += 1
+
+    raise PrologSyntaxError(f"Unterminated quoted {'atom' if quote == chr(39) else 'string'}", text, start)
@@ -0,0 +1,42 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+from datetime import datetime
+
+from modules.common.keyset_cursor import encode_cursor, decode_cursor
+
+
+class TestKeysetCursor(unittest.TestCase):
+
+    def test_round_trip(self):
+        created_at = datetime(2025, 8, 12, 9, 34, 19, 565764)
+
+        cursor = encode_cursor(created_at, 42)
+
+        self.assertEqual(decode_cursor(cursor), (created_at, 42))
+        self.assertNotIn("=", cursor)
+
+    def test_malformed_cursor(self):
+        for cursor in ["42", "not a cursor", encode_cursor(datetime(2025, 1, 1), 1)[:-3]]:
+            with self.subTest(cursor=cursor), self.assertRaises(ValueError):
+                decode_cursor(cursor)
+
+
+if __name__ == "__main__":
+    unittest.main()
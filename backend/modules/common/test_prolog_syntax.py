@@ -0,0 +1,144 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+from modules.common.prolog_syntax import parse_term, parse_clauses, parse_predicate, split_clauses, \
+    PrologSyntaxError, Compound, Atom, Number, Variable
+
+
+class TestPrologSyntax(unittest.TestCase):
+    """
+    Test cases for the Prolog tokenizer and parser in prolog_syntax.py.
+    """
+
+    def test_parse_predicate(self):
+        """Test parsing predicates in functional notation."""
+        predicate = parse_predicate("employee(X, salary(X, 1_000), [a, b|T], 'Doe''s', \"text\", -1.5e3)")
+
+        self.assertIsInstance(predicate, Compound)
+        self.assertEqual(predicate.name, "employee")
+        self.assertEqual(len(predicate.args), 6)
+        self.assertEqual(predicate.args[0], Variable("X"))
+        self.assertTrue(predicate.args[1].canonical)
+        self.assertFalse(predicate.args[2].canonical)
+        self.assertEqual(predicate.args[3], Atom("Doe's", "'Doe''s'"))
+        self.assertEqual(predicate.args[5], Number("-1.5e3"))
+        self.assertEqual(parse_predicate("allowed"), Atom("allowed", "allowed"))
+
+    def test_parse_operators(self):
+        """Test that operators are parsed with their priority and associativity."""
+        clause = parse_term("a(X) :- b(X), \\+ c(X) ; X > 1 + 2 * 3")
+
+        self.assertEqual(clause.name, ":-")
+        body = clause.args[1]
+        self.assertEqual(body.name, ";")
+        self.assertEqual(body.args[0].name, ",")
+        self.assertEqual(body.args[0].args[1].name, "\\+")
+        comparison = body.args[1]
+        self.assertEqual(comparison.name, ">")
+        self.assertEqual(comparison.args[1].name, "+")
+        self.assertEqual(comparison.args[1].args[1].name, "*")
+
+    def test_parse_clauses(self):
+        """Test parsing program text with comments and directives."""
+        clauses = parse_clauses(
+            ":- dynamic employee/1.\n"
+            "% A comment\n"
+            "allowed(X) :- employee(X), not (fired(X), X \\= boss). /* block */\n"
+            "employee(john).\n"
+        )
+
+        self.assertEqual(len(clauses), 3)
+        self.assertEqual(clauses[0].name, ":-")
+        self.assertEqual(clauses[2], Compound("employee", "employee", (Atom("john", "john"),), True))
+
+    def test_accepts_what_swi_prolog_accepts(self):
+        """Arguments are read up to priority 1200 like SWI-Prolog does, and its special numbers are numbers."""
+        a, b = Atom("a", "a"), Atom("b", "b")
+
+        self.assertEqual(parse_term("f(a;b)").args, (Compound(";", ";", (a, b), False),))
+        self.assertEqual(parse_term("f(a:-b, c)").args[0], Compound(":-", ":-", (a, b), False))
+        self.assertEqual(parse_term("forall(p(X), q(X) ; r(X))").args[1].name, ";")
+        self.assertEqual(parse_term("[a:-b, c|T]").args[1:],(Atom("c", "c"), Variable("T")))
+        self.assertEqual(parse_term("1r3"), Number("1r3"))
+        self.assertEqual(parse_term("1.0Inf"), Number("1.0Inf"))
+
+        for text in [
+            "ok(X) :- f(a;b).",
+            "ok(X) :- forall(p(X), q(X) ; r(X)).",
+            "ok(X) :- X = f(a:-b).",
+            "ok(X) :- X is 1r3.",
+            "ok(X) :- X = 1.0Inf, Y = 1.5NaN, Z = 1.0e10Inf.",
+        ]:
+            with self.subTest(text=text):
+                self.assertEqual(len(parse_clauses(text)), 1)
+
+    def test_split_clauses(self):
+        """Test that comments are dropped and periods inside quoted items or numbers do not end a clause."""
+        clauses = split_clauses(
+            "% example\n"
+            "employee(john).\n"
+            "name('J. Smith'). /* block. */ salary(john, 1.5).\n"
+            "note(\"Ends. Here\"). % trailing comment.\n"
+            "employee(mary)"
+        )
+
+        self.assertEqual(clauses, [
+            "employee(john)",
+            "name('J. Smith')",
+            "salary(john, 1.5)",
+            "note(\"Ends. Here\")",
+            "employee(mary)",
+        ])
+
+    def test_syntax_errors(self):
+        """Test that malformed text is rejected with the position of the error."""
+        cases = [
+            ("employee(X", "Missing ')'", 1, 9),
+            ("employee(X))", "Unbalanced ')'", 1, 12),
+            ("employee(X Y)", "Operator expected", 1, 12),
+            ("Employee(X)", "Operator expected", 1, 9),
+            ("employee('X)", "Unterminated quoted atom", 1, 10),
+            ("employee(X, )", "Illegal start of term", 1, 13),
+            ("X", "Predicate must be an atom or a compound term", 1, 1),
+        ]
+
+        for text, message, line, column in cases:
+            with self.subTest(text=text):
+                with self.assertRaises(PrologSyntaxError) as context:
+                    parse_predicate(text)
+                self.assertIn(message, context.exception.message)
+                self.assertEqual((context.exception.line, context.exception.column), (line, column))
+
+    def test_missing_terminating_period(self):
+        """Test that every clause must be terminated by a period."""
+        with self.assertRaises(PrologSyntaxError) as context:
+            parse_clauses("a :- b.\nc :- d\n")
+
+        self.assertEqual(context.exception.message, "Missing terminating period")
+        self.assertEqual(context.exception.line, 3)
+
+    def test_syntax_error_is_value_error(self):
+        """Syntax errors are handled like the other validation errors of the services."""
+        with self.assertRaises(ValueError):
+            parse_clauses("a :- .")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+import unittest
+from unittest.mock import MagicMock
+
+from modules.common.unit_of_work import UnitOfWork
+
+
+class TestUnitOfWork(unittest.TestCase):
+
+    def setUp(self):
+        self.session = MagicMock(info={})
+        db = MagicMock()
+        db.session.return_value = self.session
+        self.unit_of_work = UnitOfWork(db)
+
+    def test_only_the_outermost_transaction_commits(self):
+        with self.unit_of_work.transaction():
+            with self.unit_of_work.transaction():
+                pass
+            self.session.flush.assert_called_once()
+            self.session.commit.assert_not_called()
+
+        self.session.commit.assert_called_once()
+
+    def test_rolls_back_everything_on_an_exception(self):
+        callback = MagicMock()
+
+        with self.assertRaises(ValueError):
+            with self.unit_of_work.transaction():
+                with self.unit_of_work.transaction():
+                    self.unit_of_work.after_commit(callback)
+                    raise ValueError("failed")
+
+        self.session.rollback.assert_called_once()
+        self.session.commit.assert_not_called()
+        callback.assert_not_called()
+
+        with self.unit_of_work.transaction():
+            pass
+        callback.assert_not_called()
+
+    def test_after_commit_waits_for_the_outermost_commit(self):
+        callback = MagicMock(side_effect=lambda: self.session.commit.assert_called_once())
+
+        with self.unit_of_work.transaction():
+            with self.unit_of_work.transaction():
+                self.unit_of_work.after_commit(callback)
+            callback.assert_not_called()
+
+        callback.assert_called_once()
+
+    def test_after_commit_runs_right_away_outside_a_transaction(self):
+        callback = MagicMock()
+
+        self.unit_of_work.after_commit(callback)
+
+        callback.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
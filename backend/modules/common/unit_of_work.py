@@ -0,0 +1,77 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from flask_sqlalchemy import SQLAlchemy
+
+_DEPTH = "unit_of_work_depth"
+_AFTER_COMMIT = "unit_of_work_after_commit"
+
+
+class UnitOfWork:
+    """
+    Groups the writes of several repository calls into a single transaction.
+
+    Repositories open a transaction around every write. Only the outermost transaction commits, nested ones just
+    flush, so a service can make a multistep operation atomic by opening a transaction around it. The state lives in
+    the scoped session of the app context, thus it is separate for every request and every job.
+
+    Do not keep a transaction open while waiting for an LLM, it would hold a connection and the row locks meanwhile.
+    """
+
+    def __init__(self, db: SQLAlchemy):
+        self.db = db
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Commit the writes made inside when the outermost transaction ends, or roll all of them back on an exception.
+        """
+        session = self.db.session()
+        depth = session.info.get(_DEPTH, 0)
+        session.info[_DEPTH] = depth + 1
+        try:
+            yield
+            if depth:
+                session.flush()
+            else:
+                session.commit()
+        except Exception:
+            if not depth:
+                session.rollback()
+                session.info.pop(_AFTER_COMMIT, None)
+            raise
+        finally:
+            session.info[_DEPTH] = depth
+
+        if not depth:
+            for callback in session.info.pop(_AFTER_COMMIT, []):
+                callback()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Run a callback once the writes so far are committed, right away if no transaction is open. Callbacks of a
+        transaction that is rolled back are dropped.
+        """
+        session = self.db.session()
+        if session.info.get(_DEPTH, 0):
+            session.info.setdefault(_AFTER_COMMIT, []).append(callback)
+        else:
+            callback()
@@ -21,6 +21,8 @@ from typing import List
 from pydantic import constr
 from pydantic_xml import BaseXmlModel, element, wrapped
 
+from modules.models.application.streaming_xml_validator import StreamingXmlValidator
+
 
 class Argument(BaseXmlModel, tag='argument', extra = "forbid"):
     variable: str = element(tag='variable')
@@ -41,3 +43,13 @@ class Example(BaseXmlModel, tag='example', extra = "forbid"):
 class ExamplesDTO(BaseXmlModel, tag='examples', extra = "forbid"):
     examples: List[Example] = element(default_factory=list)
 
+    @classmethod
+    def streaming_validator(cls) -> StreamingXmlValidator:
+        """
+        Validator for streamed responses. Unknown elements are ignored when parsing, but text values must not
+        contain any elements.
+        """
+        return StreamingXmlValidator(
+            root='examples',
+            children={'description': set(), 'predicate': set(), 'variable': set(), 'value': set()},
+        )
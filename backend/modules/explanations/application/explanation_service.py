@@ -18,16 +18,16 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 from typing import List
 
-from modules.atoms.application.atom_service import AtomService
 from modules.chat.application.dto.context_message_dto import ContextMessageDTO
 from modules.chat.domain.context_message_type import ContextMessageType
-from modules.common.util import format_prolog_knowledge_base
 from modules.explanations.application.dto.example_generation_dto import ExamplesDTO
 from modules.models.application.dto.chat_agent_message_ingress_dto import ChatAgentMessageIngressDTO
 from modules.models.application.llm_adapter import LLMAdapter
+from modules.models.domain.llm_usage_stage import LLMUsageStage
 from modules.models.domain.prompt_service import PromptService
+from modules.reasoning.application.knowledge_base_service import KnowledgeBaseService
+from modules.regulation_fragment.application.fragment_aggregate_service import FragmentAggregateService
 from modules.regulation_fragment.domain import Formalism
-from modules.rules.application.rule_service import RuleService
 
 
 class ExplanationService:
@@ -38,15 +38,15 @@ class ExplanationService:
 
     def __init__(
             self,
-            rule_service: RuleService,
-            atom_service: AtomService,
+            fragment_aggregate_service: FragmentAggregateService,
             prompt_service: PromptService,
-            llm_adapter: LLMAdapter
+            llm_adapter: LLMAdapter,
+            knowledge_base_service: KnowledgeBaseService,
     ):
-        self._rule_service = rule_service
-        self._atom_service = atom_service
+        self._fragment_aggregate_service = fragment_aggregate_service
         self._prompt_service = prompt_service
         self._llm_adapter = llm_adapter
+        self._knowledge_base_service = knowledge_base_service
 
     def generate_examples_for_regulation_fragment(self, regulation_fragment_id: int) -> ExamplesDTO:
         """
@@ -56,12 +56,16 @@ class ExplanationService:
         :return: The generated examples.
         """
         print("Generating examples for regulation fragment ID:", regulation_fragment_id)
-        atoms = self._atom_service.get_atoms_for_regulation_fragment(regulation_fragment_id)
+        aggregate = self._fragment_aggregate_service.get(regulation_fragment_id)
+        if aggregate is None:
+            raise ValueError(f"Regulation fragment with ID {regulation_fragment_id} not found.")
+
+        atoms = aggregate.atoms
         if not atoms:
             raise ValueError(f"No atoms found for regulation fragment ID {regulation_fragment_id}.")
         valid_predicate_values = set(atom.predicate for atom in atoms if atom.predicate)
 
-        rules = self._rule_service.get_rules_for_regulation_fragment(regulation_fragment_id)
+        rules = aggregate.rules
         if not rules:
             raise ValueError(f"No rules found for regulation fragment ID {regulation_fragment_id}.")
 
@@ -71,10 +75,11 @@ class ExplanationService:
 
         message = ChatAgentMessageIngressDTO(
             regulation_fragment_id=regulation_fragment_id,
-            user_prompt=example_prompt
+            user_prompt=example_prompt,
+            stage=LLMUsageStage.EXAMPLES,
         )
 
-        response = self._llm_adapter.send_message(message)
+        response = self._llm_adapter.send_message(message, validator=ExamplesDTO.streaming_validator())
 
         print("Received response from LLM")
         max_retries = self.MAX_RETRIES
@@ -83,6 +88,8 @@ class ExplanationService:
         previous_messages: List[ContextMessageDTO] = []
         while max_retries > 0:
             try:
+                if response.validation_error:
+                    raise ValueError(response.validation_error)
                 parsed_response = ExamplesDTO.from_xml(response.message)
 
                 # for some reason the LLMs really do not want to use the predicates I supply...
@@ -100,6 +107,7 @@ class ExplanationService:
                         "Invalid predicates used: " + ",\n".join(predicate_deviations)
                     )
 
+                self._llm_adapter.accept(response)
                 break
             except Exception as e:
                 print("Error parsing response:", str(e))
@@ -115,10 +123,12 @@ class ExplanationService:
                 example_prompt = prompt_adapter.example_generation_retry_prompt(str(e))
                 message = ChatAgentMessageIngressDTO(
                     regulation_fragment_id=regulation_fragment_id,
-                    user_prompt=example_prompt
+                    user_prompt=example_prompt,
+                    stage=LLMUsageStage.EXAMPLES,
                 )
                 print(previous_messages)
-                response = self._llm_adapter.send_message(message, context_messages=previous_messages)
+                response = self._llm_adapter.send_message(message, context_messages=previous_messages,
+                                                          validator=ExamplesDTO.streaming_validator())
 
         print("Returning: " + str(parsed_response))
         return parsed_response
@@ -130,15 +140,11 @@ class ExplanationService:
         :param regulation_fragment_id: The ID of the regulation fragment.
         :return: The formatted formalism text.
         """
-        atoms = self._atom_service.get_atoms_for_regulation_fragment(regulation_fragment_id)
-        if not atoms:
+        compiled = self._knowledge_base_service.get_knowledge_base(regulation_fragment_id)
+        if not compiled.atom_count:
             raise ValueError(f"No atoms found for regulation fragment ID {regulation_fragment_id}.")
 
-        rules = self._rule_service.get_rules_for_regulation_fragment(regulation_fragment_id)
-        if not rules:
+        if not compiled.rule_count:
             raise ValueError(f"No rules found for regulation fragment ID {regulation_fragment_id}.")
 
-        return format_prolog_knowledge_base(
-            atoms=atoms,
-            rules=rules,
-        )
+        return compiled.knowledge_base
@@ -19,6 +19,7 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 from flask import Blueprint, jsonify, Response
 
 from di_container import container
+from modules.jobs.domain.job_type import JobType
 
 explanation_controller = Blueprint('explanation', __name__)
 
@@ -26,14 +27,17 @@ explanation_controller = Blueprint('explanation', __name__)
 @explanation_controller.post('/regulation-fragments/<fragment_id>/generate-examples')
 def generate_examples_for_regulation_fragment(fragment_id):
     """
-    Generate examples for a regulation fragment.
+    Queue the generation of examples for a regulation fragment.
 
     :param fragment_id: The ID of the regulation fragment.
-    :return: The generated examples.
+    :return: The queued job, the examples are its result once it succeeded.
     """
-    explanation_service = container.explanation_service()
-    examples = explanation_service.generate_examples_for_regulation_fragment(int(fragment_id))
-    return examples.model_dump()
+    job_service = container.job_service()
+    try:
+        job = job_service.enqueue(JobType.GENERATE_EXAMPLES, int(fragment_id))
+    except ValueError as e:
+        return {'error': str(e)}, 404
+    return job.model_dump(mode='json'), 202
 
 
 @explanation_controller.get('/regulation-fragments/<fragment_id>/formalism')
@@ -0,0 +1,33 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class CreatePipelineDTO(BaseModel):
+    """
+    Data Transfer Object for starting a pipeline.
+
+    regulation_fragment_ids: The regulation fragments to generate atoms, rules and examples for
+    """
+    regulation_fragment_ids: List[int] = Field(min_length=1)
+
+    class Config:
+        extra = "forbid"
@@ -0,0 +1,56 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from datetime import datetime
+from typing import Optional, Any
+
+from pydantic import BaseModel
+
+from modules.jobs.domain.job_status import JobStatus
+from modules.jobs.domain.job_type import JobType
+from modules.models.domain.llm_identifier import LLMIdentifier
+
+
+class JobDTO(BaseModel):
+    """
+    Data Transfer Object for a background job.
+
+    id: Unique identifier for the job
+    type: What the job generates
+    status: Where the job is in its lifecycle (PENDING, RUNNING, SUCCEEDED, FAILED)
+    regulation_fragment_id: ID of the regulation fragment the job works on
+    llm_identifier: The LLM the job talks to, concurrency is bounded per LLM
+    pipeline_id: ID of the pipeline the job is a stage of, if any
+    result: JSON result of the job, if the generation returns something (e.g. examples)
+    error: Error message if the job failed
+    """
+    id: int
+    type: JobType
+    status: JobStatus
+    regulation_fragment_id: int
+    llm_identifier: LLMIdentifier
+    pipeline_id: Optional[int] = None
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        use_enum_values = True
+        extra = "forbid"
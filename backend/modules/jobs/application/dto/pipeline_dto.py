@@ -0,0 +1,49 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel
+
+from modules.jobs.application.dto.job_dto import JobDTO
+from modules.jobs.domain.job_status import JobStatus
+from modules.jobs.domain.job_type import JobType
+
+
+class PipelineDTO(BaseModel):
+    """
+    Data Transfer Object for a pipeline running the generation stages for several regulation fragments.
+
+    id: Unique identifier for the pipeline
+    status: RUNNING or PENDING while stages are queued, SUCCEEDED once all fragments went through all stages,
+        FAILED if a fragment is stuck at a failed stage (see resume)
+    stages: The stages every fragment goes through, in order
+    regulation_fragment_ids: The regulation fragments of the pipeline
+    jobs: The jobs of all stages run so far, succeeded jobs are the checkpoints
+    """
+    id: int
+    status: JobStatus
+    stages: List[JobType]
+    regulation_fragment_ids: List[int]
+    jobs: List[JobDTO]
+    created_at: datetime
+
+    class Config:
+        use_enum_values = True
+        extra = "forbid"
@@ -0,0 +1,272 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import os
+from datetime import datetime, timezone, timedelta
+from itertools import groupby
+from typing import Optional, Callable, Dict, List
+
+from pydantic import BaseModel
+
+from db_models import Job
+from modules.atoms.application.atom_service import AtomService
+from modules.atoms.application.dto.regenerate_atoms_dto import RegenerateAtomsDTO
+from modules.explanations.application.explanation_service import ExplanationService
+from modules.jobs.application.dto.create_pipeline_dto import CreatePipelineDTO
+from modules.jobs.application.dto.job_dto import JobDTO
+from modules.jobs.application.dto.pipeline_dto import PipelineDTO
+from modules.jobs.domain.job_status import JobStatus
+from modules.jobs.domain.job_type import JobType, PIPELINE_STAGES, next_pipeline_stage
+from modules.jobs.infra.job_repository import JobRepository
+from modules.regulation_fragment.application.regulation_fragment_service import RegulationFragmentService
+from modules.rules.application.dto.regenerate_rules_dto import RegenerateRulesDTO
+from modules.rules.application.rule_service import RuleService
+
+
+def _dto_from_db(job: Job) -> JobDTO:
+    """
+    Convert a domain model to a DTO.
+    """
+    return JobDTO(
+        id=job.id,
+        type=job.type,
+        status=job.status,
+        regulation_fragment_id=job.regulation_fragment_id,
+        llm_identifier=job.llm_identifier,
+        pipeline_id=job.pipeline_id,
+        result=json.loads(job.result) if job.result else None,
+        error=job.error,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
+
+
+def _stalled_stage(jobs: List[Job]) -> Optional[JobType]:
+    """
+    The stage a pipeline is stuck at for a regulation fragment, given the fragment's jobs of the pipeline.
+
+    :return: The first stage which has not succeeded, None if a job is still queued or all stages succeeded.
+    """
+    if any(not JobStatus(job.status).is_finished for job in jobs):
+        return None
+    succeeded = {JobType(job.type) for job in jobs if job.status == JobStatus.SUCCEEDED}
+    return next((stage for stage in PIPELINE_STAGES if stage not in succeeded), None)
+
+
+def _jobs_by_fragment(jobs: List[Job]) -> Dict[int, List[Job]]:
+    """
+    Group the jobs of a pipeline by regulation fragment, in the order the fragments were added.
+    """
+    ordered = sorted(jobs, key=lambda job: (job.regulation_fragment_id, job.id))
+    grouped = {fragment_id: list(group) for fragment_id, group in
+               groupby(ordered, key=lambda job: job.regulation_fragment_id)}
+    return dict(sorted(grouped.items(), key=lambda item: item[1][0].id))
+
+
+class JobService:
+    """
+    Runs the LLM driven generations of the atom, rule and explanation services as background jobs.
+    Jobs are queued in the database and executed by a JobWorkerPool.
+
+    Pipelines chain the generations of atoms, rules and examples (PIPELINE_STAGES) for many regulation fragments:
+    the first stage is queued for every fragment, and each succeeded stage queues the next one. Fragments progress
+    independently, bounded by the concurrency limits per LLM and per stage.
+    """
+
+    def __init__(
+            self,
+            job_repository: JobRepository,
+            regulation_fragment_service: RegulationFragmentService,
+            atom_service: AtomService,
+            rule_service: RuleService,
+            explanation_service: ExplanationService,
+            max_running_per_llm: Optional[int] = None,
+            max_running_per_type: Optional[int] = None,
+            timeout: Optional[float] = None,
+    ):
+        self._job_repository = job_repository
+        self._regulation_fragment_service = regulation_fragment_service
+        self._max_running_per_llm = max_running_per_llm or int(os.getenv("JOB_CONCURRENCY_PER_LLM", "2"))
+        self._max_running_per_type = max_running_per_type or int(os.getenv("JOB_CONCURRENCY_PER_TYPE", "4"))
+        self._timeout = timeout or float(os.getenv("JOB_TIMEOUT", "1800"))
+
+        self._handlers: Dict[JobType, Callable[[int, Optional[str]], Optional[BaseModel]]] = {
+            JobType.GENERATE_ATOMS: lambda fragment_id, _:
+            atom_service.generate_atoms_for_regulation_fragment(fragment_id),
+            JobType.REGENERATE_ATOMS: lambda fragment_id, payload:
+            atom_service.regenerate_atoms_for_regulation_fragment(
+                fragment_id, RegenerateAtomsDTO.model_validate_json(payload)),
+            JobType.GENERATE_RULES: lambda fragment_id, _:
+            rule_service.generate_rules_for_regulation_fragment(fragment_id),
+            JobType.REGENERATE_RULES: lambda fragment_id, payload:
+            rule_service.regenerate_rules_for_regulation_fragment(
+                fragment_id, RegenerateRulesDTO.model_validate_json(payload)),
+            JobType.GENERATE_EXAMPLES: lambda fragment_id, _:
+            explanation_service.generate_examples_for_regulation_fragment(fragment_id),
+        }
+
+    def enqueue(self, job_type: JobType, regulation_fragment_id: int, payload: Optional[BaseModel] = None,
+                pipeline_id: Optional[int] = None) -> JobDTO:
+        """
+        Queue a job for a regulation fragment.
+
+        :param job_type: What to generate.
+        :param regulation_fragment_id: The ID of the regulation fragment.
+        :param payload: The request body of the generation, if any (e.g., feedback for regeneration).
+        :param pipeline_id: The pipeline the job is a stage of, if any.
+        :return: The pending job.
+        """
+        fragment = self._regulation_fragment_service.find_by_id(regulation_fragment_id)
+        if not fragment:
+            raise ValueError(f"Regulation fragment with ID {regulation_fragment_id} not found")
+
+        job = self._job_repository.save(
+            job_type,
+            regulation_fragment_id,
+            fragment.llm_identifier,
+            payload.model_dump_json() if payload else None,
+            pipeline_id,
+        )
+        return _dto_from_db(job)
+
+    def get_job(self, job_id: int) -> Optional[JobDTO]:
+        """
+        Retrieve a job by its ID.
+        """
+        job = self._job_repository.find_by_id(job_id)
+
+        if not job:
+            return None
+
+        return _dto_from_db(job)
+
+    def start_pipeline(self, create_pipeline_dto: CreatePipelineDTO) -> PipelineDTO:
+        """
+        Queue the first stage of a pipeline for each of the given regulation fragments.
+
+        :raises ValueError: If a regulation fragment does not exist.
+        :return: The pipeline.
+        """
+        fragments = []
+        for fragment_id in dict.fromkeys(create_pipeline_dto.regulation_fragment_ids):
+            fragment = self._regulation_fragment_service.find_by_id(fragment_id)
+            if not fragment:
+                raise ValueError(f"Regulation fragment with ID {fragment_id} not found")
+            fragments.append((fragment_id, fragment.llm_identifier))
+
+        pipeline = self._job_repository.save_pipeline(PIPELINE_STAGES[0], fragments)
+        return self._pipeline_dto(pipeline.id, pipeline.created_at, list(pipeline.jobs))
+
+    def get_pipeline(self, pipeline_id: int) -> Optional[PipelineDTO]:
+        """
+        Retrieve a pipeline with the jobs of all its stages.
+        """
+        pipeline = self._job_repository.find_pipeline_by_id(pipeline_id)
+
+        if not pipeline:
+            return None
+
+        return self._pipeline_dto(pipeline.id, pipeline.created_at, self._job_repository.find_by_pipeline(pipeline_id))
+
+    def resume_pipeline(self, pipeline_id: int) -> Optional[PipelineDTO]:
+        """
+        Continue a pipeline after failed stages or an interrupted run (running jobs of a dead process fail once
+        they time out). For every fragment without queued jobs, the first stage which has not succeeded is queued
+        again, completed stages are not repeated.
+
+        :return: The resumed pipeline or None if it does not exist.
+        """
+        pipeline = self._job_repository.find_pipeline_by_id(pipeline_id)
+
+        if not pipeline:
+            return None
+
+        for fragment_id, jobs in _jobs_by_fragment(self._job_repository.find_by_pipeline(pipeline_id)).items():
+            stage = _stalled_stage(jobs)
+            if stage is not None:
+                print(f"Resuming pipeline {pipeline_id} at {stage.value} for regulation fragment ID: {fragment_id}")
+                self.enqueue(stage, fragment_id, pipeline_id=pipeline_id)
+
+        return self.get_pipeline(pipeline_id)
+
+    def run_next_job(self) -> bool:
+        """
+        Claim the next job whose LLM and type have capacity left and run it to completion. If the job is a pipeline
+        stage, the next stage is queued when it succeeds.
+
+        :return: Whether a job was run.
+        """
+        job = self._job_repository.claim_next(self._max_running_per_llm, self._max_running_per_type)
+        if not job:
+            return False
+
+        # The generation commits the session, which expires the job, read everything upfront.
+        job_id, job_type, fragment_id, payload = job.id, job.type, job.regulation_fragment_id, job.payload
+        pipeline_id = job.pipeline_id
+        print(f"Running job {job_id} ({job_type.value}) for regulation fragment ID: {fragment_id}")
+
+        try:
+            result = self._handlers[job_type](fragment_id, payload)
+        except Exception as e:
+            print(f"Job {job_id} failed: {e}")
+            if not self._job_repository.finish(job_id, JobStatus.FAILED, error=str(e)):
+                print(f"Job {job_id} was no longer running, its outcome is discarded")
+            return True
+
+        if not self._job_repository.finish(
+            job_id,
+            JobStatus.SUCCEEDED,
+            result=result.model_dump_json() if isinstance(result, BaseModel) else None,
+            next_job_type=next_pipeline_stage(job_type) if pipeline_id is not None else None,
+        ):
+            print(f"Job {job_id} was no longer running, its outcome is discarded")
+        return True
+
+    def fail_stale_jobs(self) -> int:
+        """
+        Fail jobs which have been running for longer than the job timeout.
+
+        :return: The number of failed jobs.
+        """
+        started_before = datetime.now(timezone.utc) - timedelta(seconds=self._timeout)
+        return self._job_repository.fail_stale(started_before)
+
+    @staticmethod
+    def _pipeline_dto(pipeline_id: int, created_at: datetime, jobs: List[Job]) -> PipelineDTO:
+        by_fragment = _jobs_by_fragment(jobs)
+        statuses = {JobStatus(job.status) for job in jobs}
+
+        if JobStatus.RUNNING in statuses:
+            status = JobStatus.RUNNING
+        elif JobStatus.PENDING in statuses:
+            status = JobStatus.PENDING
+        elif any(_stalled_stage(fragment_jobs) is not None for fragment_jobs in by_fragment.values()):
+            status = JobStatus.FAILED
+        else:
+            status = JobStatus.SUCCEEDED
+
+        return PipelineDTO(
+            id=pipeline_id,
+            status=status,
+            stages=PIPELINE_STAGES,
+            regulation_fragment_ids=list(by_fragment.keys()),
+            jobs=[_dto_from_db(job) for job in jobs],
+            created_at=created_at,
+        )
@@ -0,0 +1,99 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import threading
+import time
+from typing import Optional, List, Callable
+
+from flask import Flask
+
+from modules.jobs.application.job_service import JobService
+
+
+class JobWorkerPool:
+    """
+    Threads running queued jobs next to the web server. Every process serving the app starts its own pool,
+    the queue table coordinates them, so the concurrency per LLM is bounded across all processes.
+    """
+
+    def __init__(self, job_service_factory: Callable[[], JobService], workers: Optional[int] = None,
+                 poll_interval: Optional[float] = None):
+        """
+        :param job_service_factory: Provides the service running the jobs. It is only resolved by the workers,
+            so starting the pool does not set up the LLM clients before the first job.
+        :param workers: Number of worker threads, defaults to JOB_WORKERS (2). 0 disables the pool.
+        :param poll_interval: Seconds to wait before polling an empty queue again, defaults to JOB_POLL_INTERVAL (1).
+        """
+        self._job_service_factory = job_service_factory
+        self._workers = workers if workers is not None else int(os.getenv("JOB_WORKERS", "2"))
+        self._poll_interval = poll_interval or float(os.getenv("JOB_POLL_INTERVAL", "1"))
+        self._stopped = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._stale_check_lock = threading.Lock()
+        self._last_stale_check = 0.0
+
+    def start(self, app: Flask):
+        """
+        Start the worker threads, each running jobs inside its own app context.
+        """
+        with self._lock:
+            if self._threads:
+                return
+            self._stopped.clear()
+            for i in range(self._workers):
+                thread = threading.Thread(target=self._work, args=(app,), name=f"job-worker-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stop the worker threads after their current job.
+        """
+        self._stopped.set()
+        with self._lock:
+            for thread in self._threads:
+                thread.join(timeout)
+            self._threads = []
+
+    def _work(self, app: Flask):
+        while not self._stopped.is_set():
+            try:
+                with app.app_context():
+                    job_service = self._job_service_factory()
+                    ran = job_service.run_next_job()
+                    if not ran and self._stale_check_due():
+                        job_service.fail_stale_jobs()
+            except Exception as e:
+                print(f"Job worker {threading.current_thread().name} failed: {e}")
+                ran = False
+
+            if not ran:
+                self._stopped.wait(self._poll_interval)
+
+    def _stale_check_due(self) -> bool:
+        """
+        Stale jobs are only checked once a minute per process.
+        """
+        with self._stale_check_lock:
+            now = time.monotonic()
+            if now - self._last_stale_check < 60:
+                return False
+            self._last_stale_check = now
+            return True
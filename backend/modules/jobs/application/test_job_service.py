@@ -0,0 +1,182 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from modules.atoms.application.dto.regenerate_atoms_dto import RegenerateAtomsDTO
+from modules.jobs.application.dto.create_pipeline_dto import CreatePipelineDTO
+from modules.explanations.application.dto.example_generation_dto import ExamplesDTO
+from modules.jobs.application.job_service import JobService
+from modules.jobs.domain.job_status import JobStatus
+from modules.jobs.domain.job_type import JobType
+from modules.models.domain.llm_identifier import LLMIdentifier
+
+
+def _job(job_type: JobType, payload=None, job_id=7, status=JobStatus.RUNNING, fragment_id=3, pipeline_id=None):
+    return SimpleNamespace(
+        id=job_id,
+        type=job_type,
+        status=status,
+        regulation_fragment_id=fragment_id,
+        llm_identifier=LLMIdentifier.GPT_5,
+        pipeline_id=pipeline_id,
+        payload=payload,
+        result=None,
+        error=None,
+        created_at=datetime.now(timezone.utc),
+        started_at=datetime.now(timezone.utc),
+        finished_at=None,
+    )
+
+
+class TestJobService(unittest.TestCase):
+
+    def setUp(self):
+        self.job_repository = MagicMock()
+        self.regulation_fragment_service = MagicMock()
+        self.atom_service = MagicMock()
+        self.rule_service = MagicMock()
+        self.explanation_service = MagicMock()
+        self.job_service = JobService(
+            self.job_repository,
+            self.regulation_fragment_service,
+            self.atom_service,
+            self.rule_service,
+            self.explanation_service,
+            max_running_per_llm=3,
+            max_running_per_type=4,
+        )
+
+    def test_enqueue_copies_llm_of_fragment(self):
+        self.regulation_fragment_service.find_by_id.return_value = SimpleNamespace(llm_identifier=LLMIdentifier.GPT_5)
+        self.job_repository.save.return_value = _job(JobType.REGENERATE_ATOMS, '{"feedback":"more"}')
+
+        job = self.job_service.enqueue(JobType.REGENERATE_ATOMS, 3, RegenerateAtomsDTO(feedback="more"))
+
+        self.job_repository.save.assert_called_once_with(
+            JobType.REGENERATE_ATOMS, 3, LLMIdentifier.GPT_5, '{"feedback":"more"}', None)
+        self.assertEqual(job.id, 7)
+        self.assertEqual(job.type, "REGENERATE_ATOMS")
+
+    def test_enqueue_unknown_fragment(self):
+        self.regulation_fragment_service.find_by_id.return_value = None
+
+        with self.assertRaises(ValueError):
+            self.job_service.enqueue(JobType.GENERATE_ATOMS, 3)
+        self.job_repository.save.assert_not_called()
+
+    def test_run_next_job_without_pending_jobs(self):
+        self.job_repository.claim_next.return_value = None
+
+        self.assertFalse(self.job_service.run_next_job())
+        self.job_repository.claim_next.assert_called_once_with(3, 4)
+
+    def test_run_next_job_passes_payload(self):
+        self.job_repository.claim_next.return_value = _job(JobType.REGENERATE_ATOMS, '{"feedback":"more"}')
+
+        self.assertTrue(self.job_service.run_next_job())
+
+        self.atom_service.regenerate_atoms_for_regulation_fragment.assert_called_once_with(
+            3, RegenerateAtomsDTO(feedback="more"))
+        self.job_repository.finish.assert_called_once_with(7, JobStatus.SUCCEEDED, result=None, next_job_type=None)
+
+    def test_run_next_job_stores_result(self):
+        self.job_repository.claim_next.return_value = _job(JobType.GENERATE_EXAMPLES)
+        self.explanation_service.generate_examples_for_regulation_fragment.return_value = ExamplesDTO(examples=[])
+
+        self.job_service.run_next_job()
+
+        _, status = self.job_repository.finish.call_args.args
+        self.assertEqual(status, JobStatus.SUCCEEDED)
+        self.assertEqual(json.loads(self.job_repository.finish.call_args.kwargs["result"]), {"examples": []})
+
+    def test_run_next_job_records_failure(self):
+        self.job_repository.claim_next.return_value = _job(JobType.GENERATE_RULES)
+        self.rule_service.generate_rules_for_regulation_fragment.side_effect = ValueError("LLM unavailable")
+
+        self.assertTrue(self.job_service.run_next_job())
+
+        self.job_repository.finish.assert_called_once_with(7, JobStatus.FAILED, error="LLM unavailable")
+
+    def test_run_next_job_queues_next_pipeline_stage(self):
+        self.job_repository.claim_next.return_value = _job(JobType.GENERATE_ATOMS, pipeline_id=5)
+
+        self.job_service.run_next_job()
+
+        self.job_repository.finish.assert_called_once_with(
+            7, JobStatus.SUCCEEDED, result=None, next_job_type=JobType.GENERATE_RULES)
+
+    def test_run_next_job_ends_pipeline_after_last_stage(self):
+        self.job_repository.claim_next.return_value = _job(JobType.GENERATE_EXAMPLES, pipeline_id=5)
+        self.explanation_service.generate_examples_for_regulation_fragment.return_value = ExamplesDTO(examples=[])
+
+        self.job_service.run_next_job()
+
+        self.assertIsNone(self.job_repository.finish.call_args.kwargs["next_job_type"])
+
+    def test_start_pipeline_queues_first_stage_once_per_fragment(self):
+        self.regulation_fragment_service.find_by_id.return_value = SimpleNamespace(llm_identifier=LLMIdentifier.GPT_5)
+        self.job_repository.save_pipeline.return_value = SimpleNamespace(
+            id=5,
+            created_at=datetime.now(timezone.utc),
+            jobs=[_job(JobType.GENERATE_ATOMS, job_id=1, status=JobStatus.PENDING, fragment_id=4, pipeline_id=5),
+                  _job(JobType.GENERATE_ATOMS, job_id=2, status=JobStatus.PENDING, fragment_id=3, pipeline_id=5)],
+        )
+
+        pipeline = self.job_service.start_pipeline(CreatePipelineDTO(regulation_fragment_ids=[4, 3, 4]))
+
+        self.job_repository.save_pipeline.assert_called_once_with(
+            JobType.GENERATE_ATOMS, [(4, LLMIdentifier.GPT_5), (3, LLMIdentifier.GPT_5)])
+        self.assertEqual(pipeline.status, "PENDING")
+        self.assertEqual(pipeline.regulation_fragment_ids, [4, 3])
+
+    def test_resume_pipeline_continues_at_failed_stage(self):
+        self.regulation_fragment_service.find_by_id.return_value = SimpleNamespace(llm_identifier=LLMIdentifier.GPT_5)
+        self.job_repository.find_pipeline_by_id.return_value = SimpleNamespace(
+            id=5, created_at=datetime.now(timezone.utc))
+        self.job_repository.find_by_pipeline.return_value = [
+            # Fragment 3 failed generating rules, fragment 4 is done, fragment 6 is still running
+            _job(JobType.GENERATE_ATOMS, job_id=1, status=JobStatus.SUCCEEDED, fragment_id=3, pipeline_id=5),
+            _job(JobType.GENERATE_ATOMS, job_id=2, status=JobStatus.SUCCEEDED, fragment_id=4, pipeline_id=5),
+            _job(JobType.GENERATE_ATOMS, job_id=3, status=JobStatus.RUNNING, fragment_id=6, pipeline_id=5),
+            _job(JobType.GENERATE_RULES, job_id=4, status=JobStatus.FAILED, fragment_id=3, pipeline_id=5),
+            _job(JobType.GENERATE_RULES, job_id=5, status=JobStatus.SUCCEEDED, fragment_id=4, pipeline_id=5),
+            _job(JobType.GENERATE_EXAMPLES, job_id=6, status=JobStatus.SUCCEEDED, fragment_id=4, pipeline_id=5),
+        ]
+        self.job_repository.save.return_value = _job(JobType.GENERATE_RULES, status=JobStatus.PENDING, pipeline_id=5)
+
+        self.job_service.resume_pipeline(5)
+
+        self.job_repository.save.assert_called_once_with(JobType.GENERATE_RULES, 3, LLMIdentifier.GPT_5, None, 5)
+
+    def test_pipeline_with_failed_stage_is_failed(self):
+        self.job_repository.find_pipeline_by_id.return_value = SimpleNamespace(
+            id=5, created_at=datetime.now(timezone.utc))
+        self.job_repository.find_by_pipeline.return_value = [
+            _job(JobType.GENERATE_ATOMS, job_id=1, status=JobStatus.FAILED, fragment_id=3, pipeline_id=5),
+        ]
+
+        self.assertEqual(self.job_service.get_pipeline(5).status, "FAILED")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from enum import Enum
+from typing import Optional
+
+
+class JobType(str, Enum):
+    """
+    Enum representing the kinds of background jobs, one per LLM driven generation endpoint.
+    """
+    GENERATE_ATOMS = "GENERATE_ATOMS"
+    REGENERATE_ATOMS = "REGENERATE_ATOMS"
+    GENERATE_RULES = "GENERATE_RULES"
+    REGENERATE_RULES = "REGENERATE_RULES"
+    GENERATE_EXAMPLES = "GENERATE_EXAMPLES"
+
+
+# The stages a pipeline runs for every regulation fragment, each builds on the results of the previous one
+PIPELINE_STAGES = [JobType.GENERATE_ATOMS, JobType.GENERATE_RULES, JobType.GENERATE_EXAMPLES]
+
+
+def next_pipeline_stage(job_type: Optional[JobType]) -> Optional[JobType]:
+    """
+    The pipeline stage following the given one, the first stage for None.
+
+    :return: The next stage or None if the given one is the last.
+    """
+    if job_type is None:
+        return PIPELINE_STAGES[0]
+    index = PIPELINE_STAGES.index(job_type)
+    return PIPELINE_STAGES[index + 1] if index + 1 < len(PIPELINE_STAGES) else None
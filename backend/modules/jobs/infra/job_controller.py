@@ -0,0 +1,35 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from flask import Blueprint
+
+from di_container import container
+
+job_controller = Blueprint('job', __name__)
+
+
+@job_controller.get('/jobs/<job_id>')
+def get_job(job_id: str):
+    """
+    Get the current state of a job.
+    """
+    job_service = container.job_service()
+    job = job_service.get_job(int(job_id))
+    if not job:
+        return {'error': 'Job not found'}, 404
+    return job.model_dump(mode='json'), 200
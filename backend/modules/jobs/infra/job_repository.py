@@ -0,0 +1,185 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional, List, Tuple
+
+from sqlalchemy import func, select, text, update
+
+from db_models import Job, Pipeline
+from modules.jobs.domain.job_status import JobStatus
+from modules.jobs.domain.job_type import JobType
+from modules.models.domain.llm_identifier import LLMIdentifier
+
+# Arbitrary key of the transaction level advisory lock serializing job claims across workers and processes.
+_CLAIM_LOCK_KEY = 7_310_042
+
+
+class JobRepository:
+    """
+    Repository for the job queue table.
+    """
+
+    def __init__(self, db):
+        self.db = db
+
+    def save(self, job_type: JobType, regulation_fragment_id: int, llm_identifier: LLMIdentifier,
+             payload: Optional[str] = None, pipeline_id: Optional[int] = None) -> Job:
+        """
+        Enqueue a new pending job.
+        """
+        job = Job(
+            type=job_type,
+            status=JobStatus.PENDING,
+            regulation_fragment_id=regulation_fragment_id,
+            llm_identifier=llm_identifier,
+            payload=payload,
+            pipeline_id=pipeline_id,
+        )
+
+        self.db.session.add(job)
+        self.db.session.commit()
+        return job
+
+    def save_pipeline(self, job_type: JobType, fragments: List[Tuple[int, LLMIdentifier]]) -> Pipeline:
+        """
+        Create a pipeline together with a pending job of its first stage for each of the given
+        (regulation fragment ID, LLM identifier) pairs.
+        """
+        pipeline = Pipeline(jobs=[
+            Job(
+                type=job_type,
+                status=JobStatus.PENDING,
+                regulation_fragment_id=regulation_fragment_id,
+                llm_identifier=llm_identifier,
+            )
+            for regulation_fragment_id, llm_identifier in fragments
+        ])
+
+        self.db.session.add(pipeline)
+        self.db.session.commit()
+        return pipeline
+
+    def find_by_id(self, job_id: int) -> Optional[Job]:
+        return self.db.session.get(Job, job_id, populate_existing=True)
+
+    def find_pipeline_by_id(self, pipeline_id: int) -> Optional[Pipeline]:
+        return self.db.session.get(Pipeline, pipeline_id, populate_existing=True)
+
+    def find_by_pipeline(self, pipeline_id: int) -> List[Job]:
+        """
+        All jobs of a pipeline in the order they were queued.
+        """
+        return list(self.db.session.scalars(
+            select(Job)
+            .where(Job.pipeline_id == pipeline_id)
+            .order_by(Job.id)
+            .execution_options(populate_existing=True)
+        ))
+
+    def claim_next(self, max_running_per_llm: int, max_running_per_type: int) -> Optional[Job]:
+        """
+        Mark the oldest pending job as running and return it. Jobs of LLMs which already have
+        max_running_per_llm running jobs are skipped, as are jobs of types (i.e., pipeline stages)
+        with max_running_per_type running jobs.
+
+        Claims are serialized with an advisory lock so that the running counts cannot change between
+        counting and claiming; FOR UPDATE SKIP LOCKED keeps this safe even without the lock.
+
+        :return: The claimed job or None if there is nothing to do.
+        """
+        session = self.db.session
+        try:
+            session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _CLAIM_LOCK_KEY})
+
+            saturated = select(Job.llm_identifier) \
+                .where(Job.status == JobStatus.RUNNING) \
+                .group_by(Job.llm_identifier) \
+                .having(func.count() >= max_running_per_llm)
+
+            saturated_types = select(Job.type) \
+                .where(Job.status == JobStatus.RUNNING) \
+                .group_by(Job.type) \
+                .having(func.count() >= max_running_per_type)
+
+            job = session.scalars(
+                select(Job)
+                .where(Job.status == JobStatus.PENDING,
+                       Job.llm_identifier.not_in(saturated),
+                       Job.type.not_in(saturated_types))
+                .order_by(Job.id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            ).first()
+
+            if job:
+                job.status = JobStatus.RUNNING
+                job.started_at = datetime.now(timezone.utc)
+            session.commit()
+            return job
+        except Exception:
+            session.rollback()
+            raise
+
+    def finish(self, job_id: int, status: JobStatus, result: Optional[str] = None, error: Optional[str] = None,
+               next_job_type: Optional[JobType] = None) -> bool:
+        """
+        Record the outcome of a running job.
+
+        :param next_job_type: If given, a job of this type for the same regulation fragment and pipeline is queued
+            in the same transaction, so a pipeline never loses a stage between two checkpoints.
+        :return: False if the job was no longer running, e.g. because it was failed as stale meanwhile. Then
+            neither the outcome is recorded nor the next job queued.
+        """
+        # Discard whatever a failed job left behind in the session
+        self.db.session.rollback()
+        result = self.db.session.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == JobStatus.RUNNING)
+            .values(status=status, result=result, error=error, finished_at=datetime.now(timezone.utc))
+        )
+        if result.rowcount != 1:
+            self.db.session.rollback()
+            return False
+
+        if next_job_type is not None:
+            job = self.db.session.get(Job, job_id)
+            self.db.session.add(Job(
+                type=next_job_type,
+                status=JobStatus.PENDING,
+                regulation_fragment_id=job.regulation_fragment_id,
+                llm_identifier=job.llm_identifier,
+                pipeline_id=job.pipeline_id,
+            ))
+        self.db.session.commit()
+        return True
+
+    def fail_stale(self, started_before: datetime) -> int:
+        """
+        Fail running jobs started before the given time, e.g. because the process running them died.
+        Otherwise they would count towards the concurrency limit of their LLM forever.
+
+        :return: The number of failed jobs.
+        """
+        result = self.db.session.execute(
+            update(Job)
+            .where(Job.status == JobStatus.RUNNING, Job.started_at < started_before)
+            .values(status=JobStatus.FAILED, error="Job timed out", finished_at=datetime.now(timezone.utc))
+        )
+        self.db.session.commit()
+        return result.rowcount
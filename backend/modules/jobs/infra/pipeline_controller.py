@@ -0,0 +1,62 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from flask import Blueprint, request
+
+from di_container import container
+from modules.jobs.application.dto.create_pipeline_dto import CreatePipelineDTO
+
+pipeline_controller = Blueprint('pipeline', __name__)
+
+
+@pipeline_controller.post('/pipelines')
+def start_pipeline():
+    """
+    Queue the generation of atoms, rules and examples for several regulation fragments.
+    """
+    create_pipeline_data = CreatePipelineDTO(**request.get_json())
+    job_service = container.job_service()
+    try:
+        pipeline = job_service.start_pipeline(create_pipeline_data)
+    except ValueError as e:
+        return {'error': str(e)}, 404
+    return pipeline.model_dump(mode='json'), 202
+
+
+@pipeline_controller.get('/pipelines/<pipeline_id>')
+def get_pipeline(pipeline_id: str):
+    """
+    Get the current state of a pipeline with the jobs of all its stages.
+    """
+    job_service = container.job_service()
+    pipeline = job_service.get_pipeline(int(pipeline_id))
+    if not pipeline:
+        return {'error': 'Pipeline not found'}, 404
+    return pipeline.model_dump(mode='json'), 200
+
+
+@pipeline_controller.post('/pipelines/<pipeline_id>/resume')
+def resume_pipeline(pipeline_id: str):
+    """
+    Queue the failed or interrupted stages of a pipeline again, completed stages are kept.
+    """
+    job_service = container.job_service()
+    pipeline = job_service.resume_pipeline(int(pipeline_id))
+    if not pipeline:
+        return {'error': 'Pipeline not found'}, 404
+    return pipeline.model_dump(mode='json'), 202
@@ -18,14 +18,45 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 from typing import Optional, List, Literal
 
+from modules.models.application.agentic_log_writer import AgenticLogWriter
+from modules.common.keyset_cursor import encode_cursor, decode_cursor
 from modules.models.application.dto.agentic_log_dto import AgenticLogDTO
+from modules.models.application.dto.agentic_log_page_dto import AgenticLogPageDTO
 from modules.models.application.dto.create_agentic_log_dto import CreateAgenticLogDTO
+from db_models import AgenticLog
 from modules.models.infra.agentic_log_repository import AgenticLogRepository
+from modules.models.infra.prompt_blob_codec import decode_prompt
+
+
+def _dto_from_db(log: AgenticLog, include_prompts: bool = True) -> AgenticLogDTO:
+    """
+    Convert a domain model to a DTO. The prompts are only decompressed if they are included.
+    """
+    return AgenticLogDTO(
+        id=log.id,
+        user_prompt=decode_prompt(log.user_prompt_blob.content) if include_prompts else None,
+        system_prompt=decode_prompt(log.system_prompt_blob.content)
+        if include_prompts and log.system_prompt_hash else None,
+        message_source=log.message_source,
+        regulation_fragment_id=log.regulation_fragment_id,
+        created_at=log.created_at,
+        is_error=log.is_error
+    )
 
 
 class AgenticLogService:
-    def __init__(self, agentic_log_repository: AgenticLogRepository):
+    def __init__(self, agentic_log_repository: AgenticLogRepository,
+                 agentic_log_writer: Optional[AgenticLogWriter] = None):
         self._agentic_log_repository = agentic_log_repository
+        self._agentic_log_writer = agentic_log_writer
+
+    def log(self, log_data: CreateAgenticLogDTO):
+        """
+        Record an agentic log without waiting for the database, if the background writer has room for it.
+        Otherwise the log is created synchronously.
+        """
+        if self._agentic_log_writer is None or not self._agentic_log_writer.submit(log_data):
+            self._agentic_log_repository.save(log_data)
 
     def create(self, log_data: CreateAgenticLogDTO) -> AgenticLogDTO:
         """
@@ -35,45 +66,54 @@ class AgenticLogService:
 
         return AgenticLogDTO(
             id=created_log.id,
-            user_prompt=created_log.user_prompt,
-            system_prompt=created_log.system_prompt,
+            user_prompt=log_data.user_prompt,
+            system_prompt=log_data.system_prompt,
             message_source=created_log.message_source,
             regulation_fragment_id=created_log.regulation_fragment_id,
             created_at=created_log.created_at,
             is_error=created_log.is_error
         )
 
-    def find_by_regulation_fragment_id(self, regulation_fragment_id: int, cursor: Optional[int] = None,
-                                       limit: Optional[int] = None, order_date: Literal["asc", "desc"] = "asc") -> List[
-        AgenticLogDTO]:
+    def find_by_id(self, log_id: int) -> Optional[AgenticLogDTO]:
+        """
+        Retrieve an agentic log with its prompts.
+        """
+        log = self._agentic_log_repository.find_by_id(log_id)
+
+        if not log:
+            return None
+
+        return _dto_from_db(log)
+
+    def find_by_regulation_fragment_id(self, regulation_fragment_id: int, cursor: Optional[str] = None,
+                                       limit: Optional[int] = None, order_date: Literal["asc", "desc"] = "asc",
+                                       include_prompts: bool = True) -> AgenticLogPageDTO:
         """
         Retrieve agentic logs for a specific regulation fragment with optional pagination.
 
         Args:
             regulation_fragment_id: ID of the regulation fragment
-            cursor: Optional ID to start retrieving logs after (for pagination)
+            cursor: Optional cursor of a previous page to start retrieving logs after (for pagination)
             limit: Optional maximum number of logs to retrieve
             order_date: Order of logs by creation date, either "asc" or "desc"
+            include_prompts: Whether to include the prompts, without them no prompt is loaded or decompressed
 
         Returns:
-            List of agentic logs
+            Page of agentic logs with the cursors of its first and last log
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
         logs = self._agentic_log_repository.find_by_regulation_fragment_id(
             regulation_fragment_id=regulation_fragment_id,
-            cursor=cursor,
+            after=decode_cursor(cursor) if cursor is not None else None,
             limit=limit,
-            order_date=order_date
+            order_date=order_date,
+            include_prompts=include_prompts
         )
 
-        return [
-            AgenticLogDTO(
-                id=log.id,
-                user_prompt=log.user_prompt,
-                system_prompt=log.system_prompt,
-                message_source=log.message_source,
-                regulation_fragment_id=log.regulation_fragment_id,
-                created_at=log.created_at,
-                is_error=log.is_error
-            )
-            for log in logs
-        ]
+        return AgenticLogPageDTO(
+            logs=[_dto_from_db(log, include_prompts) for log in logs],
+            start_cursor=encode_cursor(logs[0].created_at, logs[0].id) if logs else None,
+            end_cursor=encode_cursor(logs[-1].created_at, logs[-1].id) if logs else None,
+        )
@@ -0,0 +1,134 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import atexit
+import os
+import queue
+import threading
+import time
+from typing import Optional, List
+
+from flask import Flask
+
+from modules.models.application.dto.create_agentic_log_dto import CreateAgenticLogDTO
+from modules.models.infra.agentic_log_repository import AgenticLogRepository
+
+
+class AgenticLogWriter:
+    """
+    Writes agentic logs in batches from a background thread, so LLM calls do not wait for an insert before and after
+    every request. Logs are stamped when they are written, not when they were submitted: a reader following the
+    logs by creation time has possibly seen newer logs already, so a log stamped at submission could end up behind
+    its position and would never be picked up.
+
+    The queue is bounded: if it is full, or the writer is not running, `submit` refuses the log and the caller
+    writes it synchronously. Queued logs are flushed when the writer is stopped, at the latest on interpreter exit.
+    """
+
+    def __init__(self, agentic_log_repository: AgenticLogRepository, enabled: Optional[bool] = None,
+                 queue_size: Optional[int] = None, batch_size: Optional[int] = None,
+                 flush_interval: Optional[float] = None):
+        """
+        :param enabled: Whether logs are written in the background at all. Defaults to AGENTIC_LOG_ASYNC ("true").
+        :param queue_size: Maximum number of queued logs, defaults to AGENTIC_LOG_QUEUE_SIZE (1000).
+        :param batch_size: Maximum number of logs per insert, defaults to AGENTIC_LOG_BATCH_SIZE (50).
+        :param flush_interval: Seconds a log waits for more logs to share its batch, defaults to
+            AGENTIC_LOG_FLUSH_INTERVAL (1).
+        """
+        self._agentic_log_repository = agentic_log_repository
+        self._enabled = enabled if enabled is not None else \
+            os.getenv("AGENTIC_LOG_ASYNC", "true").lower() in ("1", "true", "yes")
+        self._queue: queue.Queue[CreateAgenticLogDTO] = queue.Queue(
+            queue_size or int(os.getenv("AGENTIC_LOG_QUEUE_SIZE", "1000")))
+        self._batch_size = batch_size or int(os.getenv("AGENTIC_LOG_BATCH_SIZE", "50"))
+        self._flush_interval = flush_interval or float(os.getenv("AGENTIC_LOG_FLUSH_INTERVAL", "1"))
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self, app: Flask):
+        """
+        Start the writer thread, which writes inside its own app context.
+        """
+        with self._lock:
+            if not self._enabled or self._thread:
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._work, args=(app,), name="agentic-log-writer", daemon=True)
+            self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stop the writer thread once all queued logs are written.
+        """
+        self._stopped.set()
+        with self._lock:
+            if self._thread:
+                self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, log_data: CreateAgenticLogDTO) -> bool:
+        """
+        Queue a log for writing.
+
+        :return: Whether the log was queued, if not the caller has to write it.
+        """
+        if self._thread is None or self._stopped.is_set():
+            return False
+        try:
+            self._queue.put_nowait(log_data)
+        except queue.Full:
+            return False
+        return True
+
+    def _work(self, app: Flask):
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                if self._stopped.is_set():
+                    return
+                continue
+
+            try:
+                with app.app_context():
+                    self._agentic_log_repository.save_all(batch)
+            except Exception as e:
+                print(f"Failed to write {len(batch)} agentic logs: {e}")
+
+    def _next_batch(self) -> List[CreateAgenticLogDTO]:
+        """
+        Wait for the next log, then collect more until the batch is full or the flush interval is over. Once the
+        writer is stopped, only what is already queued is collected.
+        """
+        try:
+            batch = [self._queue.get(timeout=self._flush_interval)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self._flush_interval
+        while len(batch) < self._batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if self._stopped.is_set() or remaining <= 0:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
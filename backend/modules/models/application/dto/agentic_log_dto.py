@@ -29,7 +29,7 @@ class AgenticLogDTO(BaseModel):
     Data Transfer Object for an agentic log.
 
     id: Unique identifier for the log
-    user_prompt: The prompt issued by the human user
+    user_prompt: The prompt issued by the human user, None if the prompts were not requested
     system_prompt: Optional prompt issued from the application
     message_source: The source of the message (USER, SYSTEM, MODEL)
     regulation_fragment_id: ID of the regulation fragment this log is associated with
@@ -37,7 +37,7 @@ class AgenticLogDTO(BaseModel):
     is_error: Whether this log entry represents an error message
     """
     id: int
-    user_prompt: str
+    user_prompt: Optional[str] = None
     system_prompt: Optional[str] = None
     message_source: MessageSource
     regulation_fragment_id: int
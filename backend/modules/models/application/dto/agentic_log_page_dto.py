@@ -0,0 +1,39 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from modules.models.application.dto.agentic_log_dto import AgenticLogDTO
+
+
+class AgenticLogPageDTO(BaseModel):
+    """
+    Data Transfer Object for a page of agentic logs.
+
+    logs: The logs of the page, in the requested order
+    start_cursor: Opaque position of the first log, pass it with the opposite order to page backwards
+    end_cursor: Opaque position of the last log, pass it with the same order to get the next page
+    """
+    logs: List[AgenticLogDTO]
+    start_cursor: Optional[str] = None
+    end_cursor: Optional[str] = None
+
+    class Config:
+        extra = "forbid"
@@ -16,7 +16,9 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
-from pydantic import BaseModel
+from typing import Optional
+
+from pydantic import BaseModel, PrivateAttr
 
 
 class ChatAgentMessageEgressDTO(BaseModel):
@@ -24,3 +26,9 @@ class ChatAgentMessageEgressDTO(BaseModel):
     is_error: bool = False
     input_tokens: int = 0
     output_tokens: int = 0
+    # Part of input_tokens which was read from the provider's prompt cache
+    cached_input_tokens: int = 0
+    # Set if a streamed response was aborted because it could not become valid, message is then the partial response
+    validation_error: Optional[str] = None
+    # Key of the response cache the response is stored under once the caller accepts it, see LLMAdapter.accept
+    _cache_key: Optional[str] = PrivateAttr(default=None)
@@ -16,10 +16,33 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
+from typing import Tuple
+
 from pydantic import BaseModel
 
+from modules.models.domain.llm_usage_stage import LLMUsageStage
+
 
 class ChatAgentMessageIngressDTO(BaseModel):
     regulation_fragment_id: int
     user_prompt: str
     system_prompt: str = ""
+    # Lengths of the starts of the prompts which are the same across requests and can be cached by the provider
+    system_prompt_cacheable_length: int = 0
+    user_prompt_cacheable_length: int = 0
+    # What the message is sent for, the usage ledger is aggregated per stage
+    stage: LLMUsageStage = LLMUsageStage.OTHER
+
+    def split_system_prompt(self) -> Tuple[str, str]:
+        """
+        The system prompt split into its cacheable prefix and the rest.
+        """
+        return (self.system_prompt[:self.system_prompt_cacheable_length],
+                self.system_prompt[self.system_prompt_cacheable_length:])
+
+    def split_user_prompt(self) -> Tuple[str, str]:
+        """
+        The user prompt split into its cacheable prefix and the rest.
+        """
+        return (self.user_prompt[:self.user_prompt_cacheable_length],
+                self.user_prompt[self.user_prompt_cacheable_length:])
@@ -0,0 +1,51 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+from modules.models.domain.llm_identifier import LLMIdentifier
+from modules.models.domain.llm_usage_stage import LLMUsageStage
+
+
+class CreateLLMUsageDTO(BaseModel):
+    """
+    Data Transfer Object for recording the usage of one LLM call.
+
+    regulation_fragment_id: ID of the regulation fragment the call was made for
+    llm_identifier: The LLM which was called
+    stage: What the call was made for (ATOMS, RULES, EXAMPLES, CHAT, OTHER)
+    input_tokens: Tokens of the prompts
+    output_tokens: Tokens of the response
+    cached_input_tokens: Part of input_tokens which was read from the provider's prompt cache
+    latency_ms: Duration of the call in milliseconds, including retries and the whole stream
+    is_error: Whether the call failed
+    """
+    regulation_fragment_id: Optional[int] = None
+    llm_identifier: LLMIdentifier
+    stage: LLMUsageStage = LLMUsageStage.OTHER
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_input_tokens: int = 0
+    latency_ms: int
+    is_error: bool = False
+
+    class Config:
+        use_enum_values = True
+        extra = "forbid"
@@ -0,0 +1,62 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from modules.models.domain.llm_identifier import LLMIdentifier
+from modules.models.domain.llm_usage_stage import LLMUsageStage
+
+
+class LLMUsageSummaryDTO(BaseModel):
+    """
+    Data Transfer Object for the aggregated usage of a group of LLM calls.
+
+    window_start: Start of the time window, None if not grouped by time
+    llm_identifier: The LLM of the group, None if not grouped by model
+    stage: The stage of the group, None if not grouped by stage
+    calls: Number of calls
+    error_rate: Share of the calls which failed
+    input_tokens: Tokens of the prompts
+    output_tokens: Tokens of the responses
+    cached_input_tokens: Part of input_tokens which was read from the providers' prompt caches
+    cost: Estimated cost in dollars
+    mean_latency_ms: Mean duration of the calls
+    p50_latency_ms: Median duration of the calls
+    p90_latency_ms: 90th percentile of the durations
+    p99_latency_ms: 99th percentile of the durations
+    """
+    window_start: Optional[datetime] = None
+    llm_identifier: Optional[LLMIdentifier] = None
+    stage: Optional[LLMUsageStage] = None
+    calls: int
+    error_rate: float
+    input_tokens: int
+    output_tokens: int
+    cached_input_tokens: int
+    cost: float
+    mean_latency_ms: float
+    p50_latency_ms: Optional[float] = None
+    p90_latency_ms: Optional[float] = None
+    p99_latency_ms: Optional[float] = None
+
+    class Config:
+        use_enum_values = True
+        extra = "forbid"
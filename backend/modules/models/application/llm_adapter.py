@@ -16,13 +16,20 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
-from typing import Dict, Optional, List
+import time
+from typing import Dict, Optional, List, Generator, Tuple
 
 from modules.chat.application.dto.context_message_dto import ContextMessageDTO
 from modules.models.application.agentic_log_service import AgenticLogService
 from modules.models.application.dto.chat_agent_message_egress_dto import ChatAgentMessageEgressDTO
 from modules.models.application.dto.chat_agent_message_ingress_dto import ChatAgentMessageIngressDTO
+from modules.models.application.dto.create_llm_usage_dto import CreateLLMUsageDTO
+from modules.models.application.llm_usage_service import LLMUsageService
+from modules.models.application.streaming_xml_validator import StreamingXmlValidator, InvalidXmlStreamError
 from modules.models.domain.llm_identifier import LLMIdentifier
+from modules.models.domain.prompt_service import PromptService
+from modules.models.infra.llm_response_cache import LLMResponseCache
+from modules.models.infra.rate_limiter import RateLimiter
 from modules.models.infra.services.anthropic_chat_agent import AnthropicAIChatAgent
 from modules.models.infra.services.google_chat_agent import GoogleChatAgent
 from modules.models.infra.services.i_chat_agent import IChatAgent
@@ -36,46 +43,133 @@ class LLMAdapter:
     This class should be extended by specific LLM adapter implementations.
     """
 
-    def __init__(self, agentic_log_service: AgenticLogService, regulation_fragment_service: RegulationFragmentService):
+    def __init__(self, agentic_log_service: AgenticLogService, regulation_fragment_service: RegulationFragmentService,
+                 prompt_service: PromptService, response_cache: Optional[LLMResponseCache] = None,
+                 llm_usage_service: Optional[LLMUsageService] = None):
         self.agents: Dict[str, IChatAgent] = {
             LLMIdentifier.GPT_3_5_TURBO.value: OpenAIChatAgent(
                 agentic_log_service=agentic_log_service,
-                model="gpt-3.5-turbo"),
+                model="gpt-3.5-turbo",
+                rate_limiter=RateLimiter.for_llm(LLMIdentifier.GPT_3_5_TURBO)),
             LLMIdentifier.GPT_4o_MINI.value: OpenAIChatAgent(
                 agentic_log_service=agentic_log_service,
-                model="gpt-4o-mini"),
+                model="gpt-4o-mini",
+                rate_limiter=RateLimiter.for_llm(LLMIdentifier.GPT_4o_MINI)),
             LLMIdentifier.GPT_5.value: OpenAIChatAgent(
                 agentic_log_service=agentic_log_service,
-                model="gpt-5"),
+                model="gpt-5",
+                rate_limiter=RateLimiter.for_llm(LLMIdentifier.GPT_5)),
             LLMIdentifier.GPT_5_MINI.value: OpenAIChatAgent(
                 agentic_log_service=agentic_log_service,
-                model="gpt-5-mini"),
+                model="gpt-5-mini",
+                rate_limiter=RateLimiter.for_llm(LLMIdentifier.GPT_5_MINI)),
             LLMIdentifier.GPT_5_NANO.value: OpenAIChatAgent(
                 agentic_log_service=agentic_log_service,
-                model="gpt-5-nano"),
+                model="gpt-5-nano",
+                rate_limiter=RateLimiter.for_llm(LLMIdentifier.GPT_5_NANO)),
             LLMIdentifier.SONNET_4.value: AnthropicAIChatAgent(
                 agentic_log_service=agentic_log_service,
-                model="claude-sonnet-4-20250514"),
+                model="claude-sonnet-4-20250514",
+                rate_limiter=RateLimiter.for_llm(LLMIdentifier.SONNET_4)),
             LLMIdentifier.GEMINI_2_5_FLASH.value: GoogleChatAgent(
                 agentic_log_service=agentic_log_service,
-                model="gemini-2.5-flash"),
+                model="gemini-2.5-flash",
+                rate_limiter=RateLimiter.for_llm(LLMIdentifier.GEMINI_2_5_FLASH)),
         }
         self.regulation_fragment_service = regulation_fragment_service
+        self.prompt_service = prompt_service
+        self.response_cache = response_cache
+        self.llm_usage_service = llm_usage_service
 
     def send_message(self, message: ChatAgentMessageIngressDTO,
-                     context_messages: Optional[List[ContextMessageDTO]] = None) -> ChatAgentMessageEgressDTO:
+                     context_messages: Optional[List[ContextMessageDTO]] = None,
+                     validator: Optional[StreamingXmlValidator] = None) -> ChatAgentMessageEgressDTO:
         """
         Delegates the message to the appropriate agent based on the regulation fragment's LLM identifier.
-        Intercepts the response to save token usage information to the database.
+        Intercepts the response to save token usage information to the database, and to the usage ledger if there
+        is one.
 
         :param context_messages: Optional list of context messages to include in the request.
         :param message: The message to be sent to the LLM.
-        :return: The response from the LLM with token usage information.
+        :param validator: If given, the response is streamed through the validator and aborted as soon as it can no
+            longer be valid. The partial response is returned with the reason in `validation_error`.
+        :return: The response from the LLM with token usage information. Responses served from the response cache
+            are logged but use no tokens. A response is only cached once it is passed to `accept`.
         """
-        regulation = self.regulation_fragment_service.find_by_id(
-            message.regulation_fragment_id
+        agent, message, llm_identifier = self._prepare(message)
+
+        cache_key = None
+        if self.response_cache is not None and self.response_cache.enabled:
+            cache_key = self.response_cache.key(agent.cache_identity(), message, context_messages)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return agent.replay(message, cached)
+
+        started = time.monotonic()
+        if validator is not None:
+            response = self._send_validated_message(agent, message, context_messages, validator, llm_identifier,
+                                                    started)
+        else:
+            response = agent.send_message(message, context_messages)
+            self._account(message, llm_identifier, response, started)
+
+        if cache_key is not None and not response.is_error and not response.validation_error:
+            response._cache_key = cache_key
+
+        return response
+
+    def accept(self, response: ChatAgentMessageEgressDTO) -> None:
+        """
+        Store a response of `send_message` in the response cache, once the caller could use it. Responses which
+        are rejected, e.g. because they do not parse, are never cached, so a regeneration asks the model again
+        instead of replaying them.
+        """
+        if response._cache_key is not None and self.response_cache is not None:
+            self.response_cache.put(response._cache_key, response)
+
+    def stream_message(self, message: ChatAgentMessageIngressDTO,
+                       context_messages: Optional[List[ContextMessageDTO]] = None
+                       ) -> Generator[str, None, ChatAgentMessageEgressDTO]:
+        """
+        Streaming variant of `send_message`, see `IChatAgent.stream_message`. Tokens are accounted for even if the
+        stream is closed early.
+        """
+        agent, message, llm_identifier = self._prepare(message)
+        started = time.monotonic()
+        return agent.stream_message(
+            message,
+            context_messages,
+            on_finish=lambda response: self._account(message, llm_identifier, response, started)
         )
 
+    def _send_validated_message(self, agent: IChatAgent, message: ChatAgentMessageIngressDTO,
+                                context_messages: Optional[List[ContextMessageDTO]],
+                                validator: StreamingXmlValidator, llm_identifier: str,
+                                started: float) -> ChatAgentMessageEgressDTO:
+        finished: List[ChatAgentMessageEgressDTO] = []
+
+        def on_finish(response: ChatAgentMessageEgressDTO):
+            self._account(message, llm_identifier, response, started)
+            finished.append(response)
+
+        stream = agent.stream_message(message, context_messages, on_finish=on_finish)
+        try:
+            for chunk in stream:
+                validator.feed(chunk)
+        except InvalidXmlStreamError as e:
+            stream.close()
+            print(f"Aborted response for regulation fragment {message.regulation_fragment_id}: {str(e)}")
+            return finished[0].model_copy(update={"validation_error": str(e)})
+
+        return finished[0]
+
+    def _prepare(self, message: ChatAgentMessageIngressDTO) -> Tuple[IChatAgent, ChatAgentMessageIngressDTO, str]:
+        """
+        Find the agent for the message's regulation fragment and mark the static prefixes of the prompts, which the
+        agents let the providers cache. The LLM identifier of the fragment is returned along with the agent.
+        """
+        regulation = self.regulation_fragment_service.find_by_id(message.regulation_fragment_id)
+
         if regulation is None:
             raise ValueError(f"Regulation fragment with ID {message.regulation_fragment_id} not found.")
 
@@ -83,11 +177,31 @@ class LLMAdapter:
         if agent is None:
             raise ValueError(f"No agent found for LLM identifier {regulation.llm_identifier}.")
 
-        response = agent.send_message(message, context_messages)
+        prompt_adapter = self.prompt_service.get(regulation.formalism)
+        message = message.model_copy(update={
+            "system_prompt_cacheable_length": len(prompt_adapter.cacheable_prefix(message.system_prompt)),
+            "user_prompt_cacheable_length": len(prompt_adapter.cacheable_prefix(message.user_prompt)),
+        })
+
+        return agent, message, regulation.llm_identifier
+
+    def _account(self, message: ChatAgentMessageIngressDTO, llm_identifier: str,
+                 response: ChatAgentMessageEgressDTO, started: float):
         self.regulation_fragment_service.increment_tokens(
             message.regulation_fragment_id,
             response.input_tokens,
-            response.output_tokens
+            response.output_tokens,
+            response.cached_input_tokens,
         )
 
-        return response
+        if self.llm_usage_service is not None:
+            self.llm_usage_service.record(CreateLLMUsageDTO(
+                regulation_fragment_id=message.regulation_fragment_id,
+                llm_identifier=llm_identifier,
+                stage=message.stage,
+                input_tokens=response.input_tokens,
+                output_tokens=response.output_tokens,
+                cached_input_tokens=response.cached_input_tokens,
+                latency_ms=round((time.monotonic() - started) * 1000),
+                is_error=response.is_error,
+            ))
@@ -0,0 +1,133 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Tuple
+
+from modules.models.application.dto.create_llm_usage_dto import CreateLLMUsageDTO
+from modules.models.application.dto.llm_usage_summary_dto import LLMUsageSummaryDTO
+from modules.models.domain.llm_identifier import llm_costs, LLMIdentifier
+from modules.models.infra.llm_usage_repository import LLMUsageRepository, Window
+
+GROUPINGS = ("model", "stage")
+WINDOWS = ("hour", "day")
+# Columns of the hourly rollup which are summed per group
+_SUMMED = ("calls", "errors", "input_tokens", "output_tokens", "cached_input_tokens", "latency_ms")
+
+
+def _to_hour(moment: datetime, up: bool = False) -> datetime:
+    """
+    Round a moment to a whole hour in UTC, the ledger stores naive UTC times.
+    """
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    hour = moment.replace(minute=0, second=0, microsecond=0)
+    return hour + timedelta(hours=1) if up and hour != moment else hour
+
+
+class LLMUsageService:
+    """
+    Keeps the usage ledger of the LLM calls and aggregates it for cost and throughput analytics. Recording can be
+    turned off with LLM_USAGE_LEDGER=false, the token counts of the fragments are kept either way.
+    """
+
+    def __init__(self, llm_usage_repository: LLMUsageRepository, enabled: Optional[bool] = None):
+        """
+        :param enabled: Whether the calls are recorded at all. Defaults to LLM_USAGE_LEDGER ("true").
+        """
+        self._llm_usage_repository = llm_usage_repository
+        self.enabled = enabled if enabled is not None else \
+            os.getenv("LLM_USAGE_LEDGER", "true").lower() in ("1", "true", "yes")
+
+    def record(self, usage_data: CreateLLMUsageDTO):
+        """
+        Record the usage of an LLM call, if the ledger is enabled.
+        """
+        if self.enabled:
+            self._llm_usage_repository.save(usage_data)
+
+    def summarize(self, since: Optional[datetime] = None, until: Optional[datetime] = None,
+                  group_by: Optional[List[str]] = None, window: Optional[Window] = None) -> List[LLMUsageSummaryDTO]:
+        """
+        Aggregate the ledger. Totals and costs are summed from the hourly rollup, so the range is widened to whole
+        hours; latency percentiles are computed from the calls of the same range.
+
+        Args:
+            since: Start of the range, defaults to seven days before until
+            until: End of the range (exclusive), defaults to now
+            group_by: Any of "model" and "stage", nothing sums all calls of a window
+            window: "hour" or "day" to group by time windows as well, None for the whole range
+
+        Returns:
+            One summary per group, ordered by window, model and stage
+
+        Raises:
+            ValueError: If the grouping or window is unknown or the range is empty
+        """
+        group_by = group_by or []
+        unknown = [grouping for grouping in group_by if grouping not in GROUPINGS]
+        if unknown:
+            raise ValueError(f"Unknown grouping {', '.join(unknown)}, use any of {', '.join(GROUPINGS)}")
+        if window is not None and window not in WINDOWS:
+            raise ValueError(f"Unknown window {window}, use one of {', '.join(WINDOWS)}")
+
+        until = _to_hour(until or datetime.now(timezone.utc), up=True)
+        since = _to_hour(since) if since else until - timedelta(days=7)
+        if since >= until:
+            raise ValueError("The start of the range must be before its end")
+
+        by_model = "model" in group_by
+        by_stage = "stage" in group_by
+
+        totals: Dict[Tuple, Dict[str, float]] = {}
+        for row in self._llm_usage_repository.sum_hourly(since, until, window):
+            key = (row.window_start, row.llm_identifier if by_model else None, row.stage if by_stage else None)
+            group = totals.setdefault(key, dict.fromkeys(_SUMMED + ("cost",), 0))
+            for column in _SUMMED:
+                group[column] += getattr(row, column)
+            # Prices differ per model, so the cost is summed per model even if the group spans several
+            group["cost"] += llm_costs[LLMIdentifier(row.llm_identifier)].estimate(
+                row.input_tokens, row.output_tokens, row.cached_input_tokens)
+
+        percentiles = {
+            (row.window_start, row.llm_identifier, row.stage): row
+            for row in self._llm_usage_repository.latency_percentiles(since, until, window, by_model, by_stage)
+        }
+
+        summaries = []
+        for key in sorted(totals, key=lambda k: tuple("" if part is None else part for part in k)):
+            group = totals[key]
+            latencies = percentiles.get(key)
+            summaries.append(LLMUsageSummaryDTO(
+                window_start=key[0],
+                llm_identifier=key[1],
+                stage=key[2],
+                calls=group["calls"],
+                error_rate=group["errors"] / group["calls"] if group["calls"] else 0,
+                input_tokens=group["input_tokens"],
+                output_tokens=group["output_tokens"],
+                cached_input_tokens=group["cached_input_tokens"],
+                cost=group["cost"],
+                mean_latency_ms=group["latency_ms"] / group["calls"] if group["calls"] else 0,
+                p50_latency_ms=latencies.p50 if latencies else None,
+                p90_latency_ms=latencies.p90 if latencies else None,
+                p99_latency_ms=latencies.p99 if latencies else None,
+            ))
+
+        return summaries
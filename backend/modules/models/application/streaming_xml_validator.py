@@ -0,0 +1,85 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Dict, Optional, Set, List
+
+from lxml import etree
+
+
+class InvalidXmlStreamError(ValueError):
+    """
+    Raised as soon as a streamed response can no longer become the expected XML document.
+    """
+
+
+class StreamingXmlValidator:
+    """
+    Incrementally checks a streamed LLM response against the rough structure of the expected XML document, so a
+    response which is clearly broken (prose before the root element, a markdown fence, malformed or unexpected tags)
+    can be aborted long before the model is done writing it.
+
+    The checks never reject anything the final pydantic-xml parsing would accept. Validators are single use.
+    """
+
+    def __init__(self, root: str, children: Optional[Dict[str, Set[str]]] = None):
+        """
+        :param root: Tag of the expected root element.
+        :param children: Allowed child tags per tag. Elements whose tag is not a key may contain anything, so
+            only models forbidding extra elements should list their tags.
+        """
+        self._root = root
+        self._children = children or {}
+        self._parser = etree.XMLPullParser(events=("start", "end"))
+        self._open: List[str] = []
+        self._error: Optional[str] = None
+
+    def feed(self, chunk: str):
+        """
+        Check the next chunk of the response.
+
+        :raises InvalidXmlStreamError: If the response can no longer be valid.
+        """
+        if self._error:
+            raise InvalidXmlStreamError(self._error)
+
+        try:
+            self._parser.feed(chunk)
+            for event, element in self._parser.read_events():
+                if event == "end":
+                    self._open.pop()
+                    continue
+                self._check_start(element.tag)
+                self._open.append(element.tag)
+        except etree.XMLSyntaxError as e:
+            self._fail(f"Invalid XML: {e}")
+
+    def _check_start(self, tag: str):
+        if not self._open:
+            if tag != self._root:
+                self._fail(f"Expected the root element <{self._root}>, found <{tag}>.")
+            return
+
+        parent = self._open[-1]
+        allowed = self._children.get(parent)
+        if allowed is not None and tag not in allowed:
+            self._fail(f"Unexpected element <{tag}> in <{parent}>, expected one of "
+                       f"{', '.join(f'<{t}>' for t in sorted(allowed)) or 'no elements'}.")
+
+    def _fail(self, error: str):
+        self._error = error
+        raise InvalidXmlStreamError(error)
@@ -0,0 +1,86 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+from datetime import datetime, timezone
+import unittest
+from unittest.mock import MagicMock
+
+from modules.models.application.agentic_log_service import AgenticLogService
+from modules.models.application.agentic_log_writer import AgenticLogWriter
+from modules.models.application.dto.create_agentic_log_dto import CreateAgenticLogDTO
+from modules.models.domain.message_source import MessageSource
+
+
+def _log(prompt: str) -> CreateAgenticLogDTO:
+    return CreateAgenticLogDTO(user_prompt=prompt, message_source=MessageSource.MODEL_RESPONSE,
+                               regulation_fragment_id=1)
+
+
+class TestAgenticLogWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.repository = MagicMock()
+        self.writer = AgenticLogWriter(self.repository, enabled=True, queue_size=2, batch_size=10,
+                                       flush_interval=0.05)
+
+    def tearDown(self):
+        self.writer.stop()
+
+    def _written(self):
+        return [log_data.user_prompt for call in self.repository.save_all.call_args_list
+                for log_data in call.args[0]]
+
+    def test_refuses_logs_when_not_started(self):
+        self.assertFalse(self.writer.submit(_log("a")))
+
+    def test_writes_queued_logs_in_one_batch(self):
+        self.writer.start(MagicMock())
+
+        self.assertTrue(self.writer.submit(_log("a")))
+        self.assertTrue(self.writer.submit(_log("b")))
+        time.sleep(0.2)
+
+        self.repository.save_all.assert_called_once()
+        self.assertEqual(self._written(), ["a", "b"])
+
+    def test_stop_flushes_and_refuses_further_logs(self):
+        self.writer.start(MagicMock())
+        self.writer.submit(_log("a"))
+
+        self.writer.stop()
+
+        self.assertEqual(self._written(), ["a"])
+        self.assertFalse(self.writer.submit(_log("b")))
+
+    def test_service_writes_synchronously_if_queue_is_full(self):
+        writer = MagicMock()
+        writer.submit.return_value = False
+        service = AgenticLogService(self.repository, writer)
+        self.repository.save.return_value = MagicMock(id=1, message_source=MessageSource.MODEL_RESPONSE,
+                                                      user_prompt="a", system_prompt=None,
+                                                      regulation_fragment_id=1, is_error=False,
+                                                      created_at=datetime.now(timezone.utc))
+
+        service.log(_log("a"))
+
+        self.repository.save.assert_called_once_with(_log("a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from modules.models.application.dto.chat_agent_message_egress_dto import ChatAgentMessageEgressDTO
+from modules.models.application.dto.chat_agent_message_ingress_dto import ChatAgentMessageIngressDTO
+from modules.models.application.llm_adapter import LLMAdapter
+from modules.models.infra.llm_response_cache import LLMResponseCache
+
+
+class TestLLMAdapterResponseCache(unittest.TestCase):
+    """Responses are only cached once the caller accepts them."""
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.agent = MagicMock()
+        self.agent.cache_identity.return_value = "agent:model:0"
+        self.agent.replay.side_effect = lambda message, response: response
+
+        prompt_adapter = MagicMock()
+        prompt_adapter.cacheable_prefix.return_value = ""
+        regulation_fragment_service = MagicMock()
+        regulation_fragment_service.find_by_id.return_value = SimpleNamespace(llm_identifier="model", formalism=None)
+
+        # The constructor creates clients for every provider, only the attributes used here are set
+        self.adapter = LLMAdapter.__new__(LLMAdapter)
+        self.adapter.agents = {"model": self.agent}
+        self.adapter.regulation_fragment_service = regulation_fragment_service
+        self.adapter.prompt_service = MagicMock(get=MagicMock(return_value=prompt_adapter))
+        self.adapter.response_cache = LLMResponseCache(self._directory.name, enabled=True, ttl=60, max_bytes=10_000)
+        self.adapter.llm_usage_service = None
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def _send(self) -> ChatAgentMessageEgressDTO:
+        return self.adapter.send_message(ChatAgentMessageIngressDTO(user_prompt="prompt", regulation_fragment_id=1))
+
+    def test_rejected_responses_are_not_replayed(self):
+        """A response the caller did not accept is requested again."""
+        self.agent.send_message.side_effect = [
+            ChatAgentMessageEgressDTO(message="rejected"),
+            ChatAgentMessageEgressDTO(message="accepted"),
+        ]
+
+        self.assertEqual(self._send().message, "rejected")
+        response = self._send()
+        self.assertEqual(response.message, "accepted")
+        self.adapter.accept(response)
+
+        self.assertEqual(self._send().message, "accepted")
+        self.assertEqual(self.agent.send_message.call_count, 2)
+        self.agent.replay.assert_called_once()
+
+    def test_errors_are_never_cached(self):
+        """Accepting an error response does not cache it."""
+        self.agent.send_message.return_value = ChatAgentMessageEgressDTO(message="failed", is_error=True)
+
+        self.adapter.accept(self._send())
+        self._send()
+
+        self.assertEqual(self.agent.send_message.call_count, 2)
+        self.agent.replay.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from modules.models.application.llm_usage_service import LLMUsageService
+from modules.models.domain.llm_identifier import LLMIdentifier, llm_costs
+from modules.models.domain.llm_usage_stage import LLMUsageStage
+
+
+def _bucket(llm_identifier: LLMIdentifier, stage: LLMUsageStage, calls: int, errors: int, input_tokens: int,
+            output_tokens: int, latency_ms: int, window_start=None) -> SimpleNamespace:
+    return SimpleNamespace(window_start=window_start, llm_identifier=llm_identifier, stage=stage, calls=calls,
+                           errors=errors, input_tokens=input_tokens, output_tokens=output_tokens,
+                           cached_input_tokens=0, latency_ms=latency_ms)
+
+
+class TestLLMUsageService(unittest.TestCase):
+
+    def setUp(self):
+        self.repository = MagicMock()
+        self.repository.sum_hourly.return_value = [
+            _bucket(LLMIdentifier.GPT_5, LLMUsageStage.ATOMS, 2, 0, 1000, 100, 400),
+            _bucket(LLMIdentifier.GPT_5, LLMUsageStage.RULES, 1, 1, 500, 50, 100),
+            _bucket(LLMIdentifier.SONNET_4, LLMUsageStage.ATOMS, 1, 0, 800, 80, 300),
+        ]
+        self.repository.latency_percentiles.return_value = []
+        self.service = LLMUsageService(self.repository, enabled=True)
+
+    def test_folds_the_buckets_into_the_requested_groups(self):
+        summaries = self.service.summarize(group_by=["stage"])
+
+        self.assertEqual([summary.stage for summary in summaries], ["ATOMS", "RULES"])
+        atoms = summaries[0]
+        self.assertEqual(atoms.calls, 3)
+        self.assertEqual(atoms.input_tokens, 1800)
+        self.assertAlmostEqual(atoms.mean_latency_ms, 700 / 3)
+        self.assertEqual(summaries[1].error_rate, 1)
+
+    def test_prices_every_model_separately(self):
+        summary, = self.service.summarize()
+
+        expected = (llm_costs[LLMIdentifier.GPT_5].estimate(1500, 150)
+                    + llm_costs[LLMIdentifier.SONNET_4].estimate(800, 80))
+        self.assertAlmostEqual(summary.cost, expected)
+        self.assertIsNone(summary.llm_identifier)
+
+    def test_adds_the_latency_percentiles_of_the_group(self):
+        self.repository.latency_percentiles.return_value = [
+            SimpleNamespace(window_start=None, llm_identifier=LLMIdentifier.SONNET_4, stage=None, p50=300.0,
+                            p90=300.0, p99=300.0),
+        ]
+
+        summaries = self.service.summarize(group_by=["model"])
+
+        self.assertEqual([summary.p50_latency_ms for summary in summaries], [None, 300.0])
+
+    def test_widens_the_range_to_whole_hours(self):
+        self.service.summarize(since=datetime(2026, 1, 1, 10, 30, tzinfo=timezone.utc),
+                               until=datetime(2026, 1, 1, 12, 15, tzinfo=timezone.utc), window="hour")
+
+        self.repository.sum_hourly.assert_called_once_with(datetime(2026, 1, 1, 10), datetime(2026, 1, 1, 13),
+                                                           "hour")
+
+    def test_rejects_unknown_groupings_and_windows(self):
+        with self.assertRaises(ValueError):
+            self.service.summarize(group_by=["fragment"])
+        with self.assertRaises(ValueError):
+            self.service.summarize(window="week")
+
+
+if __name__ == "__main__":
+    unittest.main()
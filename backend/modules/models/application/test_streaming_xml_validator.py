@@ -0,0 +1,80 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+from modules.atoms.application.dto.atom_extraction_result_dto import AtomExtractionResultDTO
+from modules.explanations.application.dto.example_generation_dto import ExamplesDTO
+from modules.models.application.streaming_xml_validator import InvalidXmlStreamError
+
+
+def _feed(validator, text: str, chunk_size: int = 3):
+    for i in range(0, len(text), chunk_size):
+        validator.feed(text[i:i + chunk_size])
+
+
+class TestStreamingXmlValidator(unittest.TestCase):
+
+    def test_accepts_valid_examples(self):
+        text = ('\n<examples><example><description>A buyer</description><facts><fact><predicate>buyer(X)</predicate>'
+                '<arguments><argument><variable>X</variable><value>alice</value></argument></arguments>'
+                '</fact></facts></example></examples>\n')
+        _feed(ExamplesDTO.streaming_validator(), text)
+        ExamplesDTO.from_xml(text)
+
+    def test_accepts_annotated_atoms(self):
+        text = ('<result><annotated>The <atom id="1">seller</atom> must</annotated>'
+                '<atoms><atom id="1"><predicate>seller(X)</predicate><description>d</description></atom></atoms>'
+                '</result>')
+        _feed(AtomExtractionResultDTO.streaming_validator(), text)
+
+    def test_rejects_prose_before_root(self):
+        validator = ExamplesDTO.streaming_validator()
+        with self.assertRaises(InvalidXmlStreamError):
+            _feed(validator, "Here are the examples: <examples>")
+
+    def test_rejects_markdown_fence(self):
+        with self.assertRaises(InvalidXmlStreamError):
+            _feed(AtomExtractionResultDTO.streaming_validator(), "```xml\n<result>")
+
+    def test_rejects_wrong_root(self):
+        with self.assertRaisesRegex(InvalidXmlStreamError, "<result>"):
+            _feed(AtomExtractionResultDTO.streaming_validator(), "<atoms><atom id='1'>")
+
+    def test_rejects_element_in_text_value(self):
+        with self.assertRaisesRegex(InvalidXmlStreamError, "Unexpected element <b> in <description>"):
+            _feed(ExamplesDTO.streaming_validator(), "<examples><example><description>A <b>buyer</b>")
+
+    def test_rejects_mismatched_tags_before_end(self):
+        with self.assertRaises(InvalidXmlStreamError):
+            _feed(ExamplesDTO.streaming_validator(), "<examples><example></examples><example>")
+
+    def test_rejects_content_after_root(self):
+        with self.assertRaises(InvalidXmlStreamError):
+            _feed(ExamplesDTO.streaming_validator(), "<examples></examples> Let me know if")
+
+    def test_stays_invalid(self):
+        validator = ExamplesDTO.streaming_validator()
+        with self.assertRaises(InvalidXmlStreamError):
+            validator.feed("oops")
+        with self.assertRaises(InvalidXmlStreamError):
+            validator.feed("<examples>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -33,8 +33,7 @@ class IPromptAdapter(ABC):
     @abstractmethod
     def chat_system_prompt(self,
                            regulation_content: str,
-                           atoms: List[AtomDTO],
-                           rules: List[RuleDTO],
+                           knowledge_base: str,
                            ) -> str:
         raise NotImplementedError()
 
@@ -101,6 +100,17 @@ class IPromptAdapter(ABC):
                                         ) -> str:
         raise NotImplementedError()
 
+    @abstractmethod
+    def cacheable_prefix(self, prompt: str) -> str:
+        """
+        The start of a prompt which is the same for every prompt of its kind (e.g., the static instructions of a
+        template before the regulation is formatted in), so providers can cache it across requests.
+
+        :param prompt: A prompt created by this adapter.
+        :return: The stable prefix, empty if the prompt is not known to this adapter.
+        """
+        raise NotImplementedError()
+
     @staticmethod
     def _atoms_to_xml(
             fragment_content: str,
@@ -18,6 +18,7 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import Optional
 
 
 class LLMIdentifier(str, Enum):
@@ -38,17 +39,30 @@ class LLMCost:
     # Dollars per 1M tokens
     input_cost: float
     output_cost: float
+    # Price of input tokens read from the provider's prompt cache, the normal input price if there is no discount
+    cached_input_cost: Optional[float] = None
+
+    def estimate(self, input_tokens: int, output_tokens: int, cached_input_tokens: int = 0) -> float:
+        """
+        Estimate the cost in dollars of the given token usage.
+
+        :param cached_input_tokens: The part of input_tokens read from the prompt cache.
+        """
+        cached_input_cost = self.input_cost if self.cached_input_cost is None else self.cached_input_cost
+        return (self.input_cost * (input_tokens - cached_input_tokens)
+                + cached_input_cost * cached_input_tokens
+                + self.output_cost * output_tokens) / 1_000_000
 
 
 llm_costs: dict[LLMIdentifier, LLMCost] = {
     # Prices are in dollars per 1 million tokens
     LLMIdentifier.GPT_3_5_TURBO: LLMCost(0.5, 1.5),
-    LLMIdentifier.GPT_4o_MINI: LLMCost(0.15, 0.60),
-    LLMIdentifier.GPT_5: LLMCost(1.25, 10),
-    LLMIdentifier.GPT_5_MINI: LLMCost(0.25, 2.00),
-    LLMIdentifier.GPT_5_NANO: LLMCost(0.05, 0.40),
-    LLMIdentifier.SONNET_4: LLMCost(3, 15),
-    LLMIdentifier.GEMINI_2_5_FLASH: LLMCost(0.30, 2.50),
+    LLMIdentifier.GPT_4o_MINI: LLMCost(0.15, 0.60, 0.075),
+    LLMIdentifier.GPT_5: LLMCost(1.25, 10, 0.125),
+    LLMIdentifier.GPT_5_MINI: LLMCost(0.25, 2.00, 0.025),
+    LLMIdentifier.GPT_5_NANO: LLMCost(0.05, 0.40, 0.005),
+    LLMIdentifier.SONNET_4: LLMCost(3, 15, 0.30),
+    LLMIdentifier.GEMINI_2_5_FLASH: LLMCost(0.30, 2.50, 0.03),
 }
 
 for v in LLMIdentifier:
@@ -16,6 +16,7 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
+from string import Formatter
 from typing import List, Optional
 
 from modules.atoms.application.atom_util import atoms_to_dynamic_statement
@@ -62,14 +63,28 @@ class PrologPromptAdapter(IPromptAdapter):
         with open("./prompts/example_generation/prolog_retry_1.txt", "r", encoding="utf-8") as file:
             self._example_generation_retry_prompt = file.read()
 
+        # Everything before the first placeholder of a template is the same for all prompts created from it
+        self._static_prefixes = sorted({
+            next(Formatter().parse(template))[0] for template in [
+                self._atom_generation_prompt,
+                self._atom_regeneration_prompt,
+                self._atom_regeneration_retry_prompt,
+                self._atom_generation_retry_prompt,
+                self._rule_extraction_prompt,
+                self._rule_extraction_retry_prompt,
+                self._rule_regeneration_prompt,
+                self._chat_prompt,
+                self._example_generation_prompt,
+                self._example_generation_retry_prompt,
+            ]
+        } - {""}, key=len, reverse=True)
+
+    def cacheable_prefix(self, prompt: str) -> str:
+        return next((prefix for prefix in self._static_prefixes if prompt.startswith(prefix)), "")
+
     def chat_system_prompt(self,
                            regulation_content: str,
-                           atoms: List[AtomDTO],
-                           rules: List[RuleDTO]) -> str:
-        atoms = atoms or []
-        rules = rules or []
-        knowledge_base = format_prolog_knowledge_base(atoms, rules)
-
+                           knowledge_base: str) -> str:
         return self._chat_prompt.format(
             regulation_content,
             knowledge_base,
@@ -0,0 +1,58 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+from modules.models.domain.llm_identifier import LLMCost
+from modules.models.domain.prolog_prompt_adapter import PrologPromptAdapter
+
+
+class TestPrologPromptAdapter(unittest.TestCase):
+    def setUp(self):
+        self.adapter = PrologPromptAdapter()
+
+    def test_cacheable_prefix_ends_before_the_regulation(self):
+        regulation = "The seller {must} pay."
+        prompt = self.adapter.atom_extraction_prompt(regulation)
+
+        prefix = self.adapter.cacheable_prefix(prompt)
+
+        self.assertTrue(prefix)
+        self.assertTrue(prompt.startswith(prefix))
+        self.assertNotIn(regulation, prefix)
+        self.assertEqual(prefix, self.adapter.cacheable_prefix(self.adapter.atom_extraction_prompt("Other text.")))
+
+    def test_cacheable_prefix_of_unknown_prompt_is_empty(self):
+        self.assertEqual("", self.adapter.cacheable_prefix("What is the meaning of this regulation?"))
+
+
+class TestLLMCost(unittest.TestCase):
+    def test_estimate_uses_cached_input_price(self):
+        cost = LLMCost(input_cost=1.0, output_cost=10.0, cached_input_cost=0.1)
+
+        self.assertAlmostEqual(cost.estimate(1_000_000, 0, 500_000), 0.55)
+        self.assertAlmostEqual(cost.estimate(0, 1_000_000), 10.0)
+
+    def test_estimate_without_cache_discount(self):
+        cost = LLMCost(input_cost=1.0, output_cost=10.0)
+
+        self.assertAlmostEqual(cost.estimate(1_000_000, 0, 500_000), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
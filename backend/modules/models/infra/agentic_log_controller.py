@@ -39,22 +39,29 @@ def get_by_id(log_id: str):
 
 @agentic_log_controller.get('/regulation-fragments/<fragment_id>/agentic-logs')
 def get_by_regulation_fragment_id(fragment_id: str):
-    # Extract cursor and limit from query parameters
+    # Extract cursor and limit from query parameters, the cursor is opaque
     cursor = request.args.get('cursor')
     limit = request.args.get('limit')
 
     # Convert parameters to appropriate types if they exist
-    cursor_id = int(cursor) if cursor is not None else None
     limit_val = int(limit) if limit is not None else None
 
     order_date = "asc" if request.args.get('order-date') == "asc" else "desc"
-
-    return [log.model_dump() for log in container.agentic_log_service().find_by_regulation_fragment_id(
-        regulation_fragment_id=int(fragment_id),
-        cursor=cursor_id,
-        limit=limit_val,
-        order_date=order_date
-    )]
+    # Without prompts only the metadata is returned, the prompts can be fetched per log
+    include_prompts = request.args.get('include-prompts') != "false"
+
+    try:
+        page = container.agentic_log_service().find_by_regulation_fragment_id(
+            regulation_fragment_id=int(fragment_id),
+            cursor=cursor,
+            limit=limit_val,
+            order_date=order_date,
+            include_prompts=include_prompts
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return page.model_dump()
 
 
 @agentic_log_controller.post('/agentic-logs')
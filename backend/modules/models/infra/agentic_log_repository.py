@@ -16,13 +16,17 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
-from typing import Optional, List, Literal
+from datetime import datetime
+from typing import Optional, List, Literal, Tuple
 
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import desc
+from sqlalchemy import desc, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import selectinload, load_only
 
-from db_models import AgenticLog
+from db_models import AgenticLog, PromptBlob
 from modules.models.application.dto.create_agentic_log_dto import CreateAgenticLogDTO
+from modules.models.infra.prompt_blob_codec import encode_prompt
 
 
 class AgenticLogRepository:
@@ -38,29 +42,75 @@ class AgenticLogRepository:
         """
         Create a new agentic log in the database.
         """
-        agentic_log = AgenticLog(
-            user_prompt=log_data.user_prompt,
-            system_prompt=log_data.system_prompt,
-            message_source=log_data.message_source,
-            regulation_fragment_id=log_data.regulation_fragment_id,
-            is_error=log_data.is_error
-        )
+        agentic_log = self._store_prompts([log_data])[0]
 
         self.db.session.add(agentic_log)
         self.db.session.commit()
 
         return agentic_log
 
-    def find_by_regulation_fragment_id(self, regulation_fragment_id: int, cursor: Optional[int] = None,
-                                       limit: Optional[int] = None, order_date: Literal["asc", "desc"] = "asc") -> List[
-        AgenticLog]:
+    def save_all(self, logs: List[CreateAgenticLogDTO]):
         """
-        Retrieve agentic logs for a specific regulation fragment, ordered by creation date.
+        Create several agentic logs in one transaction, stamped with the time they are written at.
+        """
+        try:
+            agentic_logs = self._store_prompts(logs)
+
+            self.db.session.add_all(agentic_logs)
+            self.db.session.commit()
+        except Exception:
+            self.db.session.rollback()
+            raise
+
+    def _store_prompts(self, logs: List[CreateAgenticLogDTO]) -> List[AgenticLog]:
+        """
+        Insert the prompts of the logs into the prompt blob table, prompts which are already stored are skipped.
+
+        :return: The (unsaved) agentic logs referencing their prompt blobs.
+        """
+        blobs = {}
+        agentic_logs = []
+        for log_data in logs:
+            hashes = []
+            for prompt in (log_data.user_prompt, log_data.system_prompt):
+                if prompt is None:
+                    hashes.append(None)
+                    continue
+                prompt_hash, content, size = encode_prompt(prompt)
+                blobs[prompt_hash] = {"hash": prompt_hash, "content": content, "size": size}
+                hashes.append(prompt_hash)
+
+            agentic_logs.append(AgenticLog(
+                user_prompt_hash=hashes[0],
+                system_prompt_hash=hashes[1],
+                message_source=log_data.message_source,
+                regulation_fragment_id=log_data.regulation_fragment_id,
+                is_error=log_data.is_error
+            ))
+
+        if blobs:
+            self.db.session.execute(insert(PromptBlob).values(list(blobs.values())).on_conflict_do_nothing())
+
+        return agentic_logs
+
+    def find_by_id(self, log_id: int) -> Optional[AgenticLog]:
+        return self.db.session.get(AgenticLog, log_id)
+
+    def find_by_regulation_fragment_id(self, regulation_fragment_id: int,
+                                       after: Optional[Tuple[datetime, int]] = None, limit: Optional[int] = None,
+                                       order_date: Literal["asc", "desc"] = "asc",
+                                       include_prompts: bool = True) -> List[AgenticLog]:
+        """
+        Retrieve agentic logs for a specific regulation fragment, ordered by creation date and ID. The order and
+        the keyset pagination are served by the (regulation_fragment_id, created_at, id) index.
 
         Args:
             regulation_fragment_id: ID of the regulation fragment
-            cursor: Optional ID to start retrieving logs after (for pagination)
+            after: Optional (created_at, id) position to start retrieving logs after in the given order
             limit: Optional maximum number of logs to retrieve
+            order_date: Order of logs by creation date, either "asc" or "desc"
+            include_prompts: Whether to load the prompt blobs along with the logs, otherwise only the metadata
+                columns are loaded
 
         Returns:
             List of agentic logs
@@ -68,19 +118,30 @@ class AgenticLogRepository:
 
         query = AgenticLog.query.filter_by(regulation_fragment_id=regulation_fragment_id)
 
-        if cursor is not None:
-            cursor_log = AgenticLog.query.get(cursor)
-            if cursor_log:
-                if order_date == "asc":
-                    query = query.filter(AgenticLog.created_at > cursor_log.created_at)
-                else:
-                    query = query.filter(AgenticLog.created_at < cursor_log.created_at)
+        if after is not None:
+            position = tuple_(AgenticLog.created_at, AgenticLog.id)
+            query = query.filter(position > tuple_(*after) if order_date == "asc" else position < tuple_(*after))
 
-        query = query.order_by(
-            AgenticLog.created_at.asc() if order_date == "asc" else
-            AgenticLog.created_at.desc())
+        if order_date == "asc":
+            query = query.order_by(AgenticLog.created_at.asc(), AgenticLog.id.asc())
+        else:
+            query = query.order_by(AgenticLog.created_at.desc(), AgenticLog.id.desc())
 
         if limit is not None:
             query = query.limit(limit)
 
+        if include_prompts:
+            query = query.options(
+                selectinload(AgenticLog.user_prompt_blob),
+                selectinload(AgenticLog.system_prompt_blob)
+            )
+        else:
+            query = query.options(load_only(
+                AgenticLog.id,
+                AgenticLog.regulation_fragment_id,
+                AgenticLog.created_at,
+                AgenticLog.message_source,
+                AgenticLog.is_error
+            ))
+
         return query.all()
@@ -0,0 +1,131 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Optional, List
+
+from modules.chat.application.dto.context_message_dto import ContextMessageDTO
+from modules.models.application.dto.chat_agent_message_egress_dto import ChatAgentMessageEgressDTO
+from modules.models.application.dto.chat_agent_message_ingress_dto import ChatAgentMessageIngressDTO
+
+
+class LLMResponseCache:
+    """
+    File based cache of LLM responses, shared by all workers on the same host. Responses are addressed by a hash of
+    everything which determines them: the model and its sampling settings, the prompts and the context messages.
+
+    Entries expire after a TTL, and the oldest entries are evicted once the cache grows beyond its size limit.
+    The cache is opt-in, as a cached response is returned even if the model would answer differently today.
+    """
+
+    def __init__(self, directory: Optional[str] = None, enabled: Optional[bool] = None, ttl: Optional[float] = None,
+                 max_bytes: Optional[int] = None):
+        """
+        :param directory: Directory for the cache files. Defaults to LLM_RESPONSE_CACHE_DIR or a directory in the
+            temporary directory of the system.
+        :param enabled: Whether responses are cached at all. Defaults to LLM_RESPONSE_CACHE ("false").
+        :param ttl: Seconds after which an entry expires. Defaults to LLM_RESPONSE_CACHE_TTL (one day).
+        :param max_bytes: Size limit of all entries together. Defaults to LLM_RESPONSE_CACHE_MAX_BYTES (100 MB).
+        """
+        self._directory = directory or os.getenv(
+            "LLM_RESPONSE_CACHE_DIR",
+            os.path.join(tempfile.gettempdir(), "llm-response-cache")
+        )
+        self.enabled = enabled if enabled is not None else \
+            os.getenv("LLM_RESPONSE_CACHE", "false").lower() in ("1", "true", "yes")
+        self._ttl = ttl or float(os.getenv("LLM_RESPONSE_CACHE_TTL", str(24 * 60 * 60)))
+        self._max_bytes = max_bytes or int(os.getenv("LLM_RESPONSE_CACHE_MAX_BYTES", str(100 * 1024 * 1024)))
+        if self.enabled:
+            os.makedirs(self._directory, exist_ok=True)
+
+    @staticmethod
+    def key(identity: str, message: ChatAgentMessageIngressDTO, context_messages: Optional[List[ContextMessageDTO]]
+            ) -> str:
+        """
+        The address of the response to a message.
+
+        :param identity: Identifies the model and its sampling settings, see `IChatAgent.cache_identity`.
+        """
+        content = json.dumps([
+            identity,
+            message.system_prompt,
+            message.user_prompt,
+            [[context_message.type.value, context_message.content] for context_message in context_messages or []],
+        ])
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[ChatAgentMessageEgressDTO]:
+        """
+        Retrieve the cached response for a key, if there is an unexpired one.
+        """
+        path = self._entry_path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self._ttl:
+                self._remove(path)
+                return None
+            with open(path, "r", encoding="utf-8") as file:
+                return ChatAgentMessageEgressDTO.model_validate_json(file.read())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def put(self, key: str, response: ChatAgentMessageEgressDTO) -> None:
+        """
+        Store a response and evict expired or, if the cache is too large, the oldest entries.
+        """
+        self._write(self._entry_path(key), response.model_dump_json())
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in os.scandir(self._directory):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        now = time.time()
+        total = 0
+        # Newest first, everything after the size limit is reached is evicted
+        for modified, size, path in sorted(entries, reverse=True):
+            total += size
+            if now - modified > self._ttl or total > self._max_bytes:
+                self._remove(path)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self._directory, f"{key}.json")
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _write(self, path: str, content: str) -> None:
+        # Write to a temporary file first, so readers in other workers never see a partially written file.
+        fd, temporary_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            file.write(content)
+        os.replace(temporary_path, path)
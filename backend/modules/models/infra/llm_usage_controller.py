@@ -0,0 +1,51 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from datetime import datetime
+
+from flask import Blueprint, request, jsonify
+from di_container import container
+
+llm_usage_controller = Blueprint('llm_usage', __name__)
+
+
+@llm_usage_controller.get('/llm-usage')
+def get_summary():
+    """
+    Cost, tokens, latency percentiles and error rates of the LLM calls.
+
+    Query parameters:
+        from, to: ISO 8601 range, defaults to the last seven days
+        group-by: Comma separated groupings, any of model and stage
+        window: hour or day to group by time windows as well
+    """
+    since = request.args.get('from')
+    until = request.args.get('to')
+    group_by = request.args.get('group-by')
+
+    try:
+        summaries = container.llm_usage_service().summarize(
+            since=datetime.fromisoformat(since) if since else None,
+            until=datetime.fromisoformat(until) if until else None,
+            group_by=[grouping.strip() for grouping in group_by.split(',') if grouping.strip()] if group_by else [],
+            window=request.args.get('window'),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return [summary.model_dump() for summary in summaries]
@@ -0,0 +1,139 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from datetime import datetime, timezone
+from typing import List, Literal, Optional
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import func, null, select, Row
+from sqlalchemy.dialects.postgresql import insert
+
+from db_models import LLMUsage, LLMUsageHourly
+from modules.models.application.dto.create_llm_usage_dto import CreateLLMUsageDTO
+
+Window = Literal["hour", "day"]
+
+
+class LLMUsageRepository:
+    """
+    Repository for the usage ledger, one row per LLM call, and its hourly rollup.
+    """
+
+    def __init__(self, db: SQLAlchemy):
+        self.db = db
+
+    def save(self, usage_data: CreateLLMUsageDTO) -> LLMUsage:
+        """
+        Record the usage of an LLM call and add it to the bucket of its hour in the same transaction.
+        """
+        created_at = datetime.now(timezone.utc)
+        usage = LLMUsage(
+            regulation_fragment_id=usage_data.regulation_fragment_id,
+            llm_identifier=usage_data.llm_identifier,
+            stage=usage_data.stage,
+            input_tokens=usage_data.input_tokens,
+            output_tokens=usage_data.output_tokens,
+            cached_input_tokens=usage_data.cached_input_tokens,
+            latency_ms=usage_data.latency_ms,
+            is_error=usage_data.is_error,
+            created_at=created_at,
+        )
+
+        bucket = insert(LLMUsageHourly).values(
+            hour=created_at.replace(minute=0, second=0, microsecond=0),
+            llm_identifier=usage_data.llm_identifier,
+            stage=usage_data.stage,
+            calls=1,
+            errors=int(usage_data.is_error),
+            input_tokens=usage_data.input_tokens,
+            output_tokens=usage_data.output_tokens,
+            cached_input_tokens=usage_data.cached_input_tokens,
+            latency_ms=usage_data.latency_ms,
+        )
+        bucket = bucket.on_conflict_do_update(
+            index_elements=[LLMUsageHourly.hour, LLMUsageHourly.llm_identifier, LLMUsageHourly.stage],
+            set_={
+                column: getattr(LLMUsageHourly, column) + getattr(bucket.excluded, column)
+                for column in ("calls", "errors", "input_tokens", "output_tokens", "cached_input_tokens",
+                               "latency_ms")
+            },
+        )
+
+        try:
+            self.db.session.add(usage)
+            self.db.session.execute(bucket)
+            self.db.session.commit()
+        except Exception:
+            self.db.session.rollback()
+            raise
+
+        return usage
+
+    def sum_hourly(self, since: datetime, until: datetime, window: Optional[Window]) -> List[Row]:
+        """
+        Totals of the hourly buckets in [since, until) per model, stage and window.
+
+        :param window: Width of the time windows, or None to sum the whole range.
+        :return: Rows of window_start (None without window), llm_identifier, stage, calls, errors, input_tokens,
+            output_tokens, cached_input_tokens and latency_ms.
+        """
+        window_start = func.date_trunc(window, LLMUsageHourly.hour) if window else None
+        keys = [LLMUsageHourly.llm_identifier, LLMUsageHourly.stage]
+        if window_start is not None:
+            keys.insert(0, window_start)
+
+        return self.db.session.execute(
+            select(
+                (window_start if window_start is not None else null()).label("window_start"),
+                LLMUsageHourly.llm_identifier,
+                LLMUsageHourly.stage,
+                func.sum(LLMUsageHourly.calls).label("calls"),
+                func.sum(LLMUsageHourly.errors).label("errors"),
+                func.sum(LLMUsageHourly.input_tokens).label("input_tokens"),
+                func.sum(LLMUsageHourly.output_tokens).label("output_tokens"),
+                func.sum(LLMUsageHourly.cached_input_tokens).label("cached_input_tokens"),
+                func.sum(LLMUsageHourly.latency_ms).label("latency_ms"),
+            )
+            .where(LLMUsageHourly.hour >= since, LLMUsageHourly.hour < until)
+            .group_by(*keys)
+        ).all()
+
+    def latency_percentiles(self, since: datetime, until: datetime, window: Optional[Window], by_model: bool,
+                            by_stage: bool) -> List[Row]:
+        """
+        Latency percentiles of the calls in [since, until), they cannot be rolled up and are computed from the
+        ledger itself.
+
+        :return: Rows of window_start, llm_identifier and stage (None where not grouped by), p50, p90 and p99.
+        """
+        columns = {
+            "window_start": func.date_trunc(window, LLMUsage.created_at) if window else None,
+            "llm_identifier": LLMUsage.llm_identifier if by_model else None,
+            "stage": LLMUsage.stage if by_stage else None,
+        }
+        keys = [column for column in columns.values() if column is not None]
+
+        return self.db.session.execute(
+            select(
+                *[(column if column is not None else null()).label(name) for name, column in columns.items()],
+                *[func.percentile_cont(fraction).within_group(LLMUsage.latency_ms).label(name)
+                  for name, fraction in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99))],
+            )
+            .where(LLMUsage.created_at >= since, LLMUsage.created_at < until)
+            .group_by(*keys)
+        ).all()
@@ -0,0 +1,39 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import hashlib
+import zlib
+from typing import Tuple
+
+
+def encode_prompt(text: str) -> Tuple[str, bytes, int]:
+    """
+    Compress a prompt for the prompt blob table.
+
+    :return: The SHA-256 hex digest of the prompt, which addresses the blob, the zlib compressed UTF-8 text and
+        the uncompressed size in bytes.
+    """
+    data = text.encode("utf-8")
+    return hashlib.sha256(data).hexdigest(), zlib.compress(data), len(data)
+
+
+def decode_prompt(content: bytes) -> str:
+    """
+    Decompress the content of a prompt blob.
+    """
+    return zlib.decompress(content).decode("utf-8")
@@ -0,0 +1,118 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import threading
+import time
+from typing import Optional, Callable
+
+from modules.models.domain.llm_identifier import LLMIdentifier
+
+
+class RateLimiter:
+    """
+    Token buckets bounding the requests and tokens per minute sent to one LLM, shared by all threads of the
+    process. Each bucket holds up to a minute's worth and refills continuously.
+
+    Token counts are only known after a response, so callers acquire an estimate and settle the difference
+    afterwards; the token bucket may go into debt. After a rate limit response, `pause` holds back all callers
+    until the provider accepts requests again.
+    """
+
+    def __init__(self, requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        """
+        :param requests_per_minute: Request limit, None for no limit.
+        :param tokens_per_minute: Token limit (input and output), None for no limit.
+        """
+        self._requests_per_minute = requests_per_minute
+        self._tokens_per_minute = tokens_per_minute
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._requests = requests_per_minute or 0.0
+        self._tokens = tokens_per_minute or 0.0
+        self._updated_at = clock()
+        self._paused_until = 0.0
+
+    @staticmethod
+    def for_llm(llm_identifier: LLMIdentifier) -> "RateLimiter":
+        """
+        Create the limiter for an LLM with the limits from LLM_REQUESTS_PER_MINUTE_<IDENTIFIER> and
+        LLM_TOKENS_PER_MINUTE_<IDENTIFIER> (e.g., LLM_TOKENS_PER_MINUTE_GPT_5), unlimited if not set.
+        """
+        requests_per_minute = os.getenv(f"LLM_REQUESTS_PER_MINUTE_{llm_identifier.value}")
+        tokens_per_minute = os.getenv(f"LLM_TOKENS_PER_MINUTE_{llm_identifier.value}")
+        return RateLimiter(
+            float(requests_per_minute) if requests_per_minute else None,
+            float(tokens_per_minute) if tokens_per_minute else None,
+        )
+
+    def acquire(self, tokens: int):
+        """
+        Block until a request using the given (estimated) number of tokens is within the limits, then take it from
+        the buckets. Requests larger than the token limit only wait for a full bucket.
+        """
+        while True:
+            with self._lock:
+                now = self._refill()
+                wait = max(self._paused_until - now, 0.0)
+
+                if self._requests_per_minute and self._requests < 1:
+                    wait = max(wait, (1 - self._requests) * 60 / self._requests_per_minute)
+
+                if self._tokens_per_minute:
+                    needed = min(tokens, self._tokens_per_minute)
+                    if self._tokens < needed:
+                        wait = max(wait, (needed - self._tokens) * 60 / self._tokens_per_minute)
+
+                if wait <= 0:
+                    if self._requests_per_minute:
+                        self._requests -= 1
+                    if self._tokens_per_minute:
+                        self._tokens -= tokens
+                    return
+
+            self._sleep(wait)
+
+    def settle(self, estimated_tokens: int, actual_tokens: int):
+        """
+        Correct the token bucket once the actual usage of a request is known.
+        """
+        if not self._tokens_per_minute:
+            return
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens + estimated_tokens - actual_tokens, self._tokens_per_minute)
+
+    def pause(self, seconds: float):
+        """
+        Hold back all requests for the given number of seconds, e.g. after the provider reported a rate limit.
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def _refill(self) -> float:
+        now = self._clock()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        if self._requests_per_minute:
+            self._requests = min(self._requests + elapsed * self._requests_per_minute / 60, self._requests_per_minute)
+        if self._tokens_per_minute:
+            self._tokens = min(self._tokens + elapsed * self._tokens_per_minute / 60, self._tokens_per_minute)
+        return now
@@ -17,14 +17,15 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
 import os
-from typing import List
+from typing import List, Iterator, Union, Optional
 
-from anthropic import Anthropic
+from anthropic import Anthropic, APIConnectionError
 
 from modules.chat.application.dto.context_message_dto import ContextMessageDTO
 from modules.models.application.agentic_log_service import AgenticLogService
 from modules.models.application.dto.chat_agent_message_egress_dto import ChatAgentMessageEgressDTO
 from modules.models.application.dto.chat_agent_message_ingress_dto import ChatAgentMessageIngressDTO
+from modules.models.infra.rate_limiter import RateLimiter
 from modules.models.infra.services.i_chat_agent import IChatAgent
 
 
@@ -32,24 +33,28 @@ class AnthropicAIChatAgent(IChatAgent):
     """
     Implementation of IChatAgent using the OpenAI API.
     """
+    transient_errors = (APIConnectionError,)
 
-    def __init__(self, agentic_log_service: AgenticLogService, model: str):
+    def __init__(self, agentic_log_service: AgenticLogService, model: str, rate_limiter: Optional[RateLimiter] = None):
         """
         Initialize the OpenAI chat agent.
 
         Args:
             model (str, optional): The OpenAI model to use. Defaults to "gpt-3.5-turbo".
         """
-        super().__init__(agentic_log_service)
+        super().__init__(agentic_log_service, rate_limiter)
         api_key = os.environ.get("ANTHROPIC_API_KEY")
         if not api_key:
             raise ValueError(
                 "Anthropic API key is required. Set the ANTHROPIC_API_KEY environment variable.")
 
+        # Retries are handled by IChatAgent, within the rate limits shared by all requests to the model
         self.client = Anthropic(
-            api_key=api_key
+            api_key=api_key,
+            max_retries=0,
         )
         self.model = model
+        self.temperature = 0
 
     def _send_message(self, message: ChatAgentMessageIngressDTO,
                       context_messages: List[ContextMessageDTO]) -> ChatAgentMessageEgressDTO:
@@ -57,40 +62,82 @@ class AnthropicAIChatAgent(IChatAgent):
         Process a message and return a response using the OpenAI API.
         """
 
-        try:
-            messages = []
+        response = self.client.messages.create(
+            temperature=self.temperature,
+            model=self.model,
+            messages=self._messages(message, context_messages),
+            # Blocking calls are capped at max_tokens, callers pass a validator to have the response streamed
+            max_tokens=1024 * 16,
+            system=self._system(message),
+        )
 
-            for ctx_msg in context_messages:
-                if ctx_msg.type.value == "user":
-                    messages.append({"role": "user", "content": ctx_msg.content})
-                elif ctx_msg.type.value == "agent":
-                    messages.append({"role": "assistant", "content": ctx_msg.content})
+        usage = response.usage
+        cached_input_tokens = usage.cache_read_input_tokens or 0
+        input_tokens = usage.input_tokens + cached_input_tokens + (usage.cache_creation_input_tokens or 0)
+        output_tokens = usage.output_tokens
 
-            messages.append({"role": "user", "content": message.user_prompt})
+        return ChatAgentMessageEgressDTO(
+            message=response.content[0].text,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cached_input_tokens=cached_input_tokens,
+        )
 
-            response = self.client.messages.create(
-                temperature=0,
+    def _stream_message(self, message: ChatAgentMessageIngressDTO, context_messages: List[ContextMessageDTO],
+                        response: ChatAgentMessageEgressDTO) -> Iterator[str]:
+        """
+        Stream a response from the Anthropic API. Input tokens are known from the start, output tokens are updated
+        as the message grows.
+        """
+        with self.client.messages.stream(
+                temperature=self.temperature,
                 model=self.model,
-                messages=messages,
-                # TODO add streaming or something similar to stop cut offs.
+                messages=self._messages(message, context_messages),
                 max_tokens=1024 * 16,
-                system=message.system_prompt,
-            )
-
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
-
-            return ChatAgentMessageEgressDTO(
-                message=response.content[0].text,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens
-            )
-
-        except Exception as e:
-            # In a production environment, you might want to handle different types of exceptions differently
-            # For now, we'll just return the error message
-            print(f"Error calling Anthropic API: {str(e)}")
-            return ChatAgentMessageEgressDTO(
-                message=str(e), 
-                is_error=True,
-            )
+                system=self._system(message),
+        ) as stream:
+            for event in stream:
+                if event.type == "message_start":
+                    usage = event.message.usage
+                    response.cached_input_tokens = usage.cache_read_input_tokens or 0
+                    response.input_tokens = (usage.input_tokens + response.cached_input_tokens
+                                             + (usage.cache_creation_input_tokens or 0))
+                    response.output_tokens = usage.output_tokens
+                elif event.type == "message_delta":
+                    response.output_tokens = event.usage.output_tokens
+                elif event.type == "content_block_delta" and event.delta.type == "text_delta":
+                    yield event.delta.text
+
+    @staticmethod
+    def _cached_blocks(prefix: str, suffix: str) -> Union[str, List[dict]]:
+        """
+        Text blocks with a cache breakpoint after the prefix, so Anthropic caches everything up to and including it.
+        Without a prefix the plain text is sent.
+        """
+        if not prefix:
+            return suffix
+
+        blocks = [{"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}}]
+        if suffix:
+            blocks.append({"type": "text", "text": suffix})
+        return blocks
+
+    def _system(self, message: ChatAgentMessageIngressDTO) -> Union[str, List[dict]]:
+        return self._cached_blocks(*message.split_system_prompt())
+
+    def _messages(self, message: ChatAgentMessageIngressDTO, context_messages: List[ContextMessageDTO]) -> List[dict]:
+        messages = []
+
+        for ctx_msg in context_messages:
+            if ctx_msg.type.value == "user":
+                messages.append({"role": "user", "content": ctx_msg.content})
+            elif ctx_msg.type.value == "agent":
+                messages.append({"role": "assistant", "content": ctx_msg.content})
+
+        # The history only grows, so caching up to its last message lets the next chat message or retry reuse it.
+        # Retries resend the original prompt in the history, usually without any system prompt.
+        if messages:
+            messages[-1]["content"] = self._cached_blocks(messages[-1]["content"], "")
+
+        messages.append({"role": "user", "content": self._cached_blocks(*message.split_user_prompt())})
+        return messages
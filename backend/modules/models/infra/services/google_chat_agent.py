@@ -17,8 +17,9 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
 import os
-from typing import List
+from typing import List, Iterator, Optional
 
+import httpx
 from google import genai
 from google.genai.types import GenerateContentConfig
 
@@ -26,6 +27,7 @@ from modules.chat.application.dto.context_message_dto import ContextMessageDTO
 from modules.models.application.agentic_log_service import AgenticLogService
 from modules.models.application.dto.chat_agent_message_egress_dto import ChatAgentMessageEgressDTO
 from modules.models.application.dto.chat_agent_message_ingress_dto import ChatAgentMessageIngressDTO
+from modules.models.infra.rate_limiter import RateLimiter
 from modules.models.infra.services.i_chat_agent import IChatAgent
 
 
@@ -33,15 +35,17 @@ class GoogleChatAgent(IChatAgent):
     """
     Implementation of IChatAgent using the Google Generative AI API.
     """
+    # API errors carry their status code, connection errors come straight from the HTTP client
+    transient_errors = (httpx.TransportError,)
 
-    def __init__(self, agentic_log_service: AgenticLogService, model: str):
+    def __init__(self, agentic_log_service: AgenticLogService, model: str, rate_limiter: Optional[RateLimiter] = None):
         """
         Initialize the Google chat agent.
 
         Args:
             model (str): The Google Generative AI model to use.
         """
-        super().__init__(agentic_log_service)
+        super().__init__(agentic_log_service, rate_limiter)
         api_key = os.environ.get("GOOGLE_API_KEY")
         if not api_key:
             raise ValueError(
@@ -50,6 +54,7 @@ class GoogleChatAgent(IChatAgent):
         # Configure the Google Generative AI client
         self.client = genai.Client(api_key=api_key)
         self.model = model
+        self.temperature = 0.0
 
     def _send_message(self, message: ChatAgentMessageIngressDTO,
                       context_messages: List[ContextMessageDTO]) -> ChatAgentMessageEgressDTO:
@@ -57,46 +62,63 @@ class GoogleChatAgent(IChatAgent):
         Process a message and return a response using the Google Generative AI API.
         """
 
-        try:
-            contents = []
-
-            for ctx_msg in context_messages:
-                contents.append({
-                    "role": "model" if ctx_msg.type.value == "agent" else "user",
-                    "parts": [{"text": ctx_msg.content}]
-                })
-
-            # Add the current user prompt
+        response = self.client.models.generate_content(
+            model=self.model,
+            contents=self._contents(message, context_messages),
+            config=self._config(message)
+        )
+
+        input_tokens = response.usage_metadata.prompt_token_count
+        # Thoughts tokens are billed as output tokens.
+        output_tokens = response.usage_metadata.candidates_token_count
+        thought_tokens = response.usage_metadata.thoughts_token_count
+
+        return ChatAgentMessageEgressDTO(
+            message=response.text,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens + thought_tokens,
+            # Gemini caches repeated prompt prefixes implicitly
+            cached_input_tokens=response.usage_metadata.cached_content_token_count or 0,
+        )
+
+    def _stream_message(self, message: ChatAgentMessageIngressDTO, context_messages: List[ContextMessageDTO],
+                        response: ChatAgentMessageEgressDTO) -> Iterator[str]:
+        """
+        Stream a response from the Google Generative AI API. Every chunk carries the usage so far.
+        """
+        for chunk in self.client.models.generate_content_stream(
+                model=self.model,
+                contents=self._contents(message, context_messages),
+                config=self._config(message)
+        ):
+            if chunk.usage_metadata:
+                response.input_tokens = chunk.usage_metadata.prompt_token_count or 0
+                response.cached_input_tokens = chunk.usage_metadata.cached_content_token_count or 0
+                # Thoughts tokens are billed as output tokens.
+                response.output_tokens = ((chunk.usage_metadata.candidates_token_count or 0)
+                                          + (chunk.usage_metadata.thoughts_token_count or 0))
+            if chunk.text:
+                yield chunk.text
+
+    @staticmethod
+    def _contents(message: ChatAgentMessageIngressDTO, context_messages: List[ContextMessageDTO]) -> List[dict]:
+        contents = []
+
+        for ctx_msg in context_messages:
             contents.append({
-                "role": "user",
-                "parts": [{"text": message.user_prompt}]
+                "role": "model" if ctx_msg.type.value == "agent" else "user",
+                "parts": [{"text": ctx_msg.content}]
             })
 
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=contents,
-                config=GenerateContentConfig(
-                    temperature=0.0,
-                    system_instruction=message.system_prompt if message.system_prompt else None
-                )
-            )
-
-            input_tokens = response.usage_metadata.prompt_token_count
-            # Thoughts tokens are billed as output tokens.
-            output_tokens = response.usage_metadata.candidates_token_count
-            thought_tokens = response.usage_metadata.thoughts_token_count
-
-            return ChatAgentMessageEgressDTO(
-                message=response.text,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens + thought_tokens,
-            )
-
-        except Exception as e:
-            # In a production environment, you might want to handle different types of exceptions differently
-            # For now, we'll just return the error message
-            print(f"Error calling Google Generative AI API: {str(e)}")
-            return ChatAgentMessageEgressDTO(
-                message=str(e),
-                is_error=True,
-            )
+        # Add the current user prompt
+        contents.append({
+            "role": "user",
+            "parts": [{"text": message.user_prompt}]
+        })
+        return contents
+
+    def _config(self, message: ChatAgentMessageIngressDTO) -> GenerateContentConfig:
+        return GenerateContentConfig(
+            temperature=self.temperature,
+            system_instruction=message.system_prompt if message.system_prompt else None
+        )
@@ -16,8 +16,11 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
+import os
+import random
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Iterator, Generator, Callable, Tuple, Type
 
 from modules.chat.application.dto.context_message_dto import ContextMessageDTO
 from modules.models.application.agentic_log_service import AgenticLogService
@@ -25,53 +28,240 @@ from modules.models.application.dto.chat_agent_message_egress_dto import ChatAge
 from modules.models.application.dto.chat_agent_message_ingress_dto import ChatAgentMessageIngressDTO
 from modules.models.application.dto.create_agentic_log_dto import CreateAgenticLogDTO
 from modules.models.domain.message_source import MessageSource
+from modules.models.infra.rate_limiter import RateLimiter
+
+# Status codes worth another attempt: rate limits, timeouts and server errors
+_RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+def _estimate_tokens(message: ChatAgentMessageIngressDTO, context_messages: List[ContextMessageDTO]) -> int:
+    """
+    Rough input token count of a request, about four characters per token.
+    """
+    characters = len(message.system_prompt) + len(message.user_prompt) + \
+        sum(len(context_message.content) for context_message in context_messages)
+    return characters // 4 + 1
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    # OpenAI and Anthropic errors have a status_code, Google errors a code
+    status_code = getattr(error, "status_code", None) or getattr(error, "code", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """
+    The delay requested by the provider in the headers of an error response, if any.
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except ValueError:
+        # Retry-After may also be an HTTP date, fall back to the backoff
+        pass
+    return None
 
 
 class IChatAgent(ABC):
-    def __init__(self, agentic_log_service: AgenticLogService):
+    # Set by the implementations, together they determine which responses can be reused
+    model: str
+    temperature: float
+    # Errors of the provider's client which are not responses but still worth a retry, e.g., connection errors
+    transient_errors: Tuple[Type[Exception], ...] = ()
+
+    def __init__(self, agentic_log_service: AgenticLogService, rate_limiter: Optional[RateLimiter] = None):
         """
         Initialize the chat agent with a logging service.
 
         :param agentic_log_service: Service to log messages.
+        :param rate_limiter: Limits the requests to the model, shared by all agents of the same LLM. Defaults to no
+            limits, so only rate limit responses slow the agent down.
         """
         self.agentic_log_service = agentic_log_service
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.max_retries = int(os.getenv("LLM_MAX_RETRIES", "4"))
+        self.retry_base_delay = float(os.getenv("LLM_RETRY_BASE_DELAY", "1"))
+        self.retry_max_delay = float(os.getenv("LLM_RETRY_MAX_DELAY", "60"))
 
     def send_message(self, message: ChatAgentMessageIngressDTO,
                      context_messages: Optional[List[ContextMessageDTO]] = None) -> ChatAgentMessageEgressDTO:
         """
         Process a message to a model and return a response. This method logs the message and then calls the internal
-        `_send_message` method to handle the actual message sending.
+        `_send_message` method to handle the actual message sending, within the rate limits and with retries on
+        rate limit responses and server errors.
         :param context_messages: Additional previous messages, e.g., previous messages in a chat.
         :param message: The message to be sent to the LLM.
-        :return:
+        :return: The response, or the error with `is_error` set once the retries are exhausted.
+        """
+        self._log_prompt(message)
+        context_messages = context_messages or []
+
+        estimated_tokens = _estimate_tokens(message, context_messages)
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire(estimated_tokens)
+            try:
+                response = self._send_message(message, context_messages=context_messages)
+                self.rate_limiter.settle(estimated_tokens, response.input_tokens + response.output_tokens)
+                break
+            except Exception as e:
+                self.rate_limiter.settle(estimated_tokens, 0)
+                if self._retry_delay(e, attempt) is None:
+                    print(f"Error calling {type(self).__name__}: {str(e)}")
+                    response = ChatAgentMessageEgressDTO(message=str(e), is_error=True)
+                    break
+                attempt += 1
+
+        self._log_response(message, response)
+        return response
+
+    def replay(self, message: ChatAgentMessageIngressDTO, response: ChatAgentMessageEgressDTO
+               ) -> ChatAgentMessageEgressDTO:
+        """
+        Log a message and a response which was obtained without asking the model (e.g., from a cache) like
+        `send_message` would.
+
+        :return: The response, without token usage as the model was not involved.
         """
-        regulation_fragment_id = message.regulation_fragment_id
-        self.agentic_log_service.create(
+        self._log_prompt(message)
+        replayed = response.model_copy(update={"input_tokens": 0, "output_tokens": 0, "cached_input_tokens": 0})
+        self._log_response(message, replayed, prefix="[CACHED] ")
+        return replayed
+
+    def stream_message(self, message: ChatAgentMessageIngressDTO,
+                       context_messages: Optional[List[ContextMessageDTO]] = None,
+                       on_finish: Optional[Callable[[ChatAgentMessageEgressDTO], None]] = None
+                       ) -> Generator[str, None, ChatAgentMessageEgressDTO]:
+        """
+        Streaming variant of `send_message`, yielding the response in chunks as the model writes it and returning
+        the complete response. Closing the generator early aborts the request to the model. Failures before the
+        first chunk are retried like in `send_message`.
+
+        :param message: The message to be sent to the LLM.
+        :param context_messages: Additional previous messages, e.g., previous messages in a chat.
+        :param on_finish: Called with the (possibly partial) response once the stream is done or was closed, e.g.,
+            to account the tokens used so far.
+        :return: The complete response.
+        """
+        self._log_prompt(message)
+
+        context_messages = context_messages or []
+        response = ChatAgentMessageEgressDTO(message="")
+        chunks = []
+        completed = False
+        estimated_tokens = _estimate_tokens(message, context_messages)
+        try:
+            attempt = 0
+            while True:
+                self.rate_limiter.acquire(estimated_tokens)
+                try:
+                    for chunk in self._stream_message(message, context_messages, response):
+                        chunks.append(chunk)
+                        yield chunk
+                    break
+                except Exception as e:
+                    # Once chunks were passed on, the response cannot be started over
+                    delay = None if chunks else self._retry_delay(e, attempt)
+                    if delay is None:
+                        raise
+                    self.rate_limiter.settle(estimated_tokens, 0)
+                    attempt += 1
+            response.message = "".join(chunks)
+            completed = True
+        except Exception as e:
+            print(f"Error streaming from {type(self).__name__}: {str(e)}")
+            response.message = str(e)
+            response.is_error = True
+        finally:
+            if not completed and not response.is_error:
+                # Closed by the consumer
+                response.message = "".join(chunks)
+
+            self.rate_limiter.settle(estimated_tokens, response.input_tokens + response.output_tokens)
+            self._log_response(message, response, prefix="" if completed else "[ABORTED] ")
+            if on_finish:
+                on_finish(response)
+
+        return response
+
+    def cache_identity(self) -> str:
+        """
+        Identifies the model and sampling settings of this agent, cached responses are only reused for the same
+        identity.
+        """
+        return f"{type(self).__name__}:{self.model}:{self.temperature}"
+
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """
+        Decide whether a failed request is retried, and wait before the retry. The delay is the one requested by
+        the provider, or an exponential backoff with jitter. Rate limit responses pause all requests to the model.
+
+        :param attempt: The number of retries so far.
+        :return: The delay waited, or None if the error is final.
+        """
+        status_code = _status_code(error)
+        retryable = status_code in _RETRYABLE_STATUS_CODES or isinstance(error, self.transient_errors)
+        if not retryable or attempt >= self.max_retries:
+            return None
+
+        delay = _retry_after(error)
+        if delay is None:
+            backoff = min(self.retry_base_delay * 2 ** attempt, self.retry_max_delay)
+            delay = backoff / 2 + random.uniform(0, backoff / 2)
+
+        print(f"{type(self).__name__} request failed ({str(error)}), retry {attempt + 1} in {delay:.1f}s")
+        if status_code == 429:
+            self.rate_limiter.pause(delay)
+        else:
+            time.sleep(delay)
+        return delay
+
+    def _log_prompt(self, message: ChatAgentMessageIngressDTO):
+        self.agentic_log_service.log(
             CreateAgenticLogDTO(
                 user_prompt=message.user_prompt,
                 system_prompt=message.system_prompt,
                 message_source=MessageSource.SYSTEM_PROMPT,
-                regulation_fragment_id=regulation_fragment_id,
+                regulation_fragment_id=message.regulation_fragment_id,
                 is_error=False
             )
         )
 
-        response = self._send_message(message, context_messages=context_messages or [])
-        self.agentic_log_service.create(
+    def _log_response(self, message: ChatAgentMessageIngressDTO, response: ChatAgentMessageEgressDTO,
+                      prefix: str = ""):
+        self.agentic_log_service.log(
             CreateAgenticLogDTO(
-                user_prompt=response.message if not response.is_error else f"[ERROR] {response.message}",
+                user_prompt=f"[ERROR] {response.message}" if response.is_error else f"{prefix}{response.message}",
                 system_prompt=None,
                 message_source=MessageSource.MODEL_RESPONSE,
-                regulation_fragment_id=regulation_fragment_id,
+                regulation_fragment_id=message.regulation_fragment_id,
                 is_error=response.is_error
             )
         )
-        return response
 
     @abstractmethod
     def _send_message(self, message: ChatAgentMessageIngressDTO,
                       context_messages: List[ContextMessageDTO]) -> ChatAgentMessageEgressDTO:
         """
-        Internal method to send a message. This is intended to be overridden by subclasses.
+        Internal method to send a message. This is intended to be overridden by subclasses. Errors are raised, so
+        they can be retried.
         """
         raise NotImplementedError("This method should be overridden by subclasses.")
+
+    def _stream_message(self, message: ChatAgentMessageIngressDTO, context_messages: List[ContextMessageDTO],
+                        response: ChatAgentMessageEgressDTO) -> Iterator[str]:
+        """
+        Internal method to stream a message, yielding the text chunks of the response and recording token usage in
+        `response` as soon as it is known. Errors are raised. Subclasses should override this, the default waits
+        for the complete response.
+        """
+        result = self._send_message(message, context_messages)
+        response.input_tokens = result.input_tokens
+        response.output_tokens = result.output_tokens
+        response.cached_input_tokens = result.cached_input_tokens
+        if result.is_error:
+            raise RuntimeError(result.message)
+        yield result.message
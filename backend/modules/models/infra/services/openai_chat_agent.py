@@ -16,15 +16,17 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
+import hashlib
 import os
-from typing import List
+from typing import List, Iterator, Optional
 
-from openai import OpenAI
+from openai import OpenAI, APIConnectionError
 
 from modules.chat.application.dto.context_message_dto import ContextMessageDTO
 from modules.models.application.agentic_log_service import AgenticLogService
 from modules.models.application.dto.chat_agent_message_egress_dto import ChatAgentMessageEgressDTO
 from modules.models.application.dto.chat_agent_message_ingress_dto import ChatAgentMessageIngressDTO
+from modules.models.infra.rate_limiter import RateLimiter
 from modules.models.infra.services.i_chat_agent import IChatAgent
 
 
@@ -32,71 +34,112 @@ class OpenAIChatAgent(IChatAgent):
     """
     Implementation of IChatAgent using the OpenAI API.
     """
+    transient_errors = (APIConnectionError,)
 
-    def __init__(self, agentic_log_service: AgenticLogService, model="gpt-3.5-turbo"):
+    def __init__(self, agentic_log_service: AgenticLogService, model="gpt-3.5-turbo",
+                 rate_limiter: Optional[RateLimiter] = None):
         """
         Initialize the OpenAI chat agent.
 
         Args:
             model (str, optional): The OpenAI model to use. Defaults to "gpt-3.5-turbo".
         """
-        super().__init__(agentic_log_service)
+        super().__init__(agentic_log_service, rate_limiter)
         self.api_key = os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError(
                 "OpenAI API key is required.Set the OPENAI_API_KEY environment variable.")
 
-        self.client = OpenAI(api_key=self.api_key)
+        # Retries are handled by IChatAgent, within the rate limits shared by all requests to the model
+        self.client = OpenAI(api_key=self.api_key, max_retries=0)
         self.model = model
 
+        has_temperature_param = self.model in [
+            "gpt-3.5-turbo",
+            "gpt-4o-mini"
+        ]
+        self.temperature = 0 if has_temperature_param else 1
+
     def _send_message(self, message: ChatAgentMessageIngressDTO,
                       context_messages: List[ContextMessageDTO]) -> ChatAgentMessageEgressDTO:
         """
         Process a message and return a response using the OpenAI API.
         """
 
+        response = self.client.chat.completions.create(
+            temperature=self.temperature,
+            model=self.model,
+            messages=self._messages(message, context_messages),
+            extra_body=self._extra_body(message),
+        )
+
+        assistant_message = response.choices[0].message.content
+
+        input_tokens = response.usage.prompt_tokens
+        output_tokens = response.usage.completion_tokens
+
+        return ChatAgentMessageEgressDTO(
+            message=assistant_message,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cached_input_tokens=self._cached_tokens(response.usage),
+        )
+
+    def _stream_message(self, message: ChatAgentMessageIngressDTO, context_messages: List[ContextMessageDTO],
+                        response: ChatAgentMessageEgressDTO) -> Iterator[str]:
+        """
+        Stream a response from the OpenAI API. Usage is only reported with the last chunk.
+        """
+        stream = self.client.chat.completions.create(
+            temperature=self.temperature,
+            model=self.model,
+            messages=self._messages(message, context_messages),
+            stream=True,
+            stream_options={"include_usage": True},
+            extra_body=self._extra_body(message),
+        )
+
         try:
-            messages = [
-                {"role": "system", "content": message.system_prompt},
-            ]
-
-            # Add context messages if they exist
-            for ctx_msg in context_messages:
-                if ctx_msg.type.value == "user":
-                    messages.append({"role": "user", "content": ctx_msg.content})
-                elif ctx_msg.type.value == "agent":
-                    messages.append({"role": "assistant", "content": ctx_msg.content})
-
-            # Add the current user prompt
-            messages.append({"role": "user", "content": message.user_prompt})
-
-            has_temperature_param = self.model in [
-                "gpt-3.5-turbo",
-                "gpt-4o-mini"
-            ]
-
-            response = self.client.chat.completions.create(
-                temperature=0 if has_temperature_param else 1,
-                model=self.model,
-                messages=messages
-            )
-
-            assistant_message = response.choices[0].message.content
-
-            input_tokens = response.usage.prompt_tokens
-            output_tokens = response.usage.completion_tokens
-
-            return ChatAgentMessageEgressDTO(
-                message=assistant_message,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens
-            )
-
-        except Exception as e:
-            # In a production environment, you might want to handle different types of exceptions differently
-            # For now, we'll just return the error message
-            print(f"Error calling OpenAI API: {str(e)}")
-            return ChatAgentMessageEgressDTO(
-                message=str(e), 
-                is_error=True,
-            )
+            for chunk in stream:
+                if chunk.usage:
+                    response.input_tokens = chunk.usage.prompt_tokens
+                    response.output_tokens = chunk.usage.completion_tokens
+                    response.cached_input_tokens = self._cached_tokens(chunk.usage)
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            stream.close()
+
+    @staticmethod
+    def _extra_body(message: ChatAgentMessageIngressDTO) -> dict:
+        """
+        OpenAI caches prompt prefixes automatically. Requests with the same static prefix share a cache key, so they
+        are routed to the same cache.
+        """
+        system_prefix, _ = message.split_system_prompt()
+        user_prefix, _ = message.split_user_prompt()
+        if not system_prefix and not user_prefix:
+            return {}
+        return {"prompt_cache_key": hashlib.sha256(f"{system_prefix}\0{user_prefix}".encode("utf-8")).hexdigest()}
+
+    @staticmethod
+    def _cached_tokens(usage) -> int:
+        details = getattr(usage, "prompt_tokens_details", None)
+        return (details.cached_tokens or 0) if details else 0
+
+    @staticmethod
+    def _messages(message: ChatAgentMessageIngressDTO, context_messages: List[ContextMessageDTO]) -> List[dict]:
+        messages = [
+            {"role": "system", "content": message.system_prompt},
+        ]
+
+        # Add context messages if they exist
+        for ctx_msg in context_messages:
+            if ctx_msg.type.value == "user":
+                messages.append({"role": "user", "content": ctx_msg.content})
+            elif ctx_msg.type.value == "agent":
+                messages.append({"role": "assistant", "content": ctx_msg.content})
+
+        # Add the current user prompt
+        messages.append({"role": "user", "content": message.user_prompt})
+        return messages
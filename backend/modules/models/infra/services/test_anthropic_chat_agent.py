@@ -0,0 +1,55 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from modules.chat.application.dto.context_message_dto import ContextMessageDTO
+from modules.chat.domain.context_message_type import ContextMessageType
+from modules.models.application.dto.chat_agent_message_ingress_dto import ChatAgentMessageIngressDTO
+from modules.models.infra.services.anthropic_chat_agent import AnthropicAIChatAgent
+
+
+@patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test"})
+class TestAnthropicChatAgent(unittest.TestCase):
+
+    def test_history_is_cached_without_system_prompt(self):
+        """Retries send no system prompt, the resent original prompt in the history is cached nonetheless."""
+        agent = AnthropicAIChatAgent(MagicMock(), "claude")
+        message = ChatAgentMessageIngressDTO(system_prompt="", user_prompt="Fix the error", regulation_fragment_id=1)
+
+        messages = agent._messages(message, [
+            ContextMessageDTO(type=ContextMessageType.USER, content="Extract the atoms"),
+            ContextMessageDTO(type=ContextMessageType.AGENT, content="<atoms/>"),
+        ])
+
+        self.assertEqual(messages[0]["content"], "Extract the atoms")
+        self.assertEqual(messages[1]["content"],
+                         [{"type": "text", "text": "<atoms/>", "cache_control": {"type": "ephemeral"}}])
+        self.assertEqual(messages[2], {"role": "user", "content": "Fix the error"})
+        self.assertEqual(agent._system(message), "")
+
+    def test_no_history_no_breakpoint(self):
+        agent = AnthropicAIChatAgent(MagicMock(), "claude")
+        message = ChatAgentMessageIngressDTO(user_prompt="Extract the atoms", regulation_fragment_id=1)
+
+        self.assertEqual(agent._messages(message, []), [{"role": "user", "content": "Extract the atoms"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
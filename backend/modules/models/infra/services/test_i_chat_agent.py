@@ -0,0 +1,179 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+from types import SimpleNamespace
+from typing import List, Iterator
+from unittest.mock import MagicMock
+
+from modules.chat.application.dto.context_message_dto import ContextMessageDTO
+from modules.models.application.dto.chat_agent_message_egress_dto import ChatAgentMessageEgressDTO
+from modules.models.application.dto.chat_agent_message_ingress_dto import ChatAgentMessageIngressDTO
+from modules.models.infra.services.i_chat_agent import IChatAgent, _estimate_tokens
+
+
+class _FakeChatAgent(IChatAgent):
+    def __init__(self, chunks: List[str], fail: bool = False):
+        super().__init__(MagicMock())
+        self.chunks = chunks
+        self.fail = fail
+        self.closed = False
+
+    def _send_message(self, message, context_messages) -> ChatAgentMessageEgressDTO:
+        return ChatAgentMessageEgressDTO(message="".join(self.chunks), input_tokens=10, output_tokens=len(self.chunks))
+
+    def _stream_message(self, message, context_messages: List[ContextMessageDTO],
+                        response: ChatAgentMessageEgressDTO) -> Iterator[str]:
+        response.input_tokens = 10
+        try:
+            for chunk in self.chunks:
+                response.output_tokens += 1
+                yield chunk
+            if self.fail:
+                raise RuntimeError("connection reset")
+        finally:
+            self.closed = True
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code: int, headers=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+class _FlakyChatAgent(IChatAgent):
+    def __init__(self, errors: List[Exception]):
+        super().__init__(MagicMock(), rate_limiter=MagicMock())
+        self.errors = errors
+        self.calls = 0
+        self.retry_base_delay = 0
+
+    def _send_message(self, message, context_messages) -> ChatAgentMessageEgressDTO:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return ChatAgentMessageEgressDTO(message="ok", input_tokens=10, output_tokens=2)
+
+
+def _message() -> ChatAgentMessageIngressDTO:
+    return ChatAgentMessageIngressDTO(user_prompt="prompt", regulation_fragment_id=1)
+
+
+class TestChatAgentStreaming(unittest.TestCase):
+
+    def test_stream_returns_complete_response(self):
+        agent = _FakeChatAgent(["<a>", "b", "</a>"])
+        finished = []
+
+        stream = agent.stream_message(_message(), on_finish=finished.append)
+        chunks = []
+        try:
+            while True:
+                chunks.append(next(stream))
+        except StopIteration as stop:
+            response = stop.value
+
+        self.assertEqual(chunks, ["<a>", "b", "</a>"])
+        self.assertEqual(response.message, "<a>b</a>")
+        self.assertEqual((response.input_tokens, response.output_tokens), (10, 3))
+        self.assertEqual(finished, [response])
+        logged = agent.agentic_log_service.log.call_args.args[0]
+        self.assertEqual(logged.user_prompt, "<a>b</a>")
+
+    def test_closing_the_stream_aborts(self):
+        agent = _FakeChatAgent(["<a>", "b", "</a>"])
+        finished = []
+
+        stream = agent.stream_message(_message(), on_finish=finished.append)
+        next(stream)
+        stream.close()
+
+        self.assertTrue(agent.closed)
+        self.assertEqual(finished[0].message, "<a>")
+        self.assertEqual(finished[0].output_tokens, 1)
+        self.assertFalse(finished[0].is_error)
+        logged = agent.agentic_log_service.log.call_args.args[0]
+        self.assertEqual(logged.user_prompt, "[ABORTED] <a>")
+
+    def test_stream_error(self):
+        agent = _FakeChatAgent(["<a>"], fail=True)
+
+        chunks = list(agent.stream_message(_message()))
+
+        self.assertEqual(chunks, ["<a>"])
+        logged = agent.agentic_log_service.log.call_args.args[0]
+        self.assertTrue(logged.is_error)
+        self.assertEqual(logged.user_prompt, "[ERROR] connection reset")
+
+    def test_default_stream_falls_back_to_send_message(self):
+        agent = _FakeChatAgent(["x", "y"])
+        agent._stream_message = super(_FakeChatAgent, agent)._stream_message
+
+        self.assertEqual(list(agent.stream_message(_message())), ["xy"])
+
+    def test_replay_logs_without_tokens(self):
+        agent = _FakeChatAgent([])
+
+        response = agent.replay(_message(), ChatAgentMessageEgressDTO(message="cached", input_tokens=5, output_tokens=6))
+
+        self.assertEqual((response.message, response.input_tokens, response.output_tokens), ("cached", 0, 0))
+        self.assertEqual(agent.agentic_log_service.log.call_count, 2)
+        logged = agent.agentic_log_service.log.call_args.args[0]
+        self.assertEqual(logged.user_prompt, "[CACHED] cached")
+
+
+class TestChatAgentRetries(unittest.TestCase):
+
+    def test_rate_limit_pauses_and_retries(self):
+        agent = _FlakyChatAgent([_StatusError(429, {"retry-after": "7"}), _StatusError(503)])
+
+        response = agent.send_message(_message())
+
+        self.assertEqual(response.message, "ok")
+        self.assertEqual(agent.calls, 3)
+        agent.rate_limiter.pause.assert_called_once_with(7.0)
+        self.assertEqual(agent.rate_limiter.acquire.call_count, 3)
+        agent.rate_limiter.settle.assert_called_with(_estimate_tokens(_message(), []), 12)
+
+    def test_client_errors_are_not_retried(self):
+        agent = _FlakyChatAgent([_StatusError(400)])
+
+        response = agent.send_message(_message())
+
+        self.assertTrue(response.is_error)
+        self.assertEqual(agent.calls, 1)
+
+    def test_gives_up_after_max_retries(self):
+        agent = _FlakyChatAgent([_StatusError(500) for _ in range(10)])
+        agent.max_retries = 2
+
+        response = agent.send_message(_message())
+
+        self.assertTrue(response.is_error)
+        self.assertEqual(agent.calls, 3)
+
+    def test_stream_retries_before_first_chunk(self):
+        agent = _FlakyChatAgent([_StatusError(502)])
+
+        self.assertEqual(list(agent.stream_message(_message())), ["ok"])
+        self.assertEqual(agent.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
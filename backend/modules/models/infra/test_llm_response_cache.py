@@ -0,0 +1,88 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+
+from modules.chat.application.dto.context_message_dto import ContextMessageDTO
+from modules.chat.domain.context_message_type import ContextMessageType
+from modules.models.application.dto.chat_agent_message_egress_dto import ChatAgentMessageEgressDTO
+from modules.models.application.dto.chat_agent_message_ingress_dto import ChatAgentMessageIngressDTO
+from modules.models.infra.llm_response_cache import LLMResponseCache
+
+
+def _message(user_prompt: str = "prompt", system_prompt: str = "system") -> ChatAgentMessageIngressDTO:
+    return ChatAgentMessageIngressDTO(user_prompt=user_prompt, system_prompt=system_prompt, regulation_fragment_id=1)
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    """Unit tests for the LLMResponseCache class, using a temporary directory."""
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.cache = LLMResponseCache(self._directory.name, enabled=True, ttl=60, max_bytes=10_000)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_key_depends_on_everything_sent(self):
+        """Changing the model, a prompt or the context changes the key."""
+        context = [ContextMessageDTO(type=ContextMessageType.USER, content="before")]
+        key = LLMResponseCache.key("agent:model:0", _message(), context)
+
+        self.assertEqual(key, LLMResponseCache.key("agent:model:0", _message(), list(context)))
+        self.assertNotEqual(key, LLMResponseCache.key("agent:model:1", _message(), context))
+        self.assertNotEqual(key, LLMResponseCache.key("agent:model:0", _message(user_prompt="other"), context))
+        self.assertNotEqual(key, LLMResponseCache.key("agent:model:0", _message(system_prompt="other"), context))
+        self.assertNotEqual(key, LLMResponseCache.key("agent:model:0", _message(), []))
+
+    def test_get_returns_stored_response(self):
+        """A stored response is returned, unknown keys miss."""
+        response = ChatAgentMessageEgressDTO(message="answer", input_tokens=3, output_tokens=4)
+        self.cache.put("a", response)
+
+        self.assertEqual(self.cache.get("a"), response)
+        self.assertIsNone(self.cache.get("b"))
+
+    def test_expired_entries_are_not_served(self):
+        """Entries older than the TTL are dropped."""
+        self.cache.put("a", ChatAgentMessageEgressDTO(message="answer"))
+        past = time.time() - 120
+        os.utime(os.path.join(self._directory.name, "a.json"), (past, past))
+
+        self.assertIsNone(self.cache.get("a"))
+
+    def test_oldest_entries_are_evicted(self):
+        """Once the size limit is exceeded, the oldest entries go first."""
+        for i in range(5):
+            self.cache.put(str(i), ChatAgentMessageEgressDTO(message="x" * 3000))
+            modified = time.time() - 10 + i
+            os.utime(os.path.join(self._directory.name, f"{i}.json"), (modified, modified))
+
+        self.cache.put("5", ChatAgentMessageEgressDTO(message="x" * 3000))
+
+        self.assertIsNone(self.cache.get("0"))
+        self.assertIsNone(self.cache.get("2"))
+        self.assertIsNotNone(self.cache.get("3"))
+        self.assertIsNotNone(self.cache.get("5"))
+
+
+if __name__ == "__main__":
+    unittest.main()
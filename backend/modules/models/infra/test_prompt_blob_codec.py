@@ -0,0 +1,41 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+from modules.models.infra.prompt_blob_codec import encode_prompt, decode_prompt
+
+
+class TestPromptBlobCodec(unittest.TestCase):
+
+    def test_round_trip(self):
+        prompt = "Art. 5 – Die Verkäuferin {muss} zahlen.\n" * 100
+
+        prompt_hash, content, size = encode_prompt(prompt)
+
+        self.assertEqual(decode_prompt(content), prompt)
+        self.assertEqual(size, len(prompt.encode("utf-8")))
+        self.assertLess(len(content), size)
+
+    def test_same_prompt_same_address(self):
+        self.assertEqual(encode_prompt("a")[0], encode_prompt("a")[0])
+        self.assertNotEqual(encode_prompt("a")[0], encode_prompt("b")[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
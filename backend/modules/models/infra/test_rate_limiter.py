@@ -0,0 +1,91 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+from modules.models.infra.rate_limiter import RateLimiter
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = _FakeClock()
+
+    def _limiter(self, requests_per_minute=None, tokens_per_minute=None) -> RateLimiter:
+        return RateLimiter(requests_per_minute, tokens_per_minute, clock=self.clock, sleep=self.clock.sleep)
+
+    def test_unlimited_never_waits(self):
+        limiter = self._limiter()
+
+        for _ in range(100):
+            limiter.acquire(10_000)
+
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_requests_wait_for_refill(self):
+        limiter = self._limiter(requests_per_minute=60)
+
+        for _ in range(61):
+            limiter.acquire(1)
+
+        self.assertAlmostEqual(sum(self.clock.sleeps), 1.0)
+
+    def test_tokens_wait_for_refill_and_settle_corrects_estimate(self):
+        limiter = self._limiter(tokens_per_minute=600)
+
+        limiter.acquire(600)
+        # The request used less than estimated, the rest is available again
+        limiter.settle(600, 300)
+        limiter.acquire(300)
+        self.assertEqual(self.clock.sleeps, [])
+
+        limiter.acquire(60)
+        self.assertAlmostEqual(sum(self.clock.sleeps), 6.0)
+
+    def test_oversized_request_waits_for_full_bucket(self):
+        limiter = self._limiter(tokens_per_minute=600)
+        limiter.acquire(600)
+
+        limiter.acquire(10_000)
+
+        self.assertAlmostEqual(sum(self.clock.sleeps), 60.0)
+
+    def test_pause_holds_back_requests(self):
+        limiter = self._limiter()
+
+        limiter.pause(5)
+        limiter.acquire(1)
+
+        self.assertAlmostEqual(sum(self.clock.sleeps), 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class CompiledKnowledgeBaseDTO(BaseModel):
+    """
+    The formatted knowledge base of a regulation fragment, together with what the reasoning needs besides it.
+
+    regulation_fragment_id: ID of the regulation fragment the knowledge base belongs to
+    knowledge_base: The formatted knowledge base (dynamic declarations and rules, no facts)
+    goal: Head of the goal rule used when running examples, None if the fragment has no goal
+    atom_count: Number of atoms of the fragment
+    rule_count: Number of rules (including goals) of the fragment
+    """
+    regulation_fragment_id: int
+    knowledge_base: str
+    goal: Optional[str] = None
+    atom_count: int
+    rule_count: int
+
+    class Config:
+        extra = "forbid"
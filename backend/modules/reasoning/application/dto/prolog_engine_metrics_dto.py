@@ -0,0 +1,53 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class PrologTransportMetricsDTO(BaseModel):
+    """
+    Usage of the HTTP connection pool to the Prolog engine (per worker).
+
+    pool_size: Maximum number of connections to the engine
+    in_use: Number of requests currently in flight
+    idle: Number of open keep-alive connections waiting to be reused
+    requests: Number of requests sent since the worker started
+    total_wait_seconds: Time requests spent waiting for a free connection
+    max_wait_seconds: Longest time a single request waited for a free connection
+    """
+    pool_size: int
+    in_use: int
+    idle: int
+    requests: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+
+class PrologEngineMetricsDTO(BaseModel):
+    """
+    Usage of the connections and sessions to the Prolog engine (per worker).
+
+    transport: Usage of the HTTP connection pool, None if the engine is not reached over HTTP
+    live_sessions: Number of persistent pengines (or local Prolog processes) currently alive
+    idle_sessions: Number of persistent pengines (or local Prolog processes) waiting to be reused
+    """
+    transport: Optional[PrologTransportMetricsDTO] = None
+    live_sessions: int
+    idle_sessions: int
@@ -16,8 +16,14 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
+from typing import List
+
 from pydantic import BaseModel
 
 
 class PrologQueryDTO(BaseModel):
-    facts: str
\ No newline at end of file
+    facts: str
+
+
+class PrologBatchQueryDTO(BaseModel):
+    examples: List[PrologQueryDTO]
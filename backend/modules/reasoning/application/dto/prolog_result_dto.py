@@ -37,3 +37,8 @@ class PrologAnswerDTO(BaseModel):
 class PrologHttpResponseDTO(BaseModel):
     status: Literal["success", "failure", "error"]
     answers: List[PrologAnswerDTO]
+
+
+# The result of a single example of a batch, streamed back as soon as it is evaluated
+class PrologBatchResultDTO(PrologHttpResponseDTO):
+    index: int
@@ -0,0 +1,69 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from modules.common.util import format_prolog_knowledge_base
+from modules.reasoning.application.dto.compiled_knowledge_base_dto import CompiledKnowledgeBaseDTO
+from modules.reasoning.infra.knowledge_base_cache import KnowledgeBaseCache
+from modules.regulation_fragment.application.fragment_aggregate_service import FragmentAggregateService
+
+
+class KnowledgeBaseService:
+    """
+    Service providing the compiled knowledge base of a regulation fragment.
+    Knowledge bases are cached per fragment revision, so an unchanged fragment is neither loaded from the database
+    nor formatted again.
+    """
+
+    def __init__(self,
+                 fragment_aggregate_service: FragmentAggregateService,
+                 knowledge_base_cache: KnowledgeBaseCache,
+                 ):
+        self._fragment_aggregate_service = fragment_aggregate_service
+        self._knowledge_base_cache = knowledge_base_cache
+
+    def get_knowledge_base(self, regulation_fragment_id: int) -> CompiledKnowledgeBaseDTO:
+        """
+        Get the compiled knowledge base of a regulation fragment.
+
+        :param regulation_fragment_id: The ID of the regulation fragment.
+        :return: The compiled knowledge base.
+        """
+        regulation_fragment_id = int(regulation_fragment_id)
+
+        # Read the revision before loading, so a concurrent write results in a new revision instead of a stale entry.
+        revision = self._knowledge_base_cache.revision(regulation_fragment_id)
+        compiled = self._knowledge_base_cache.get(regulation_fragment_id, revision)
+        if compiled is not None:
+            return compiled
+
+        aggregate = self._fragment_aggregate_service.get(regulation_fragment_id)
+        atoms = aggregate.atoms if aggregate else []
+        rules = aggregate.rules if aggregate else []
+
+        goal = next((rule for rule in rules if rule.is_goal), None)
+
+        compiled = CompiledKnowledgeBaseDTO(
+            regulation_fragment_id=regulation_fragment_id,
+            knowledge_base=format_prolog_knowledge_base(atoms, rules),
+            goal=goal.definition.split(":-")[0].strip() if goal else None,
+            atom_count=len(atoms),
+            rule_count=len(rules),
+        )
+
+        self._knowledge_base_cache.put(revision, compiled)
+        return compiled
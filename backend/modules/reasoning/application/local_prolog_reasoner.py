@@ -0,0 +1,217 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import io
+import os
+import subprocess
+import threading
+from typing import List, Literal, Tuple, Optional
+
+from dotenv import load_dotenv
+
+from modules.reasoning.application.dto.prolog_engine_metrics_dto import PrologEngineMetricsDTO
+from modules.reasoning.application.dto.prolog_result_dto import PrologAnswerDTO, PrologResultDTO
+from modules.reasoning.domain.i_prolog_reasoner import IPrologReasoner, summarize_answers
+
+# Load environment variables
+load_dotenv()
+
+
+class LocalPrologReasoner(IPrologReasoner):
+    """
+    A reasoner that executes Prolog code in local `swipl` processes, talking to them over pipes.
+    Meant for single node installations where SWI-Prolog is installed next to the backend, avoiding the HTTP
+    round trip and the JSON encoding of the pengine service. The protocol is documented in prolog/local_reasoner.pl.
+    """
+
+    # We cannot really handle many solutions anyways, so we truncate at 1000 like the pengine session pool.
+    MAX_SOLUTIONS = 1_000
+
+    def __init__(self,
+                 command: Optional[List[str]] = None,
+                 max_processes: Optional[int] = None,
+                 time_limit: Optional[float] = None):
+        """
+        :param command: The command starting the Prolog driver. Defaults to SWIPL_PATH (or `swipl`) running
+            PROLOG_LOCAL_DRIVER (or ./prolog/local_reasoner.pl).
+        :param max_processes: Maximum number of Prolog processes, i.e., concurrent queries. Defaults to
+            PROLOG_LOCAL_PROCESSES or 2.
+        :param time_limit: Seconds a goal may run per fact set. Defaults to PROLOG_LOCAL_TIME_LIMIT or 60.
+        """
+        self._command = command or [
+            os.getenv("SWIPL_PATH", "swipl"),
+            os.getenv("PROLOG_LOCAL_DRIVER", "./prolog/local_reasoner.pl"),
+        ]
+        self._max_processes = max_processes or int(os.getenv("PROLOG_LOCAL_PROCESSES", "2"))
+        self._time_limit = time_limit or float(os.getenv("PROLOG_LOCAL_TIME_LIMIT", "60"))
+
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self._max_processes)
+        self._idle: List[_PrologProcess] = []
+        self._live = 0
+
+    def execute_prolog(self, knowledge_base: str, goal: str) -> Tuple[
+        Literal["success", "failure", "error"], List[PrologAnswerDTO]]:
+        answers = self._ask(knowledge_base, goal, [""])[0]
+        return summarize_answers(answers), answers
+
+    def execute_prolog_batch(self, knowledge_base: str, goal: str, fact_sets: List[List[str]]) -> List[Tuple[
+        Literal["success", "failure", "error"], List[PrologAnswerDTO]]]:
+        if not fact_sets:
+            return []
+
+        results = self._ask(knowledge_base, goal, ["".join(f"{fact}.\n" for fact in facts) for facts in fact_sets])
+        return [(summarize_answers(answers), answers) for answers in results]
+
+    def metrics(self) -> PrologEngineMetricsDTO:
+        """
+        Number of Prolog processes of this worker.
+        """
+        with self._lock:
+            return PrologEngineMetricsDTO(
+                live_sessions=self._live,
+                idle_sessions=len(self._idle),
+            )
+
+    def close(self) -> None:
+        """
+        Stop all idle Prolog processes.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._live -= len(idle)
+
+        for process in idle:
+            process.close()
+
+    def _ask(self, knowledge_base: str, goal: str, fact_sets: List[str]) -> List[List[PrologAnswerDTO]]:
+        print(f"Goal: {goal}")
+
+        with self._slots:
+            try:
+                process = self._checkout()
+            except OSError as e:
+                # E.g. swipl is not installed, answered like every other process failure
+                print(f"Local Prolog process could not be started: {str(e)}")
+                error = PrologAnswerDTO(status="error", answers=[],
+                                        message=f"The Prolog process could not be started: {str(e)}")
+                return [[error] for _ in fact_sets]
+
+            try:
+                results = process.ask(knowledge_base, goal, fact_sets, self.MAX_SOLUTIONS, self._time_limit)
+            except (OSError, ValueError) as e:
+                # The process died or the protocol got out of sync, it cannot be reused.
+                print(f"Local Prolog process failed: {str(e)}")
+                self._discard(process)
+                error = PrologAnswerDTO(status="error", answers=[], message=f"The Prolog process failed: {str(e)}")
+                return [[error] for _ in fact_sets]
+
+            with self._lock:
+                self._idle.append(process)
+
+        return results
+
+    def _checkout(self) -> "_PrologProcess":
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+            self._live += 1
+
+        try:
+            return _PrologProcess(self._command)
+        except OSError:
+            with self._lock:
+                self._live -= 1
+            raise
+
+    def _discard(self, process: "_PrologProcess") -> None:
+        with self._lock:
+            self._live -= 1
+        process.close()
+
+
+class _PrologProcess:
+    """
+    A single `swipl` process running the driver, answering one request at a time.
+    """
+
+    def __init__(self, command: List[str]):
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        # Lengths are counted in characters on both sides, so no newline translation may happen.
+        self._stdin = io.TextIOWrapper(self._process.stdin, encoding="utf-8", newline="")
+        self._stdout = io.TextIOWrapper(self._process.stdout, encoding="utf-8", newline="")
+
+    def ask(self, knowledge_base: str, goal: str, fact_sets: List[str], limit: int, time_limit: float) -> List[
+        List[PrologAnswerDTO]]:
+        self._stdin.write(
+            f"ask {limit} {time_limit} {len(knowledge_base)} {len(goal)} {len(fact_sets)}\n{knowledge_base}{goal}"
+        )
+        for facts in fact_sets:
+            self._stdin.write(f"{len(facts)}\n{facts}")
+        self._stdin.flush()
+
+        return [self._read_result() for _ in fact_sets]
+
+    def close(self) -> None:
+        try:
+            self._stdin.close()
+            self._process.wait(timeout=5)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            self._process.kill()
+
+    def _read_result(self) -> List[PrologAnswerDTO]:
+        tag, count = self._read_header()
+        if tag != "result":
+            raise ValueError(f"Unexpected response from Prolog process: {tag}")
+
+        return [self._read_answer() for _ in range(count)]
+
+    def _read_answer(self) -> PrologAnswerDTO:
+        tag, length = self._read_header()
+
+        if tag == "success":
+            answers = []
+            for _ in range(length):
+                name_length, value_length = (int(part) for part in self._stdout.readline().split())
+                answers.append(PrologResultDTO(
+                    variable=self._read_exactly(name_length),
+                    value=self._read_exactly(value_length),
+                ))
+            return PrologAnswerDTO(status="success", answers=answers)
+
+        if tag == "failure":
+            return PrologAnswerDTO(status="failure", answers=[])
+
+        if tag == "error":
+            return PrologAnswerDTO(status="error", answers=[], message=self._read_exactly(length))
+
+        raise ValueError(f"Unexpected response from Prolog process: {tag}")
+
+    def _read_header(self) -> Tuple[str, int]:
+        line = self._stdout.readline()
+        if not line:
+            raise ValueError("Prolog process terminated unexpectedly")
+
+        tag, length = line.split()
+        return tag, int(length)
+
+    def _read_exactly(self, length: int) -> str:
+        text = self._stdout.read(length)
+        if len(text) != length:
+            raise ValueError("Prolog process terminated unexpectedly")
+        return text
@@ -0,0 +1,285 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import requests
+
+from modules.reasoning.infra.prolog_http_transport import PrologHttpTransport
+
+
+@dataclass
+class PengineSession:
+    """
+    A long-lived pengine on the Prolog engine which already consulted a knowledge base.
+    """
+    pengine_id: str
+    knowledge_base_hash: str
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class PengineSessionPool:
+    """
+    Pool of persistent pengines keyed by the hash of the knowledge base they consulted.
+
+    Creating a pengine makes SWI-Prolog consult the full `src_text` again. Since most queries run against the
+    same knowledge base over and over, we keep the pengine alive after the first query (`destroy: false`) and ask
+    follow-up goals through `/pengine/send`. Idle sessions are destroyed after `idle_timeout` seconds and at most
+    `max_sessions` pengines are kept alive at the same time.
+    """
+
+    def __init__(self, prolog_url: str, transport: PrologHttpTransport, max_sessions: int = 8,
+                 idle_timeout: float = 60.0, chunk: int = 1_000):
+        """
+        :param prolog_url: Base URL of the Prolog engine.
+        :param transport: Pooled HTTP transport used for all requests to the engine.
+        :param max_sessions: Maximum number of pengines kept alive at the same time.
+        :param idle_timeout: Seconds after which an unused pengine is destroyed. Should be below the `idle_limit`
+            of the engine, otherwise the engine will have destroyed the pengine already.
+        :param chunk: Maximum number of solutions returned for a single query.
+        """
+        self._prolog_url = prolog_url
+        self._transport = transport
+        self._max_sessions = max_sessions
+        self._idle_timeout = idle_timeout
+        self._chunk = chunk
+
+        self._lock = threading.Lock()
+        self._idle_sessions: Dict[str, List[PengineSession]] = {}
+        self._live_sessions = 0
+
+    def ask(self, knowledge_base: str, goal: str) -> List[dict]:
+        """
+        Ask a goal against the knowledge base, reusing a pengine that already consulted it if possible.
+
+        :param knowledge_base: The Prolog source the goal is evaluated against.
+        :param goal: The goal to ask.
+        :return: The list of pengine events returned by the engine.
+        """
+        knowledge_base_hash = hashlib.sha256(knowledge_base.encode("utf-8")).hexdigest()
+
+        session = self._acquire(knowledge_base_hash)
+        if session is not None:
+            events = self._send_ask(session, goal)
+            if events is not None:
+                self._release(session, events)
+                return events
+
+            # The pengine is gone (e.g., the engine hit its own idle limit), fall back to a fresh one.
+            self._discard(session)
+
+        return self._create(knowledge_base, knowledge_base_hash, goal)
+
+    @property
+    def live_sessions(self) -> int:
+        return self._live_sessions
+
+    @property
+    def idle_sessions(self) -> int:
+        with self._lock:
+            return sum(len(sessions) for sessions in self._idle_sessions.values())
+
+    def close(self) -> None:
+        """
+        Destroy all idle pengines.
+        """
+        with self._lock:
+            sessions = [session for sessions in self._idle_sessions.values() for session in sessions]
+            self._idle_sessions = {}
+            self._live_sessions -= len(sessions)
+
+        for session in sessions:
+            self._destroy(session.pengine_id)
+
+    def _acquire(self, knowledge_base_hash: str) -> Optional[PengineSession]:
+        expired = self._evict_expired()
+        for session in expired:
+            self._destroy(session.pengine_id)
+
+        with self._lock:
+            sessions = self._idle_sessions.get(knowledge_base_hash)
+            if not sessions:
+                return None
+            return sessions.pop()
+
+    def _release(self, session: PengineSession, events: List[dict]) -> None:
+        if _has_more(events):
+            # The pengine waits for `next` or `stop`, it cannot be asked again until we stop the query.
+            try:
+                self._send(session.pengine_id, "stop")
+            except (requests.RequestException, ValueError):
+                self._discard(session)
+                return
+
+        session.last_used = time.monotonic()
+        with self._lock:
+            self._idle_sessions.setdefault(session.knowledge_base_hash, []).append(session)
+
+    def _discard(self, session: PengineSession) -> None:
+        with self._lock:
+            self._live_sessions -= 1
+        self._destroy(session.pengine_id)
+
+    def _evict_expired(self) -> List[PengineSession]:
+        now = time.monotonic()
+        expired = []
+
+        with self._lock:
+            for knowledge_base_hash in list(self._idle_sessions):
+                sessions = self._idle_sessions[knowledge_base_hash]
+                alive = [session for session in sessions if now - session.last_used < self._idle_timeout]
+                expired.extend(session for session in sessions if now - session.last_used >= self._idle_timeout)
+
+                if alive:
+                    self._idle_sessions[knowledge_base_hash] = alive
+                else:
+                    del self._idle_sessions[knowledge_base_hash]
+
+            self._live_sessions -= len(expired)
+
+        return expired
+
+    def _reserve_slot(self) -> bool:
+        """
+        Reserve a slot for a new persistent pengine.
+        If the pool is full, the least recently used idle pengine is evicted to make room.
+
+        :return: False if all slots are taken by pengines which are currently in use.
+        """
+        evicted = None
+        with self._lock:
+            if self._live_sessions < self._max_sessions:
+                self._live_sessions += 1
+                return True
+
+            idle = [session for sessions in self._idle_sessions.values() for session in sessions]
+            if not idle:
+                return False
+
+            evicted = min(idle, key=lambda session: session.last_used)
+            self._idle_sessions[evicted.knowledge_base_hash].remove(evicted)
+            if not self._idle_sessions[evicted.knowledge_base_hash]:
+                del self._idle_sessions[evicted.knowledge_base_hash]
+
+        self._destroy(evicted.pengine_id)
+        return True
+
+    def _create(self, knowledge_base: str, knowledge_base_hash: str, goal: str) -> List[dict]:
+        persistent = self._reserve_slot()
+
+        try:
+            res = self._transport.post(f"{self._prolog_url}/pengine/create", json={
+                "ask": goal,
+                "src_text": knowledge_base,
+                "application": "pengine_sandbox",
+                "format": "json",
+                "chunk": self._chunk,
+                "destroy": not persistent,
+            })
+            if not res.ok:
+                print(f"Creating a pengine failed with status code {res.status_code}: {res.text}")
+            response_body = res.json()
+        except Exception:
+            if persistent:
+                with self._lock:
+                    self._live_sessions -= 1
+            raise
+
+        events = response_body if isinstance(response_body, list) else [response_body]
+
+        if persistent:
+            pengine_id = next((event.get("id") for event in events if event.get("event") == "create"), None)
+
+            # Only clean sessions are kept. Syntax errors in the knowledge base are only reported while consulting,
+            # so a pengine reused for the same knowledge base would silently hide them.
+            if pengine_id is not None and not _contains_error(events):
+                self._release(PengineSession(pengine_id=pengine_id, knowledge_base_hash=knowledge_base_hash), events)
+            else:
+                with self._lock:
+                    self._live_sessions -= 1
+                if pengine_id is not None:
+                    self._destroy(pengine_id)
+
+        return events
+
+    def _send_ask(self, session: PengineSession, goal: str) -> Optional[List[dict]]:
+        """
+        Ask a goal on an existing pengine.
+
+        :return: The events returned by the engine, or None if the pengine cannot be used anymore.
+        """
+        try:
+            event = self._send(session.pengine_id, f"ask(({goal}), [chunk({self._chunk})])")
+        except requests.Timeout:
+            # Repeating the query on a fresh pengine would most likely hang again.
+            self._discard(session)
+            raise
+        except (requests.RequestException, ValueError) as e:
+            print(f"Error asking pengine {session.pengine_id}: {str(e)}")
+            return None
+
+        if event.get("event") == "output":
+            # Output is delivered in separate responses which we do not pull, the result would be incomplete.
+            return None
+
+        if event.get("event") == "error" and event.get("code") == "existence_error" \
+                and "pengine" in str(event.get("data", "")):
+            return None
+
+        return [event]
+
+    def _send(self, pengine_id: str, event: str) -> dict:
+        res = self._transport.post(
+            f"{self._prolog_url}/pengine/send",
+            params={"id": pengine_id, "format": "json"},
+            data=f"{event} .".encode("utf-8"),
+            headers={"Content-Type": "application/x-prolog; charset=UTF-8"},
+        )
+        res.raise_for_status()
+        return res.json()
+
+    def _destroy(self, pengine_id: str) -> None:
+        try:
+            self._send(pengine_id, "destroy")
+        except (requests.RequestException, ValueError):
+            # The engine destroys abandoned pengines on its own after its idle limit.
+            pass
+
+
+def _has_more(events: List[dict]) -> bool:
+    for event in events:
+        if event.get("more", False):
+            return True
+        nested = event.get("answer")
+        if isinstance(nested, dict) and _has_more([nested]):
+            return True
+    return False
+
+
+def _contains_error(events: List[dict]) -> bool:
+    for event in events:
+        if event.get("event") in ("error", "output"):
+            return True
+        nested = event.get("answer") or event.get("data")
+        if isinstance(nested, dict) and _contains_error([nested]):
+            return True
+    return False
@@ -17,74 +17,135 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
 import os
-from typing import List, Literal, Tuple, Generator, Union, Dict
+import re
+from typing import List, Literal, Tuple, Generator, Union, Dict, Optional
 
 import requests
 from dotenv import load_dotenv
 
+from modules.reasoning.application.dto.prolog_engine_metrics_dto import PrologEngineMetricsDTO
 from modules.reasoning.application.dto.prolog_result_dto import PrologResultDTO, PrologAnswerDTO
+from modules.reasoning.application.pengine_session_pool import PengineSessionPool
+from modules.reasoning.domain.i_prolog_reasoner import IPrologReasoner, summarize_answers
+from modules.reasoning.infra.prolog_http_transport import PrologHttpTransport
 
 # Load environment variables
 load_dotenv()
 
 
-class PrologReasoner:
+class PrologReasoner(IPrologReasoner):
     """
     A reasoner that executes Prolog code using an HTTP connection to a Prolog engine.
-    This reasoner does not inherit from SymbolicReasoner.
     """
 
-    def __init__(self):
+    def __init__(self, transport: Optional[PrologHttpTransport] = None):
         """
         Initialize the PrologReasoner with the URL of the Prolog engine.
         The URL is read from the SWI_PROLOG_URL environment variable.
+        The pengine session pool can be tuned with PROLOG_SESSION_POOL_SIZE and PROLOG_SESSION_IDLE_TIMEOUT.
+
+        :param transport: The HTTP transport to the engine. If omitted, the reasoner creates its own keep-alive
+            transport configured by PROLOG_HTTP_POOL_SIZE, PROLOG_CONNECT_TIMEOUT and PROLOG_READ_TIMEOUT.
         """
         self.prolog_url = os.getenv("SWI_PROLOG_URL")
         if not self.prolog_url:
             raise ValueError("SWI_PROLOG_URL environment variable is not set")
 
-    def execute_prolog(self, knowledge_base: str, goal: str) -> Tuple[
-        Literal["success", "failure", "error"], List[PrologAnswerDTO]]:
-        # Step 1: Send initial query
-        print(f"Sending request to {self.prolog_url}/pengine/create")
-        print(f"Knowledge base: {knowledge_base}")
-        print(f"Goal: {goal}")
+        self._transport = transport or PrologHttpTransport(
+            pool_size=int(os.getenv("PROLOG_HTTP_POOL_SIZE", "8")),
+            connect_timeout=float(os.getenv("PROLOG_CONNECT_TIMEOUT", "3.05")),
+            read_timeout=float(os.getenv("PROLOG_READ_TIMEOUT", "60")),
+        )
 
-        res = requests.post(f"{self.prolog_url}/pengine/create", json={
-            "ask": goal,
-            "src_text": knowledge_base,
-            "application": "pengine_sandbox",
-            "format": "json",
-            # We cannot really handle many solutions anyways so just truncating at 1000 is good enough.
-            "chunk": 1_000
-        })
-        print(f"Response status code: {res.status_code}")
-        print(f"Response content: {res.text}")
-
-        response_body = res.json()
-        print(f"Response body: {response_body}")
+        self._session_pool = PengineSessionPool(
+            self.prolog_url,
+            self._transport,
+            max_sessions=int(os.getenv("PROLOG_SESSION_POOL_SIZE", "8")),
+            idle_timeout=float(os.getenv("PROLOG_SESSION_IDLE_TIMEOUT", "60")),
+        )
 
-        if not type(response_body) is list:
-            response_body = [response_body]
+    def execute_prolog(self, knowledge_base: str, goal: str) -> Tuple[
+        Literal["success", "failure", "error"], List[PrologAnswerDTO]]:
+        response_body = self._ask(knowledge_base, goal)
 
         answers = list(
             answer for res in response_body for answer in self._process_event(res)
         )
 
-        is_error = any(
-            answer.status == "error" for answer in answers
-        )
+        return summarize_answers(answers), answers
+
+    def execute_prolog_batch(self, knowledge_base: str, goal: str, fact_sets: List[List[str]]) -> List[Tuple[
+        Literal["success", "failure", "error"], List[PrologAnswerDTO]]]:
+        """
+        Evaluate a goal once per fact set against a single consulted knowledge base in one round trip.
+
+        Each fact set is asserted before and retracted after its evaluation, hence the facts have to belong to
+        predicates declared dynamic in the knowledge base. Otherwise, the evaluation of that fact set fails with an
+        error. Only the facts which were actually asserted are retracted again, one clause each, so neither a failed
+        assertion nor a clause of the knowledge base equal to a fact changes what the pengine keeps for later
+        requests.
+
+        :param knowledge_base: The knowledge base without any facts.
+        :param goal: The goal to evaluate for each fact set.
+        :param fact_sets: The fact sets, each fact given as a Prolog term without the terminating period.
+        :return: The status and answers for each fact set, in the same order as the fact sets.
+        """
+        if not fact_sets:
+            return []
 
-        is_failure = any(
-            answer.status == "failure" for answer in answers
+        variables = list(dict.fromkeys(re.findall(r"\b[A-Z][A-Za-z0-9_]*", goal)))
+        template = "[" + ", ".join(f"['{variable}', _B{i}]" for i, variable in enumerate(variables)) + "]"
+        formatted_goal = ", ".join(
+            [f"({goal})"] + [f'format(string(_B{i}), "~w", [{variable}])' for i, variable in enumerate(variables)]
         )
 
-        if is_error:
-            return "error", answers
-        elif is_failure:
-            return "failure", answers
+        batch_goal = ",\n".join(
+            f"catch(setup_call_cleanup({_assert_facts(facts, i)}, "
+            f"({_raise_assert_errors(facts, i)}findall({template}, ({formatted_goal}), _S{i})), "
+            f"{_retract_facts(facts, i)}), _E{i}, true), "
+            f"(nonvar(_E{i}) -> format(string(_M{i}), \"~w\", [_E{i}]), _R{i} = [error, _M{i}, []] "
+            f"; _S{i} == [] -> _R{i} = [failure, \"\", []] "
+            f"; _R{i} = [success, \"\", _S{i}])"
+            for i, facts in enumerate(fact_sets)
+        ) + f",\nResults = [{', '.join(f'_R{i}' for i in range(len(fact_sets)))}]"
+
+        response_body = self._ask(knowledge_base, batch_goal)
+
+        results = _find_binding(response_body, "Results")
+        if results is None:
+            # The batch as a whole failed, e.g., because the knowledge base does not compile.
+            answers = list(
+                answer for res in response_body for answer in self._process_event(res)
+            )
+            return [(summarize_answers(answers), answers) for _ in fact_sets]
+
+        return [_batch_result(status, message, solutions) for status, message, solutions in results]
+
+    def _ask(self, knowledge_base: str, goal: str) -> List[dict]:
+        # Step 1: Send query, reusing a pengine which already consulted the knowledge base if possible
+        print(f"Sending request to {self.prolog_url}")
+        print(f"Knowledge base: {knowledge_base}")
+        print(f"Goal: {goal}")
+
+        # We cannot really handle many solutions anyways so the pool truncates at 1000, which is good enough.
+        try:
+            response_body = self._session_pool.ask(knowledge_base, goal)
+        except requests.Timeout as e:
+            print(f"Prolog engine timed out: {str(e)}")
+            response_body = [{"event": "error", "data": f"The Prolog engine did not answer in time: {str(e)}"}]
 
-        return "success", answers
+        print(f"Response body: {response_body}")
+        return response_body
+
+    def metrics(self) -> PrologEngineMetricsDTO:
+        """
+        Usage of the connection pool and the pengine sessions of this worker.
+        """
+        return PrologEngineMetricsDTO(
+            transport=self._transport.metrics(),
+            live_sessions=self._session_pool.live_sessions,
+            idle_sessions=self._session_pool.idle_sessions,
+        )
 
     def _process_event(self, event: dict) -> Generator[PrologAnswerDTO, None]:
         event_type = event.get("event", None)
@@ -141,3 +202,62 @@ class PrologReasoner:
 
         else:
             raise ValueError(f"Unknown event type: {event_type}")
+
+
+def _find_binding(events: List[dict], variable: str):
+    """
+    Find the value of a variable in the first solution of a successful query.
+    Returns None if the query did not succeed cleanly.
+    """
+    for event in events:
+        event_type = event.get("event")
+        if event_type in ("error", "output"):
+            return None
+        if event_type == "create" and isinstance(event.get("answer"), dict):
+            return _find_binding([event["answer"]], variable)
+        if event_type == "destroy" and isinstance(event.get("data"), dict):
+            return _find_binding([event["data"]], variable)
+        if event_type == "success" and event.get("data"):
+            return event["data"][0].get(variable)
+    return None
+
+
+def _batch_result(status: str, message: str, solutions: List[List[List[str]]]) -> Tuple[
+    Literal["success", "failure", "error"], List[PrologAnswerDTO]]:
+    if status == "error":
+        return "error", [PrologAnswerDTO(status="error", answers=[], message=message)]
+
+    if status == "failure":
+        return "failure", [PrologAnswerDTO(status="failure", answers=[])]
+
+    return "success", [
+        PrologAnswerDTO(
+            status="success",
+            answers=[PrologResultDTO(variable=variable, value=value) for variable, value in solution]
+        )
+        for solution in solutions
+    ]
+
+
+def _assert_facts(facts: List[str], index: int) -> str:
+    """
+    Goal asserting the facts of a fact set, which never throws. The error of each assertion is bound to its own
+    variable instead, so the cleanup knows exactly which facts were asserted.
+    """
+    return "(" + ", ".join(
+        [f"catch(assertz({fact}), _A{index}_{k}, true)" for k, fact in enumerate(facts)] or ["true"]
+    ) + ")"
+
+
+def _raise_assert_errors(facts: List[str], index: int) -> str:
+    return "".join(f"(nonvar(_A{index}_{k}) -> throw(_A{index}_{k}) ; true), " for k in range(len(facts)))
+
+
+def _retract_facts(facts: List[str], index: int) -> str:
+    """
+    Goal retracting one clause per asserted fact. Unlike retractall, the clauses left are the same as before even if
+    the knowledge base defines a clause equal to a fact.
+    """
+    return "(" + ", ".join(
+        [f"(var(_A{index}_{k}) -> ignore(retract({fact})) ; true)" for k, fact in enumerate(facts)] or ["true"]
+    ) + ")"
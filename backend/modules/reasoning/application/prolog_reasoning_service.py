@@ -16,11 +16,15 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
-from modules.atoms.application.atom_service import AtomService
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Iterator, Tuple, Optional
+
 from modules.atoms.application.atom_util import create_wildcard_predicates, atoms_to_dynamic_statement
-from modules.common.util import format_prolog_knowledge_base
-from modules.reasoning.application.prolog_reasoner import PrologReasoner
-from modules.rules.application.rule_service import RuleService
+from modules.common.prolog_syntax import split_clauses, PrologSyntaxError
+from modules.reasoning.application.dto.prolog_result_dto import PrologBatchResultDTO, PrologAnswerDTO
+from modules.reasoning.application.knowledge_base_service import KnowledgeBaseService
+from modules.reasoning.domain.i_prolog_reasoner import IPrologReasoner
 
 
 class PrologReasoningService:
@@ -30,13 +34,15 @@ class PrologReasoningService:
     """
 
     def __init__(self,
-                 rule_service: RuleService,
-                 atom_service: AtomService,
-                 prolog_reasoner: PrologReasoner,
+                 knowledge_base_service: KnowledgeBaseService,
+                 prolog_reasoner: IPrologReasoner,
                  ):
-        self._rule_service = rule_service
+        self._knowledge_base_service = knowledge_base_service
         self._prolog_reasoner = prolog_reasoner
-        self._atom_service = atom_service
+
+        # Number of pengines a single batch is spread over, and number of examples evaluated per pengine round trip
+        self._batch_parallelism = int(os.getenv("PROLOG_BATCH_PARALLELISM", "4"))
+        self._batch_chunk_size = int(os.getenv("PROLOG_BATCH_CHUNK_SIZE", "25"))
 
     def run_example(self,
                     regulation_fragment_id: int,
@@ -49,19 +55,12 @@ class PrologReasoningService:
         :return:
         """
 
-        atoms = self._atom_service.get_atoms_for_regulation_fragment(regulation_fragment_id)
-        rules = self._rule_service.get_rules_for_regulation_fragment(regulation_fragment_id)
+        compiled = self._knowledge_base_service.get_knowledge_base(regulation_fragment_id)
 
         sorted_facts = "\n".join(sorted(facts.split("\n")))
-        knowledge_base = format_prolog_knowledge_base(
-            atoms,
-            rules,
-        ) + "\n" + sorted_facts
+        knowledge_base = compiled.knowledge_base + "\n" + sorted_facts
 
-        # TODO this raises if no rules are found, should handle this case
-        goal, _ = create_wildcard_predicates(
-            next(rule for rule in rules if rule.is_goal).definition.split(":-")[0].strip(),
-            wildcard_factory=lambda x: f"X{x}")
+        goal = self._goal_query(compiled.goal)
 
         print(knowledge_base)
         print(goal)
@@ -70,3 +69,72 @@ class PrologReasoningService:
             knowledge_base=knowledge_base,
             goal=goal
         )
+
+    def run_examples(self,
+                     regulation_fragment_id: int,
+                     fact_sets: List[str]) -> Iterator[PrologBatchResultDTO]:
+        """
+        Run many examples against the same regulation fragment.
+
+        The knowledge base is only consulted once per pengine, and the examples are split into chunks which are
+        evaluated in a single round trip each. Chunks are spread over a bounded number of pengines and the results
+        are returned as soon as their chunk is done, so the order of the results is not the order of the examples.
+
+        :param regulation_fragment_id: The ID of the regulation fragment to be used in the Prolog query.
+        :param fact_sets: The facts of each example, in the same format as for `run_example`.
+        :return: An iterator over the results of the examples, each tagged with the index of its example.
+        """
+        # Load everything eagerly, the results are consumed while streaming the response without an app context.
+        compiled = self._knowledge_base_service.get_knowledge_base(regulation_fragment_id)
+        knowledge_base = compiled.knowledge_base
+
+        goal = self._goal_query(compiled.goal)
+
+        # Fact sets which cannot even be split into facts are reported right away instead of failing the batch
+        examples = []
+        invalid = []
+        for index, facts in enumerate(fact_sets):
+            try:
+                examples.append((index, split_clauses(facts)))
+            except PrologSyntaxError as e:
+                invalid.append(PrologBatchResultDTO(
+                    index=index,
+                    status="error",
+                    answers=[PrologAnswerDTO(status="error", answers=[], message=str(e))],
+                ))
+
+        chunks = [
+            examples[start:start + self._batch_chunk_size]
+            for start in range(0, len(examples), self._batch_chunk_size)
+        ]
+
+        return self._run_example_chunks(knowledge_base, goal, chunks, invalid)
+
+    @staticmethod
+    def _goal_query(goal: Optional[str]) -> str:
+        if goal is None:
+            raise ValueError("No goal rule found for regulation fragment")
+
+        query, _ = create_wildcard_predicates(goal, wildcard_factory=lambda x: f"X{x}")
+        return query
+
+    def _run_example_chunks(self, knowledge_base: str, goal: str, chunks: List[List[Tuple[int, List[str]]]],
+                            invalid: List[PrologBatchResultDTO]) -> Iterator[PrologBatchResultDTO]:
+        yield from invalid
+        if not chunks:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self._batch_parallelism, len(chunks))) as executor:
+            futures = {
+                executor.submit(
+                    self._prolog_reasoner.execute_prolog_batch,
+                    knowledge_base,
+                    goal,
+                    [facts for _, facts in chunk],
+                ): chunk
+                for chunk in chunks
+            }
+
+            for future in as_completed(futures):
+                for (index, _), (status, answers) in zip(futures[future], future.result()):
+                    yield PrologBatchResultDTO(index=index, status=status, answers=answers)
@@ -0,0 +1,144 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import shutil
+import sys
+import unittest
+
+from modules.reasoning.application.local_prolog_reasoner import LocalPrologReasoner
+
+# Stands in for the Prolog driver: answers every fact set according to its content, speaking the same protocol.
+_FAKE_DRIVER = r'''
+import sys
+
+stdin = open(sys.stdin.fileno(), "r", encoding="utf-8", newline="")
+stdout = open(sys.stdout.fileno(), "w", encoding="utf-8", newline="")
+
+while True:
+    header = stdin.readline()
+    if not header:
+        break
+    _, limit, time_limit, kb_length, goal_length, count = header.split()
+    stdin.read(int(kb_length) + int(goal_length))
+    for _ in range(int(count)):
+        facts = stdin.read(int(stdin.readline()))
+        if "crash" in facts:
+            sys.exit(1)
+        if "fail" in facts:
+            stdout.write("result 1\nfailure 0\n")
+        elif "boom" in facts:
+            message = "bad\nthing"
+            stdout.write(f"result 2\nerror {len(message)}\n{message}failure 0\n")
+        else:
+            stdout.write(f"result 2\nsuccess 1\n1 {len(facts)}\nX{facts}success 0\n")
+    stdout.flush()
+'''
+
+
+class TestLocalPrologReasoner(unittest.TestCase):
+    """Unit tests for the LocalPrologReasoner class, with the Prolog driver replaced by a fake speaking the protocol."""
+
+    def setUp(self):
+        self.reasoner = LocalPrologReasoner(command=[sys.executable, "-c", _FAKE_DRIVER], max_processes=1)
+
+    def tearDown(self):
+        self.reasoner.close()
+
+    def test_execute_prolog_batch(self):
+        """Every fact set gets its own result, in order, with lengths counted in characters."""
+        results = self.reasoner.execute_prolog_batch("a.", "goal(X)", [["ä(1)", "b(\n2)"], ["fail"], ["boom"]])
+
+        self.assertEqual(results[0][0], "success")
+        self.assertEqual(results[0][1][0].answers[0].variable, "X")
+        self.assertEqual(results[0][1][0].answers[0].value, "ä(1).\nb(\n2).\n")
+        self.assertEqual(results[0][1][1].answers, [])
+        self.assertEqual(results[1][0], "failure")
+        self.assertEqual(results[2][0], "error")
+        self.assertEqual(results[2][1][0].message, "bad\nthing")
+
+    def test_process_is_reused(self):
+        """Consecutive queries are answered by the same process."""
+        self.reasoner.execute_prolog("a.", "a")
+        self.reasoner.execute_prolog("a.", "a")
+
+        metrics = self.reasoner.metrics()
+        self.assertEqual(metrics.live_sessions, 1)
+        self.assertEqual(metrics.idle_sessions, 1)
+
+    def test_crashed_process_is_replaced(self):
+        """A process which dies is reported as an error and not reused."""
+        results = self.reasoner.execute_prolog_batch("a.", "a", [["crash"]])
+
+        self.assertEqual(results[0][0], "error")
+        self.assertEqual(self.reasoner.metrics().live_sessions, 0)
+
+        status, _ = self.reasoner.execute_prolog("a.", "a")
+        self.assertEqual(status, "success")
+
+    def test_missing_executable_is_reported_as_error(self):
+        """A process which cannot be started is reported as an error like every other process failure."""
+        reasoner = LocalPrologReasoner(command=["/nonexistent/swipl"], max_processes=1)
+
+        results = reasoner.execute_prolog_batch("a.", "a", [["a"], ["b"]])
+
+        self.assertEqual([status for status, _ in results], ["error", "error"])
+        self.assertIn("could not be started", results[0][1][0].message)
+        self.assertEqual(reasoner.metrics().live_sessions, 0)
+
+
+_DRIVER = os.path.join(os.path.dirname(__file__), "..", "..", "..", "prolog", "local_reasoner.pl")
+
+
+@unittest.skipIf(shutil.which("swipl") is None, "SWI-Prolog is not installed")
+class TestLocalPrologDriver(unittest.TestCase):
+    """Tests of prolog/local_reasoner.pl running in a real swipl process."""
+
+    def setUp(self):
+        self.reasoner = LocalPrologReasoner(command=[shutil.which("swipl"), _DRIVER], max_processes=1)
+
+    def tearDown(self):
+        self.reasoner.close()
+
+    def test_execute_prolog_batch(self):
+        """Each fact set is evaluated on its own, facts do not carry over to the next one."""
+        results = self.reasoner.execute_prolog_batch(
+            ":- dynamic employee/1.\nviolation(X) :- employee(X).",
+            "violation(X)",
+            [["employee(john)", "employee('J. Smith')"], []],
+        )
+
+        self.assertEqual(results[0][0], "success")
+        self.assertEqual([answer.answers[0].value for answer in results[0][1]], ["john", "J. Smith"])
+        self.assertEqual(results[1][0], "failure")
+
+    def test_failed_assertion_leaves_no_facts_behind(self):
+        """Facts asserted before a failing one are erased, clauses of the knowledge base equal to a fact are kept."""
+        results = self.reasoner.execute_prolog_batch(
+            ":- dynamic employee/1.\nemployee(kb).\nparent(a, b).\nviolation(X) :- employee(X).",
+            "violation(X)",
+            [["employee(leak)", "parent(x, y)"], ["employee(kb)"], []],
+        )
+
+        self.assertEqual(results[0][0], "error")
+        self.assertEqual([answer.answers[0].value for answer in results[1][1]], ["kb", "kb"])
+        self.assertEqual([answer.answers[0].value for answer in results[2][1]], ["kb"])
+
+
+if __name__ == '__main__':
+    unittest.main()
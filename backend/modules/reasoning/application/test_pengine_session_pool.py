@@ -0,0 +1,143 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+from modules.reasoning.application.pengine_session_pool import PengineSessionPool
+
+
+def _response(body):
+    response = MagicMock()
+    response.json.return_value = body
+    response.status_code = 200
+    return response
+
+
+def _create_response(pengine_id, answer):
+    return _response({"event": "create", "id": pengine_id, "answer": answer})
+
+
+SUCCESS = {"event": "success", "data": [{"X": "mary"}], "more": False}
+
+
+class TestPengineSessionPool(unittest.TestCase):
+    """Unit tests for the PengineSessionPool class, with the Prolog engine mocked out."""
+
+    def test_reuses_pengine_for_same_knowledge_base(self):
+        """The second query against the same knowledge base is sent to the existing pengine."""
+        transport = MagicMock()
+        post = transport.post
+        post.side_effect = [_create_response("p1", SUCCESS), _response(SUCCESS)]
+        pool = PengineSessionPool("http://prolog", transport)
+
+        pool.ask("parent(john, mary).", "parent(john, X)")
+        events = pool.ask("parent(john, mary).", "parent(john, X)")
+
+        self.assertEqual(events, [SUCCESS])
+        self.assertTrue(post.call_args_list[0].args[0].endswith("/pengine/create"))
+        self.assertFalse(post.call_args_list[0].kwargs["json"]["destroy"])
+        self.assertTrue(post.call_args_list[1].args[0].endswith("/pengine/send"))
+        self.assertEqual(post.call_args_list[1].kwargs["params"]["id"], "p1")
+
+    def test_different_knowledge_base_creates_new_pengine(self):
+        """Pengines are keyed by knowledge base, another knowledge base needs its own pengine."""
+        transport = MagicMock()
+        post = transport.post
+        post.side_effect = [_create_response("p1", SUCCESS), _create_response("p2", SUCCESS)]
+        pool = PengineSessionPool("http://prolog", transport)
+
+        pool.ask("a.", "a")
+        pool.ask("b.", "b")
+
+        self.assertTrue(all(call.args[0].endswith("/pengine/create") for call in post.call_args_list))
+
+    def test_pengine_with_errors_is_not_reused(self):
+        """Consult errors are only reported on creation, so such pengines must not be reused."""
+        error = {"event": "error", "data": "syntax error"}
+        transport = MagicMock()
+        post = transport.post
+        post.side_effect = [
+            _response([{"event": "output", "data": "syntax error"}, {"event": "create", "id": "p1", "answer": error}]),
+            _response({"event": "destroy", "id": "p1"}),
+            _create_response("p2", error),
+            _response({"event": "destroy", "id": "p2"}),
+        ]
+        pool = PengineSessionPool("http://prolog", transport)
+
+        pool.ask("invalid(.", "a")
+        pool.ask("invalid(.", "a")
+
+        self.assertTrue(post.call_args_list[1].args[0].endswith("/pengine/send"))
+        self.assertIn(b"destroy", post.call_args_list[1].kwargs["data"])
+        self.assertTrue(post.call_args_list[2].args[0].endswith("/pengine/create"))
+
+    def test_evicts_least_recently_used_pengine_when_full(self):
+        """When the pool is full, the least recently used idle pengine is destroyed to make room."""
+        transport = MagicMock()
+        post = transport.post
+        post.side_effect = [
+            _create_response("p1", SUCCESS),
+            _response({"event": "destroy", "id": "p1"}),
+            _create_response("p2", SUCCESS),
+        ]
+        pool = PengineSessionPool("http://prolog", transport, max_sessions=1)
+
+        pool.ask("a.", "a")
+        pool.ask("b.", "b")
+
+        self.assertEqual(post.call_args_list[1].kwargs["params"]["id"], "p1")
+        self.assertFalse(post.call_args_list[2].kwargs["json"]["destroy"])
+
+    def test_falls_back_to_new_pengine_if_pengine_is_gone(self):
+        """If the engine already destroyed the pengine, the query is repeated on a fresh one."""
+        transport = MagicMock()
+        post = transport.post
+        post.side_effect = [
+            _create_response("p1", SUCCESS),
+            _response({"event": "error", "code": "existence_error", "data": "pengine p1 does not exist"}),
+            _response({"event": "destroy", "id": "p1"}),
+            _create_response("p2", SUCCESS),
+        ]
+        pool = PengineSessionPool("http://prolog", transport)
+
+        pool.ask("a.", "a")
+        events = pool.ask("a.", "a")
+
+        self.assertEqual(events[0]["id"], "p2")
+
+    def test_idle_pengines_expire(self):
+        """Pengines unused for longer than the idle timeout are destroyed instead of reused."""
+        transport = MagicMock()
+        post = transport.post
+        post.side_effect = [
+            _create_response("p1", SUCCESS),
+            _response({"event": "destroy", "id": "p1"}),
+            _create_response("p2", SUCCESS),
+        ]
+        pool = PengineSessionPool("http://prolog", transport, idle_timeout=0)
+
+        pool.ask("a.", "a")
+        pool.ask("a.", "a")
+
+        self.assertIn(b"destroy", post.call_args_list[1].kwargs["data"])
+        self.assertTrue(post.call_args_list[2].args[0].endswith("/pengine/create"))
+
+
+if __name__ == '__main__':
+    unittest.main()
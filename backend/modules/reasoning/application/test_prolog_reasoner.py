@@ -18,6 +18,7 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import os
 import unittest
+from unittest.mock import patch, MagicMock
 
 from modules.reasoning.application.prolog_reasoner import PrologReasoner
 from modules.reasoning.application.dto.prolog_result_dto import PrologResultDTO
@@ -411,5 +412,62 @@ class TestPrologReasoner(unittest.TestCase):
         # Verify results - should be an empty list for a failed query
         self.assertEqual(result, [])
 
+
+@patch.dict(os.environ, {"SWI_PROLOG_URL": "http://localhost:6544"})
+class TestPrologReasonerBatch(unittest.TestCase):
+    """Unit tests for batched evaluation, with the Prolog engine mocked out."""
+
+    def test_execute_prolog_batch(self):
+        """Each fact set is evaluated in a single query and mapped to its own status and answers."""
+        reasoner = PrologReasoner()
+        reasoner._session_pool = MagicMock()
+        reasoner._session_pool.ask.return_value = [{
+            "event": "create",
+            "id": "p1",
+            "answer": {"event": "success", "more": False, "data": [{"Results": [
+                ["success", "", [[["X1", "john"]], [["X1", "mary"]]]],
+                ["failure", "", []],
+                ["error", "permission_error(modify,static_procedure,parent/2)", []],
+            ]}]},
+        }]
+
+        results = reasoner.execute_prolog_batch(
+            ":- dynamic employee/1.\nviolation(X) :- employee(X).",
+            "violation(X1)",
+            [["employee(john)", "employee(mary)"], [], ["parent(john, mary)"]],
+        )
+
+        self.assertEqual(reasoner._session_pool.ask.call_count, 1)
+        self.assertEqual([status for status, _ in results], ["success", "failure", "error"])
+        self.assertEqual([answer.answers[0].value for answer in results[0][1]], ["john", "mary"])
+        self.assertIn("permission_error", results[2][1][0].message)
+
+    def test_execute_prolog_batch_retracts_only_asserted_facts(self):
+        """Assertions cannot leave facts behind when a later one fails, and only asserted facts are retracted."""
+        reasoner = PrologReasoner()
+        reasoner._session_pool = MagicMock()
+        reasoner._session_pool.ask.return_value = [{"event": "failure"}]
+
+        reasoner.execute_prolog_batch("", "violation(X1)", [["employee(john)", "parent(john, mary)"]])
+
+        _, goal = reasoner._session_pool.ask.call_args.args
+        setup, rest = goal.split(", (", 1)
+        self.assertIn("catch(assertz(employee(john)), _A0_0, true)", setup)
+        self.assertIn("catch(assertz(parent(john, mary)), _A0_1, true)", setup)
+        self.assertIn("(nonvar(_A0_1) -> throw(_A0_1) ; true)", rest)
+        self.assertIn("(var(_A0_0) -> ignore(retract(employee(john))) ; true)", rest)
+        self.assertNotIn("retractall", goal)
+
+    def test_execute_prolog_batch_knowledge_base_error(self):
+        """If the knowledge base is broken, every fact set reports the error."""
+        reasoner = PrologReasoner()
+        reasoner._session_pool = MagicMock()
+        reasoner._session_pool.ask.return_value = [{"event": "error", "data": "syntax error"}]
+
+        results = reasoner.execute_prolog_batch("invalid(.", "violation(X1)", [["a"], ["b"]])
+
+        self.assertEqual([status for status, _ in results], ["error", "error"])
+
+
 if __name__ == '__main__':
     unittest.main()
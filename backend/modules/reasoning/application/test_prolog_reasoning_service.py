@@ -0,0 +1,58 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from modules.reasoning.application.prolog_reasoning_service import PrologReasoningService
+
+
+class TestPrologReasoningService(unittest.TestCase):
+
+    def setUp(self):
+        knowledge_base_service = MagicMock()
+        knowledge_base_service.get_knowledge_base.return_value = SimpleNamespace(
+            knowledge_base=":- dynamic employee/1.", goal="violation(X)")
+        self.reasoner = MagicMock()
+        self.reasoner.execute_prolog_batch.side_effect = \
+            lambda knowledge_base, goal, fact_sets: [("failure", []) for _ in fact_sets]
+        self.service = PrologReasoningService(knowledge_base_service, self.reasoner)
+
+    def test_examples_keep_facts_after_comments_and_quoted_periods(self):
+        results = list(self.service.run_examples(1, [
+            "% example\nemployee(john).\nemployee(mary).",
+            "name('J. Smith').",
+        ]))
+
+        _, _, fact_sets = self.reasoner.execute_prolog_batch.call_args.args
+        self.assertEqual(fact_sets, [["employee(john)", "employee(mary)"], ["name('J. Smith')"]])
+        self.assertEqual(sorted(result.index for result in results), [0, 1])
+
+    def test_unreadable_example_is_reported_without_failing_the_batch(self):
+        results = sorted(self.service.run_examples(1, ["name('J. Smith).", "employee(john)."]),
+                         key=lambda result: result.index)
+
+        self.assertEqual(results[0].status, "error")
+        self.assertIn("Unterminated quoted atom", results[0].answers[0].message)
+        self.assertEqual(results[1].status, "failure")
+        _, _, fact_sets = self.reasoner.execute_prolog_batch.call_args.args
+        self.assertEqual(fact_sets, [["employee(john)"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
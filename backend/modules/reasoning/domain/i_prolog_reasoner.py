@@ -0,0 +1,85 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Literal, Tuple
+
+from modules.reasoning.application.dto.prolog_engine_metrics_dto import PrologEngineMetricsDTO
+from modules.reasoning.application.dto.prolog_result_dto import PrologAnswerDTO
+
+
+class IPrologReasoner(ABC):
+    """
+    A reasoner evaluating goals against a Prolog knowledge base.
+    Implementations differ in where the Prolog engine runs, but must return the same answers for the same query.
+    """
+
+    @abstractmethod
+    def execute_prolog(self, knowledge_base: str, goal: str) -> Tuple[
+        Literal["success", "failure", "error"], List[PrologAnswerDTO]]:
+        """
+        Evaluate a goal against a knowledge base.
+
+        :param knowledge_base: The knowledge base, including any facts.
+        :param goal: The goal to evaluate.
+        :return: The overall status and the answers of the goal.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def execute_prolog_batch(self, knowledge_base: str, goal: str, fact_sets: List[List[str]]) -> List[Tuple[
+        Literal["success", "failure", "error"], List[PrologAnswerDTO]]]:
+        """
+        Evaluate a goal once per fact set against a single consulted knowledge base.
+
+        Each fact set is asserted before and retracted after its evaluation, hence the facts have to belong to
+        predicates declared dynamic in the knowledge base.
+
+        :param knowledge_base: The knowledge base without any facts.
+        :param goal: The goal to evaluate for each fact set.
+        :param fact_sets: The fact sets, each fact given as a Prolog term without the terminating period.
+        :return: The status and answers for each fact set, in the same order as the fact sets.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def metrics(self) -> PrologEngineMetricsDTO:
+        """
+        Usage of the engine connections of this worker.
+        """
+        raise NotImplementedError()
+
+
+def summarize_answers(answers: List[PrologAnswerDTO]) -> Literal["success", "failure", "error"]:
+    """
+    The overall status of a query: an error if any answer is an error, a failure if any answer is a failure.
+    """
+    is_error = any(
+        answer.status == "error" for answer in answers
+    )
+
+    is_failure = any(
+        answer.status == "failure" for answer in answers
+    )
+
+    if is_error:
+        return "error"
+    elif is_failure:
+        return "failure"
+
+    return "success"
@@ -0,0 +1,98 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import glob
+import os
+import tempfile
+import uuid
+from typing import Optional
+
+from modules.reasoning.application.dto.compiled_knowledge_base_dto import CompiledKnowledgeBaseDTO
+
+
+class KnowledgeBaseCache:
+    """
+    File based cache of compiled knowledge bases, shared by all workers on the same host.
+
+    Every fragment has a revision which is replaced whenever its atoms or rules change. Entries are stored under
+    the revision they were compiled from, so an entry compiled while a write happened concurrently is never served
+    for the newer revision.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        :param directory: Directory for the cache files. Defaults to KNOWLEDGE_BASE_CACHE_DIR or a directory in the
+            temporary directory of the system.
+        """
+        self._directory = directory or os.getenv(
+            "KNOWLEDGE_BASE_CACHE_DIR",
+            os.path.join(tempfile.gettempdir(), "knowledge-base-cache")
+        )
+        os.makedirs(self._directory, exist_ok=True)
+
+    def revision(self, regulation_fragment_id: int) -> str:
+        """
+        The current revision of the atoms and rules of a regulation fragment.
+        """
+        try:
+            with open(self._revision_path(regulation_fragment_id), "r", encoding="utf-8") as file:
+                return file.read().strip() or "initial"
+        except FileNotFoundError:
+            return "initial"
+
+    def get(self, regulation_fragment_id: int, revision: str) -> Optional[CompiledKnowledgeBaseDTO]:
+        """
+        Retrieve the knowledge base compiled from the given revision, if there is one.
+        """
+        try:
+            with open(self._entry_path(regulation_fragment_id, revision), "r", encoding="utf-8") as file:
+                return CompiledKnowledgeBaseDTO.model_validate_json(file.read())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def put(self, revision: str, compiled: CompiledKnowledgeBaseDTO) -> None:
+        """
+        Store a knowledge base compiled from the given revision.
+        """
+        self._write(self._entry_path(compiled.regulation_fragment_id, revision), compiled.model_dump_json())
+
+    def invalidate(self, regulation_fragment_id: int) -> None:
+        """
+        Start a new revision for a regulation fragment, dropping all cached knowledge bases of older revisions.
+        Must be called after every change to the atoms or rules of the fragment has been committed.
+        """
+        self._write(self._revision_path(regulation_fragment_id), uuid.uuid4().hex)
+
+        for path in glob.glob(os.path.join(self._directory, f"{int(regulation_fragment_id)}-*.json")):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _revision_path(self, regulation_fragment_id: int) -> str:
+        return os.path.join(self._directory, f"{int(regulation_fragment_id)}.revision")
+
+    def _entry_path(self, regulation_fragment_id: int, revision: str) -> str:
+        return os.path.join(self._directory, f"{int(regulation_fragment_id)}-{revision}.json")
+
+    def _write(self, path: str, content: str) -> None:
+        # Write to a temporary file first, so readers in other workers never see a partially written file.
+        fd, temporary_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            file.write(content)
+        os.replace(temporary_path, path)
@@ -0,0 +1,115 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import threading
+import time
+from typing import Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from modules.reasoning.application.dto.prolog_engine_metrics_dto import PrologTransportMetricsDTO
+
+
+class PrologHttpTransport:
+    """
+    Keep-alive HTTP transport to the Prolog engine.
+
+    All requests share one `requests.Session`, so TCP connections to the engine are reused instead of paying for a
+    new handshake on every query. The number of concurrent requests is bounded by `pool_size`; callers wait for a
+    free connection and the time they wait is recorded. Every request has a connect and a read timeout, so a hung
+    pengine cannot block a worker for longer than `read_timeout`.
+    """
+
+    def __init__(self, pool_size: int = 8, connect_timeout: float = 3.05, read_timeout: float = 60.0):
+        """
+        :param pool_size: Maximum number of connections (and concurrent requests) to the engine per worker.
+        :param connect_timeout: Seconds to wait for a connection to the engine.
+        :param read_timeout: Seconds to wait for the engine to answer.
+        """
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+
+        self._session = requests.Session()
+        self._adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+        self._session.mount("http://", self._adapter)
+        self._session.mount("https://", self._adapter)
+
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._requests = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    def post(self, url: str, timeout: Optional[Tuple[float, float]] = None, **kwargs) -> requests.Response:
+        """
+        Send a POST request over a pooled connection.
+
+        :param url: The URL to post to.
+        :param timeout: Optional (connect, read) timeout overriding the defaults for this call.
+        :param kwargs: Passed on to `requests.Session.post`.
+        :return: The response of the engine.
+        """
+        started_waiting = time.monotonic()
+        self._slots.acquire()
+        waited = time.monotonic() - started_waiting
+
+        with self._lock:
+            self._in_use += 1
+            self._requests += 1
+            self._total_wait_seconds += waited
+            self._max_wait_seconds = max(self._max_wait_seconds, waited)
+
+        try:
+            return self._session.post(url, timeout=timeout or (self.connect_timeout, self.read_timeout), **kwargs)
+        finally:
+            with self._lock:
+                self._in_use -= 1
+            self._slots.release()
+
+    def metrics(self) -> PrologTransportMetricsDTO:
+        """
+        Snapshot of the pool usage of this worker.
+        """
+        with self._lock:
+            return PrologTransportMetricsDTO(
+                pool_size=self.pool_size,
+                in_use=self._in_use,
+                idle=self._idle_connections(),
+                requests=self._requests,
+                total_wait_seconds=self._total_wait_seconds,
+                max_wait_seconds=self._max_wait_seconds,
+            )
+
+    def _idle_connections(self) -> int:
+        # urllib3 keeps the open connections waiting for reuse in the queue of each pool, empty slots are None
+        pools = self._adapter.poolmanager.pools
+        idle = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None and pool.pool is not None:
+                idle += sum(1 for connection in list(pool.pool.queue) if connection is not None)
+        return idle
+
+    def close(self) -> None:
+        """
+        Close all pooled connections.
+        """
+        self._session.close()
@@ -16,10 +16,10 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
-from flask import Blueprint, request
+from flask import Blueprint, request, Response
 
 from di_container import container
-from modules.reasoning.application.dto.prolog_query_dto import PrologQueryDTO
+from modules.reasoning.application.dto.prolog_query_dto import PrologQueryDTO, PrologBatchQueryDTO
 from modules.reasoning.application.dto.prolog_result_dto import PrologHttpResponseDTO
 
 prolog_reasoner_controller = Blueprint('prolog_reasoner', __name__)
@@ -40,3 +40,31 @@ def reason_with_examples(regulation_fragment_id):
     return PrologHttpResponseDTO(
         status=status, answers=answers
     ).model_dump(), 200
+
+
+@prolog_reasoner_controller.post('/regulation-fragments/<regulation_fragment_id>/run-examples')
+def reason_with_many_examples(regulation_fragment_id):
+    """
+    Execute many examples against a specific regulation fragment.
+    The results are streamed back as newline delimited JSON, one PrologBatchResultDTO per example in the order
+    in which they are done.
+    """
+    request_data = PrologBatchQueryDTO(**request.get_json())
+
+    results = container.prolog_reasoning_service().run_examples(
+        regulation_fragment_id=regulation_fragment_id,
+        fact_sets=[example.facts for example in request_data.examples],
+    )
+
+    return Response(
+        (result.model_dump_json() + "\n" for result in results),
+        mimetype="application/x-ndjson",
+    )
+
+
+@prolog_reasoner_controller.get('/prolog/metrics')
+def get_metrics():
+    """
+    Usage of the connection pool and pengine sessions to the Prolog engine of the worker answering the request.
+    """
+    return container.prolog_reasoner().metrics().model_dump(), 200
@@ -0,0 +1,87 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import tempfile
+import unittest
+
+from modules.reasoning.application.dto.compiled_knowledge_base_dto import CompiledKnowledgeBaseDTO
+from modules.reasoning.infra.knowledge_base_cache import KnowledgeBaseCache
+
+
+def _compiled(regulation_fragment_id: int, knowledge_base: str) -> CompiledKnowledgeBaseDTO:
+    return CompiledKnowledgeBaseDTO(
+        regulation_fragment_id=regulation_fragment_id,
+        knowledge_base=knowledge_base,
+        goal="allowed(X)",
+        atom_count=1,
+        rule_count=1,
+    )
+
+
+class TestKnowledgeBaseCache(unittest.TestCase):
+    """Unit tests for the KnowledgeBaseCache class, using a temporary directory."""
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.cache = KnowledgeBaseCache(self._directory.name)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_get_returns_stored_entry(self):
+        """An entry stored for the current revision is returned."""
+        revision = self.cache.revision(1)
+        self.cache.put(revision, _compiled(1, "allowed(X) :- a(X)."))
+
+        self.assertEqual(self.cache.get(1, revision), _compiled(1, "allowed(X) :- a(X)."))
+        self.assertIsNone(self.cache.get(2, self.cache.revision(2)))
+
+    def test_invalidate_starts_new_revision(self):
+        """After invalidation the old entry is no longer served."""
+        revision = self.cache.revision(1)
+        self.cache.put(revision, _compiled(1, "allowed(X) :- a(X)."))
+
+        self.cache.invalidate(1)
+
+        self.assertNotEqual(self.cache.revision(1), revision)
+        self.assertIsNone(self.cache.get(1, self.cache.revision(1)))
+        self.assertIsNone(self.cache.get(1, revision))
+
+    def test_entry_compiled_during_write_is_not_served(self):
+        """An entry compiled from a revision that was invalidated in the meantime is never returned."""
+        revision = self.cache.revision(1)
+        self.cache.invalidate(1)
+        self.cache.put(revision, _compiled(1, "stale."))
+
+        self.assertIsNone(self.cache.get(1, self.cache.revision(1)))
+
+    def test_shared_between_instances(self):
+        """Instances using the same directory, as in different workers, share entries and invalidations."""
+        other = KnowledgeBaseCache(self._directory.name)
+        revision = self.cache.revision(1)
+        self.cache.put(revision, _compiled(1, "allowed(X) :- a(X)."))
+
+        self.assertIsNotNone(other.get(1, other.revision(1)))
+
+        other.invalidate(1)
+
+        self.assertIsNone(self.cache.get(1, self.cache.revision(1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
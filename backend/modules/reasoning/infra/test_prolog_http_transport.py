@@ -0,0 +1,104 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+from modules.reasoning.infra.prolog_http_transport import PrologHttpTransport
+
+
+class TestPrologHttpTransport(unittest.TestCase):
+    """Unit tests for the PrologHttpTransport class, with the HTTP session mocked out."""
+
+    def test_post_uses_default_timeouts(self):
+        """Every request carries the configured connect and read timeout."""
+        transport = PrologHttpTransport(pool_size=2, connect_timeout=1, read_timeout=5)
+        transport._session = MagicMock()
+
+        transport.post("http://prolog/pengine/create", json={})
+
+        self.assertEqual(transport._session.post.call_args.kwargs["timeout"], (1, 5))
+
+    def test_post_timeout_can_be_overridden(self):
+        """A single call can override the default timeouts."""
+        transport = PrologHttpTransport()
+        transport._session = MagicMock()
+
+        transport.post("http://prolog/pengine/create", timeout=(1, 2))
+
+        self.assertEqual(transport._session.post.call_args.kwargs["timeout"], (1, 2))
+
+    def test_metrics(self):
+        """Connections are released after each request and the requests are counted."""
+        transport = PrologHttpTransport(pool_size=3)
+        transport._session = MagicMock()
+
+        transport.post("http://prolog/pengine/create")
+        transport.post("http://prolog/pengine/create")
+        metrics = transport.metrics()
+
+        self.assertEqual(metrics.pool_size, 3)
+        self.assertEqual(metrics.in_use, 0)
+        self.assertEqual(metrics.requests, 2)
+
+    def test_idle_counts_kept_alive_connections(self):
+        """Connections are kept alive after a request and reused by the next one."""
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        transport = PrologHttpTransport(pool_size=3)
+        url = f"http://127.0.0.1:{server.server_address[1]}/pengine/create"
+        try:
+            self.assertEqual(transport.metrics().idle, 0)
+
+            transport.post(url)
+            transport.post(url)
+
+            self.assertEqual(transport.metrics().idle, 1)
+        finally:
+            transport.close()
+            server.shutdown()
+            server.server_close()
+
+    def test_releases_connection_on_error(self):
+        """A failing request does not leak its slot in the pool."""
+        transport = PrologHttpTransport(pool_size=1)
+        transport._session = MagicMock()
+        transport._session.post.side_effect = ConnectionError()
+
+        with self.assertRaises(ConnectionError):
+            transport.post("http://prolog/pengine/create")
+
+        self.assertEqual(transport.metrics().in_use, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
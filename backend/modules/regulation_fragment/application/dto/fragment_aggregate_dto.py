@@ -0,0 +1,41 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import List
+
+from pydantic import BaseModel
+
+from modules.atoms.application.dto.atom_dto import AtomDTO
+from modules.regulation_fragment.application.dto.regulation_fragment_dto import RegulationFragmentDTO
+from modules.rules.application.dto.rule_dto import RuleDTO
+
+
+class FragmentAggregateDTO(BaseModel):
+    """
+    Read model of a regulation fragment with its whole formalisation, loaded in one query.
+
+    fragment: The regulation fragment, its token counts are those of the time it was loaded
+    atoms: The atoms of the fragment with their spans, facts first
+    rules: The rules of the fragment in the order they were created
+    """
+    fragment: RegulationFragmentDTO
+    atoms: List[AtomDTO]
+    rules: List[RuleDTO]
+
+    class Config:
+        extra = "forbid"
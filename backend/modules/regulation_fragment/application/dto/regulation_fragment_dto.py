@@ -35,6 +35,7 @@ class RegulationFragmentDTO(BaseModel):
     formalism: Formalism = Formalism.PROLOG
     used_tokens_in: int = 0
     used_tokens_out: int = 0
+    used_tokens_in_cached: int = 0
 
     class Config:
         use_enum_values = True
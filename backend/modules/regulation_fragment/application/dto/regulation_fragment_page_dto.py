@@ -0,0 +1,37 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import List
+
+from pydantic import BaseModel
+
+from modules.regulation_fragment.application.dto.regulation_fragment_summary_dto import RegulationFragmentSummaryDTO
+
+
+class RegulationFragmentPageDTO(BaseModel):
+    """
+    Data Transfer Object for a page of the regulation fragment listing.
+
+    fragments: The fragments of the page
+    total: Number of fragments matching the filters across all pages
+    """
+    fragments: List[RegulationFragmentSummaryDTO]
+    total: int
+
+    class Config:
+        extra = "forbid"
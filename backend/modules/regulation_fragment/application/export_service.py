@@ -16,11 +16,9 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
-from modules.atoms.application.atom_service import AtomService
-from modules.common.util import format_prolog_knowledge_base
-from modules.regulation_fragment.application.regulation_fragment_service import RegulationFragmentService
+from modules.reasoning.application.knowledge_base_service import KnowledgeBaseService
+from modules.regulation_fragment.application.fragment_aggregate_service import FragmentAggregateService
 from modules.regulation_fragment.domain import Formalism
-from modules.rules.application.rule_service import RuleService
 
 
 class ExportService:
@@ -30,13 +28,11 @@ class ExportService:
     """
 
     def __init__(self,
-                 regulation_fragment_service: RegulationFragmentService,
-                 atom_service: AtomService,
-                 rule_service: RuleService,
+                 fragment_aggregate_service: FragmentAggregateService,
+                 knowledge_base_service: KnowledgeBaseService,
                  ):
-        self._regulation_fragment_service = regulation_fragment_service
-        self._atom_service = atom_service
-        self._rule_service = rule_service
+        self._fragment_aggregate_service = fragment_aggregate_service
+        self._knowledge_base_service = knowledge_base_service
 
     def export_regulation_fragment(self, regulation_fragment_id: int) -> str:
         """
@@ -45,19 +41,14 @@ class ExportService:
         :param regulation_fragment_id: The ID of the regulation fragment to export.
         :return: A string containing the exported regulation fragment.
         """
-        fragment = self._regulation_fragment_service.find_by_id(
-            regulation_fragment_id
-        )
+        aggregate = self._fragment_aggregate_service.get(regulation_fragment_id)
+        if aggregate is None:
+            raise ValueError(f"Regulation fragment with ID {regulation_fragment_id} not found.")
 
+        fragment = aggregate.fragment
         if fragment.formalism != Formalism.PROLOG:
             raise ValueError(
                 f"Export currently only supports Prolog formalism, but got {fragment.formalism.name}"
             )
 
-        atoms = self._atom_service.get_atoms_for_regulation_fragment(regulation_fragment_id) or []
-        rules = self._rule_service.get_rules_for_regulation_fragment(regulation_fragment_id) or []
-
-        return format_prolog_knowledge_base(
-            atoms=atoms,
-            rules=rules,
-        )
+        return self._knowledge_base_service.get_knowledge_base(regulation_fragment_id).knowledge_base
@@ -0,0 +1,80 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Optional
+
+from flask import g, has_app_context
+
+from modules.atoms.application.dto.atom_dto import AtomDTO
+from modules.reasoning.infra.knowledge_base_cache import KnowledgeBaseCache
+from modules.regulation_fragment.application.dto.fragment_aggregate_dto import FragmentAggregateDTO
+from modules.regulation_fragment.application.regulation_fragment_service import _dto_from_db
+from modules.regulation_fragment.infra.regulation_fragment_repository import RegulationFragmentRepository
+from modules.rules.application.dto.rule_dto import RuleDTO
+
+
+class FragmentAggregateService:
+    """
+    Service providing a regulation fragment together with its atoms and rules, loaded in a single query.
+
+    Within a request (or job) the aggregate is loaded once and shared by all services asking for it. It is keyed by
+    the knowledge base revision of the fragment, so a change to its atoms or rules loads it again. The token counts
+    of the fragment are not part of the revision and may lag behind within a request.
+    """
+
+    def __init__(self,
+                 regulation_fragment_repository: RegulationFragmentRepository,
+                 knowledge_base_cache: KnowledgeBaseCache,
+                 ):
+        self._regulation_fragment_repository = regulation_fragment_repository
+        self._knowledge_base_cache = knowledge_base_cache
+
+    def get(self, regulation_fragment_id: int) -> Optional[FragmentAggregateDTO]:
+        """
+        Get the regulation fragment with its atoms and rules.
+
+        :param regulation_fragment_id: The ID of the regulation fragment.
+        :return: The aggregate, or None if the fragment wasn't found.
+        """
+        regulation_fragment_id = int(regulation_fragment_id)
+        key = (regulation_fragment_id, self._knowledge_base_cache.revision(regulation_fragment_id))
+
+        loaded = g.setdefault("fragment_aggregates", {}) if has_app_context() else {}
+        aggregate = loaded.get(key)
+        if aggregate is None:
+            aggregate = self._load(regulation_fragment_id)
+            if aggregate is not None:
+                loaded[key] = aggregate
+
+        return aggregate
+
+    def _load(self, regulation_fragment_id: int) -> Optional[FragmentAggregateDTO]:
+        row = self._regulation_fragment_repository.find_aggregate(regulation_fragment_id)
+        if row is None:
+            return None
+
+        fragment, atoms, rules = row
+        # Aggregated rows come in no particular order, sort them like the atom and rule repositories do
+        atoms = sorted(atoms or [], key=lambda atom: (not atom["is_fact"], atom["id"]))
+        rules = sorted(rules or [], key=lambda rule: rule["id"])
+
+        return FragmentAggregateDTO(
+            fragment=_dto_from_db(fragment),
+            atoms=[AtomDTO.model_validate({**atom, "spans": atom["spans"] or []}) for atom in atoms],
+            rules=[RuleDTO.model_validate(rule) for rule in rules],
+        )
@@ -19,13 +19,18 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 from typing import Optional
 
 from db_models import RegulationFragment
-from modules.models.domain.llm_identifier import llm_costs
+from modules.models.domain.llm_identifier import llm_costs, LLMIdentifier
 from modules.regulation_fragment.application.dto.create_regulation_fragment_dto import \
     CreateRegulationFragmentDTO
 from modules.regulation_fragment.application.dto.price_dto import PriceDTO
 from modules.regulation_fragment.application.dto.regulation_fragment_dto import RegulationFragmentDTO
+from modules.regulation_fragment.application.dto.regulation_fragment_page_dto import RegulationFragmentPageDTO
+from modules.regulation_fragment.application.dto.regulation_fragment_summary_dto import RegulationFragmentSummaryDTO
 from modules.regulation_fragment.infra.regulation_fragment_repository import RegulationFragmentRepository
 
+SORTS = ("created_at", "title", "used_tokens", "atom_count", "rule_count")
+MAX_PAGE_SIZE = 200
+
 
 def _dto_from_db(fragment: RegulationFragment) -> RegulationFragmentDTO:
     """
@@ -40,7 +45,8 @@ def _dto_from_db(fragment: RegulationFragment) -> RegulationFragmentDTO:
         llm_identifier=fragment.llm_identifier,
         formalism=fragment.formalism,
         used_tokens_in=fragment.used_tokens_in,
-        used_tokens_out=fragment.used_tokens_out
+        used_tokens_out=fragment.used_tokens_out,
+        used_tokens_in_cached=fragment.used_tokens_in_cached
     )
 
 
@@ -64,6 +70,39 @@ class RegulationFragmentService:
 
         return [_dto_from_db(fragment) for fragment in fragments]
 
+    def find_page(self, query: Optional[str] = None, llm_identifier: Optional[str] = None, sort: str = "created_at",
+                  order: str = "desc", offset: int = 0, limit: int = 50) -> RegulationFragmentPageDTO:
+        """
+        Retrieve a page of the fragment listing, the full content is only loaded by find_by_id.
+
+        Args:
+            query: Only fragments whose title contains it, ignoring case
+            llm_identifier: Only fragments using this LLM
+            sort: One of created_at, title, used_tokens, atom_count and rule_count
+            order: asc or desc
+            offset: Number of fragments to skip
+            limit: Maximum number of fragments, at most MAX_PAGE_SIZE
+
+        Raises:
+            ValueError: If a parameter is out of range
+        """
+        if sort not in SORTS:
+            raise ValueError(f"Unknown sort {sort}, use one of {', '.join(SORTS)}")
+        if order not in ("asc", "desc"):
+            raise ValueError(f"Unknown order {order}, use asc or desc")
+        if llm_identifier is not None and llm_identifier not in LLMIdentifier.__members__:
+            raise ValueError(f"Unknown LLM identifier {llm_identifier}")
+        if offset < 0 or not 0 < limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"The offset must not be negative and the limit between 1 and {MAX_PAGE_SIZE}")
+
+        rows, total = self._regulation_fragment_repository.find_page(query, llm_identifier, sort, order, offset,
+                                                                     limit)
+
+        return RegulationFragmentPageDTO(
+            fragments=[RegulationFragmentSummaryDTO(**row._mapping) for row in rows],
+            total=total,
+        )
+
     def find_by_id(self, fragment_id: int) -> Optional[RegulationFragmentDTO]:
         """
         Retrieve a regulation fragment by its ID.
@@ -82,7 +121,7 @@ class RegulationFragmentService:
         """
         return self._regulation_fragment_repository.delete_by_id(fragment_id)
 
-    def increment_tokens(self, fragment_id: int, delta_in: int, delta_out: int) -> Optional[RegulationFragmentDTO]:
+    def increment_tokens(self, fragment_id: int, delta_in: int, delta_out: int, delta_in_cached: int = 0) -> bool:
         """
         Increment the token counts for a regulation fragment.
 
@@ -90,16 +129,12 @@ class RegulationFragmentService:
             fragment_id: The ID of the regulation fragment
             delta_in: The number of tokens to add to used_tokens_in
             delta_out: The number of tokens to add to used_tokens_out
+            delta_in_cached: The number of tokens to add to used_tokens_in_cached, part of delta_in
 
         Returns:
-            The updated regulation fragment DTO, or None if it wasn't found
+            True if the counts were incremented, False if the fragment wasn't found
         """
-        fragment = self._regulation_fragment_repository.increment_tokens(fragment_id, delta_in, delta_out)
-
-        if not fragment:
-            return None
-
-        return _dto_from_db(fragment)
+        return self._regulation_fragment_repository.increment_tokens(fragment_id, delta_in, delta_out, delta_in_cached)
 
     def estimate_cost(self, fragment_id: int) -> Optional[PriceDTO]:
         """
@@ -121,9 +156,8 @@ class RegulationFragmentService:
         if not llm_cost:
             return None
 
-        input_cost_dollars = llm_cost.input_cost * fragment_dto.used_tokens_in / 1_000_000
-        output_cost_dollars = llm_cost.output_cost * fragment_dto.used_tokens_out / 1_000_000
-
-        total_cost_dollars = input_cost_dollars + output_cost_dollars
-        total_cost_cents = round(total_cost_dollars * 100)
-        return PriceDTO(price=total_cost_cents)
+        return PriceDTO(price=round(llm_cost.estimate(
+            fragment_dto.used_tokens_in,
+            fragment_dto.used_tokens_out,
+            fragment_dto.used_tokens_in_cached
+        ) * 100))
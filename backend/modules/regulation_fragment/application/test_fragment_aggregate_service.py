@@ -0,0 +1,95 @@
+"""
+Leveraging Legal Information Representation for Business Process Compliance
+Copyright (C) 2025 Lukas Rossi (l.rossi@tum.de)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from flask import Flask
+
+from modules.models.domain.llm_identifier import LLMIdentifier
+from modules.regulation_fragment.application.fragment_aggregate_service import FragmentAggregateService
+
+CREATED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _atom(atom_id: int, is_fact: bool, spans=None) -> dict:
+    return dict(id=atom_id, regulation_fragment_id=1, predicate=f"atom_{atom_id}(X)", description="An atom",
+                is_negated=False, is_fact=is_fact, spans=spans)
+
+
+def _rule(rule_id: int) -> dict:
+    return dict(id=rule_id, regulation_fragment_id=1, description="A rule", definition="rule(X) :- atom(X).",
+                is_goal=False, created_at=CREATED_AT.isoformat())
+
+
+class TestFragmentAggregateService(unittest.TestCase):
+
+    def setUp(self):
+        fragment = SimpleNamespace(id=1, title="Fragment", content="Content", created_at=CREATED_AT, source=None,
+                                   llm_identifier=LLMIdentifier.GPT_5, formalism="PROLOG", used_tokens_in=0,
+                                   used_tokens_out=0, used_tokens_in_cached=0)
+        self.repository = MagicMock()
+        self.repository.find_aggregate.return_value = (
+            fragment,
+            [_atom(3, False), _atom(2, True, [dict(id=1, atom_id=2, start=0, end=4)]), _atom(1, False)],
+            [_rule(2), _rule(1)],
+        )
+        self.cache = MagicMock()
+        self.cache.revision.return_value = "initial"
+        self.service = FragmentAggregateService(self.repository, self.cache)
+
+    def test_orders_atoms_and_rules_like_the_repositories(self):
+        aggregate = self.service.get(1)
+
+        self.assertEqual([atom.id for atom in aggregate.atoms], [2, 1, 3])
+        self.assertEqual(aggregate.atoms[0].spans[0].end, 4)
+        self.assertEqual(aggregate.atoms[1].spans, [])
+        self.assertEqual([rule.id for rule in aggregate.rules], [1, 2])
+
+    def test_fragment_without_atoms_and_rules(self):
+        fragment = self.repository.find_aggregate.return_value[0]
+        self.repository.find_aggregate.return_value = (fragment, None, None)
+
+        aggregate = self.service.get(1)
+
+        self.assertEqual(aggregate.atoms, [])
+        self.assertEqual(aggregate.rules, [])
+
+    def test_unknown_fragment(self):
+        self.repository.find_aggregate.return_value = None
+
+        self.assertIsNone(self.service.get(1))
+
+    def test_loads_once_per_request_and_revision(self):
+        with Flask(__name__).app_context():
+            self.service.get(1)
+            self.service.get("1")
+            self.assertEqual(self.repository.find_aggregate.call_count, 1)
+
+            self.cache.revision.return_value = "changed"
+            self.service.get(1)
+            self.assertEqual(self.repository.find_aggregate.call_count, 2)
+
+        with Flask(__name__).app_context():
+            self.service.get(1)
+            self.assertEqual(self.repository.find_aggregate.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
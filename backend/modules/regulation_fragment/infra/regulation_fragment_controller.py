@@ -36,13 +36,32 @@ def export_fragment(fragment_id: str):
 
 
 @regulation_fragment_controller.get('/regulation-fragments')
-def get_all():
-    return [fragment.model_dump() for fragment in container.regulation_fragment_service().find_all()]
+def get_page():
+    """
+    List the fragments without their content, see `RegulationFragmentService.find_page` for the parameters.
+    """
+    try:
+        page = container.regulation_fragment_service().find_page(
+            query=request.args.get('q'),
+            llm_identifier=request.args.get('llm'),
+            sort=request.args.get('sort', 'created_at'),
+            order=request.args.get('order', 'desc'),
+            offset=int(request.args.get('offset', 0)),
+            limit=int(request.args.get('limit', 50)),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return page.model_dump()
 
 
 @regulation_fragment_controller.get('/regulation-fragments/<fragment_id>')
 def get_by_id(fragment_id: str):
-    return container.regulation_fragment_service().find_by_id(int(fragment_id)).model_dump()
+    fragment = container.regulation_fragment_service().find_by_id(int(fragment_id))
+    if fragment:
+        return fragment.model_dump()
+    else:
+        return jsonify({"error": "Regulation fragment not found"}), 404
 
 
 @regulation_fragment_controller.post('/regulation-fragments')
@@ -16,14 +16,27 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Literal, Tuple
 
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import desc
+from sqlalchemy import desc, update, select, func, literal, Row, JSON
 
 from modules.regulation_fragment.application.dto.create_regulation_fragment_dto import \
     CreateRegulationFragmentDTO
-from db_models import RegulationFragment
+from db_models import RegulationFragment, Atom, AtomSpan, Rule
+
+# Characters of the content shown in listings
+CONTENT_PREVIEW_LENGTH = 200
+
+
+def _json_object(**columns):
+    """
+    A JSON object built in the database from the given columns.
+    """
+    arguments = []
+    for key, column in columns.items():
+        arguments += [literal(key), column]
+    return func.json_build_object(*arguments)
 
 
 class RegulationFragmentRepository:
@@ -58,12 +71,124 @@ class RegulationFragmentRepository:
         """
         return RegulationFragment.query.order_by(desc(RegulationFragment.created_at)).all()
 
+    def find_page(self, query: Optional[str] = None, llm_identifier: Optional[str] = None,
+                  sort: Literal["created_at", "title", "used_tokens", "atom_count", "rule_count"] = "created_at",
+                  order: Literal["asc", "desc"] = "desc", offset: int = 0, limit: int = 50) -> Tuple[List[Row], int]:
+        """
+        Retrieve a page of fragments for listings, without their content. The atoms and rules are counted in the
+        same query.
+
+        Args:
+            query: Only fragments whose title contains it, ignoring case
+            llm_identifier: Only fragments using this LLM
+            sort: Column to sort by, ties are broken by ID
+            order: Sort direction
+            offset: Number of fragments to skip
+            limit: Maximum number of fragments
+
+        Returns:
+            Rows of id, title, created_at, source, llm_identifier, formalism, the token counts, content_preview,
+            atom_count and rule_count, and the number of fragments matching the filters
+        """
+        atom_count = select(func.count(Atom.id)) \
+            .where(Atom.regulation_fragment_id == RegulationFragment.id) \
+            .correlate(RegulationFragment) \
+            .scalar_subquery()
+        rule_count = select(func.count(Rule.id)) \
+            .where(Rule.regulation_fragment_id == RegulationFragment.id) \
+            .correlate(RegulationFragment) \
+            .scalar_subquery()
+
+        filters = []
+        if query:
+            filters.append(RegulationFragment.title.icontains(query, autoescape=True))
+        if llm_identifier:
+            filters.append(RegulationFragment.llm_identifier == llm_identifier)
+
+        sort_column = {
+            "created_at": RegulationFragment.created_at,
+            "title": RegulationFragment.title,
+            "used_tokens": RegulationFragment.used_tokens_in + RegulationFragment.used_tokens_out,
+            "atom_count": atom_count,
+            "rule_count": rule_count,
+        }[sort]
+        if order == "asc":
+            ordering = [sort_column.asc(), RegulationFragment.id.asc()]
+        else:
+            ordering = [sort_column.desc(), RegulationFragment.id.desc()]
+
+        rows = self.db.session.execute(
+            select(
+                RegulationFragment.id,
+                RegulationFragment.title,
+                RegulationFragment.created_at,
+                RegulationFragment.source,
+                RegulationFragment.llm_identifier,
+                RegulationFragment.formalism,
+                RegulationFragment.used_tokens_in,
+                RegulationFragment.used_tokens_out,
+                RegulationFragment.used_tokens_in_cached,
+                func.substr(RegulationFragment.content, 1, CONTENT_PREVIEW_LENGTH).label("content_preview"),
+                atom_count.label("atom_count"),
+                rule_count.label("rule_count"),
+            )
+            .where(*filters)
+            .order_by(*ordering)
+            .offset(offset)
+            .limit(limit)
+        ).all()
+        total = self.db.session.scalar(select(func.count(RegulationFragment.id)).where(*filters))
+
+        return rows, total
+
     def find_by_id(self, fragment_id: int) -> Optional[RegulationFragment]:
         """
         Retrieve a regulation fragment by its ID.
         """
         return RegulationFragment.query.get(fragment_id)
 
+    def find_aggregate(self, fragment_id: int) -> Optional[Row]:
+        """
+        Retrieve a regulation fragment together with its atoms, their spans and its rules in a single query. The
+        atoms and rules are aggregated to JSON by the database, Postgres' json_agg and json_build_object.
+
+        Returns:
+            A row of the fragment and the lists of atoms and rules as dictionaries (None if there are none), or
+            None if the fragment wasn't found
+        """
+        spans = select(func.json_agg(_json_object(
+            id=AtomSpan.id,
+            atom_id=AtomSpan.atom_id,
+            start=AtomSpan.start,
+            end=AtomSpan.end,
+        ))).where(AtomSpan.atom_id == Atom.id).correlate(Atom).scalar_subquery()
+
+        atoms = select(func.json_agg(_json_object(
+            id=Atom.id,
+            regulation_fragment_id=Atom.regulation_fragment_id,
+            predicate=Atom.predicate,
+            description=Atom.description,
+            is_negated=Atom.is_negated,
+            is_fact=Atom.is_fact,
+            spans=spans,
+        ), type_=JSON)).where(Atom.regulation_fragment_id == RegulationFragment.id) \
+            .correlate(RegulationFragment).scalar_subquery()
+
+        rules = select(func.json_agg(_json_object(
+            id=Rule.id,
+            regulation_fragment_id=Rule.regulation_fragment_id,
+            description=Rule.description,
+            definition=Rule.definition,
+            is_goal=Rule.is_goal,
+            created_at=Rule.created_at,
+        ), type_=JSON)).where(Rule.regulation_fragment_id == RegulationFragment.id) \
+            .correlate(RegulationFragment).scalar_subquery()
+
+        return self.db.session.execute(
+            select(RegulationFragment, atoms.label("atoms"), rules.label("rules"))
+            .where(RegulationFragment.id == fragment_id)
+        ).first()
+
     def delete_by_id(self, fragment_id: int) -> bool:
         """
         Delete a regulation fragment by its ID.
@@ -79,27 +204,30 @@ class RegulationFragmentRepository:
 
         return True
 
-    def increment_tokens(self, fragment_id: int, delta_in: int, delta_out: int) -> Optional[RegulationFragment]:
+    def increment_tokens(self, fragment_id: int, delta_in: int, delta_out: int, delta_in_cached: int = 0) -> bool:
         """
         Increment the token counts for a regulation fragment.
+        The counts are added in a single UPDATE, so concurrent workers cannot lose each other's increments.
 
         Args:
             fragment_id: The ID of the regulation fragment
             delta_in: The number of tokens to add to used_tokens_in
             delta_out: The number of tokens to add to used_tokens_out
+            delta_in_cached: The number of tokens to add to used_tokens_in_cached, part of delta_in
 
         Returns:
-            The updated regulation fragment, or None if it wasn't found
+            True if the counts were incremented, False if the fragment wasn't found
         """
-        fragment = self.find_by_id(fragment_id)
-
-        if not fragment:
-            return None
-
-        fragment.used_tokens_in += delta_in
-        fragment.used_tokens_out += delta_out
-
-        self.db.session.add(fragment)
+        result = self.db.session.execute(
+            update(RegulationFragment)
+            .where(RegulationFragment.id == fragment_id)
+            .values(
+                used_tokens_in=RegulationFragment.used_tokens_in + delta_in,
+                used_tokens_out=RegulationFragment.used_tokens_out + delta_out,
+                used_tokens_in_cached=RegulationFragment.used_tokens_in_cached + delta_in_cached,
+            )
+            .execution_options(synchronize_session=False)
+        )
         self.db.session.commit()
 
-        return fragment
+        return result.rowcount > 0
@@ -23,10 +23,12 @@ from typing import List, Optional, Tuple
 from modules.atoms.application.atom_service import AtomService
 from modules.atoms.application.atom_util import mask_variables_in_atoms, create_wildcard_predicates
 from modules.atoms.application.dto.atom_dto import AtomDTO
+from modules.common.prolog_syntax import parse_clauses, PrologSyntaxError
 from modules.models.application.dto.chat_agent_message_ingress_dto import ChatAgentMessageIngressDTO
 from modules.models.application.llm_adapter import LLMAdapter
 from modules.reasoning.application.dto.prolog_result_dto import PrologAnswerDTO
-from modules.reasoning.application.prolog_reasoner import PrologReasoner
+from modules.reasoning.domain.i_prolog_reasoner import IPrologReasoner
+from modules.models.domain.llm_usage_stage import LLMUsageStage
 from modules.models.domain.prompt_service import PromptService
 from modules.regulation_fragment.application.regulation_fragment_service import RegulationFragmentService
 from modules.regulation_fragment.domain import Formalism
@@ -45,7 +47,7 @@ class RuleService:
     """
 
     def __init__(self, rule_repository: RuleRepository, regulation_fragment_service: RegulationFragmentService,
-                 chat_agent: LLMAdapter, prolog_reasoner: PrologReasoner,
+                 chat_agent: LLMAdapter, prolog_reasoner: IPrologReasoner,
                  atom_service: AtomService, prompt_service: PromptService):
         self._rule_repository = rule_repository
         self._regulation_fragment_service = regulation_fragment_service
@@ -168,12 +170,7 @@ class RuleService:
         Returns:
             The number of rules deleted
         """
-        rules = self.get_rules_for_regulation_fragment(regulation_fragment_id)
-        count = 0
-        for rule in rules:
-            if self.delete_rule(rule.id):
-                count += 1
-        return count
+        return self._rule_repository.delete_by_regulation_fragment_id(regulation_fragment_id)
 
     def generate_rules_for_regulation_fragment(self, regulation_fragment_id: int) -> None:
         """
@@ -210,7 +207,8 @@ class RuleService:
             ChatAgentMessageIngressDTO(
                 user_prompt=input_message,
                 system_prompt='',
-                regulation_fragment_id=regulation_fragment_id
+                regulation_fragment_id=regulation_fragment_id,
+                stage=LLMUsageStage.RULES,
             )
         )
 
@@ -237,7 +235,8 @@ class RuleService:
                 ChatAgentMessageIngressDTO(
                     user_prompt=retry_message,
                     system_prompt='',
-                    regulation_fragment_id=regulation_fragment_id
+                    regulation_fragment_id=regulation_fragment_id,
+                    stage=LLMUsageStage.RULES,
                 )
             )
             # This bloats the message with too much old prompting. This needs to be improved.
@@ -252,6 +251,8 @@ class RuleService:
         if not syntax_correct:
             # raise ValueError(f"Failed to generate valid rules after {self.retry_limit} attempts. Last error: {err}")
             pass
+        else:
+            self._chat_agent.accept(returned_message)
 
         self._save_extracted_rules(parsed_result, regulation_fragment_id)
 
@@ -296,14 +297,19 @@ class RuleService:
             ChatAgentMessageIngressDTO(
                 user_prompt=regeneration_request,
                 regulation_fragment_id=regulation_fragment_id,
+                stage=LLMUsageStage.RULES,
             )
         )
         if response.is_error:
             raise ValueError(f"Error regenerating rules: {response.message}")
 
         regenerated_result = RuleExtractionResultDTO.from_xml(response.message)
-        self.delete_rules_for_regulation_fragment(regulation_fragment_id)
-        self._save_extracted_rules(regenerated_result, regulation_fragment_id)
+        self._chat_agent.accept(response)
+        # Swap the rule set atomically, so a failure never leaves the fragment without rules
+        self._rule_repository.replace_for_regulation_fragment(
+            regulation_fragment_id,
+            self._extracted_rules_to_create_dtos(regenerated_result, regulation_fragment_id)
+        )
 
     def _check_rule_syntax(self, result: RuleExtractionResultDTO, atoms: List[AtomDTO], formalism: Formalism) -> Tuple[
         bool, List[PrologAnswerDTO]]:
@@ -328,6 +334,17 @@ class RuleService:
             )
             return True, []
 
+        # Reject rules which do not even parse without asking the Prolog engine.
+        for rule in chain(result.rules, result.goals):
+            try:
+                parse_clauses(rule.definition)
+            except PrologSyntaxError as e:
+                return False, [PrologAnswerDTO(
+                    status='error',
+                    message=f"{str(e)} in rule: {rule.definition}",
+                    answers=[]
+                )]
+
         try:
             facts = "\n".join(mask_variables_in_atoms(a for a in atoms if a.is_fact))
             knowledge_base = "\n".join(
@@ -364,22 +381,20 @@ class RuleService:
         Returns:
             None
         """
-        for rule in parsed_result.rules:
-            self._rule_repository.save(
-                CreateRuleDTO(
-                    regulation_fragment_id=regulation_fragment_id,
-                    description=rule.description,
-                    definition=rule.definition,
-                    is_goal=False
-                )
-            )
+        self._rule_repository.save_many(
+            self._extracted_rules_to_create_dtos(parsed_result, regulation_fragment_id)
+        )
 
-        for goal in parsed_result.goals:
-            self._rule_repository.save(
-                CreateRuleDTO(
-                    regulation_fragment_id=regulation_fragment_id,
-                    description=goal.description,
-                    definition=goal.definition,
-                    is_goal=True
-                )
+    @staticmethod
+    def _extracted_rules_to_create_dtos(parsed_result: RuleExtractionResultDTO,
+                                        regulation_fragment_id: int) -> List[CreateRuleDTO]:
+        return [
+            CreateRuleDTO(
+                regulation_fragment_id=regulation_fragment_id,
+                description=rule.description,
+                definition=rule.definition,
+                is_goal=is_goal
             )
+            for rules, is_goal in ((parsed_result.rules, False), (parsed_result.goals, True))
+            for rule in rules
+        ]
@@ -21,6 +21,7 @@ from modules.rules.application.dto.create_rule_dto import CreateRuleDTO
 from modules.rules.application.dto.regenerate_rules_dto import RegenerateRulesDTO
 from modules.rules.application.dto.update_rule_dto import UpdateRuleDTO
 from di_container import container
+from modules.jobs.domain.job_type import JobType
 
 rule_controller = Blueprint('rule', __name__)
 
@@ -38,11 +39,14 @@ def get_rules_for_fragment(fragment_id: str):
 @rule_controller.post('/regulation-fragments/<fragment_id>/rules/generate')
 def generate_rules_for_fragment(fragment_id: str):
     """
-    Generate rules for a specific regulation fragment.
+    Queue the generation of rules for a specific regulation fragment.
     """
-    rule_service = container.rule_service()
-    rule_service.generate_rules_for_regulation_fragment(fragment_id)
-    return '', 204
+    job_service = container.job_service()
+    try:
+        job = job_service.enqueue(JobType.GENERATE_RULES, int(fragment_id))
+    except ValueError as e:
+        return {'error': str(e)}, 404
+    return job.model_dump(mode='json'), 202
 
 
 @rule_controller.delete('/regulation-fragments/<fragment_id>/rules')
@@ -58,12 +62,15 @@ def delete_rules_for_fragment(fragment_id: str):
 @rule_controller.post('/regulation-fragments/<fragment_id>/rules/regenerate')
 def regenerate_rules_for_fragment(fragment_id: str):
     """
-    Regenerate rules for a specific regulation fragment based on feedback.
+    Queue the regeneration of rules for a specific regulation fragment based on feedback.
     """
     regenerate_data = RegenerateRulesDTO(**request.get_json())
-    rule_service = container.rule_service()
-    rule_service.regenerate_rules_for_regulation_fragment(fragment_id, regenerate_data)
-    return '', 204
+    job_service = container.job_service()
+    try:
+        job = job_service.enqueue(JobType.REGENERATE_RULES, int(fragment_id), regenerate_data)
+    except ValueError as e:
+        return {'error': str(e)}, 404
+    return job.model_dump(mode='json'), 202
 
 
 @rule_controller.delete('/rules/<rule_id>')
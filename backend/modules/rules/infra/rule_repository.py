@@ -19,9 +19,12 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 from typing import List, Optional
 
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import insert, delete
 
 from db_models import Rule
+from modules.common.unit_of_work import UnitOfWork
 from modules.rules.application.dto.create_rule_dto import CreateRuleDTO
+from modules.reasoning.infra.knowledge_base_cache import KnowledgeBaseCache
 from modules.rules.application.dto.update_rule_dto import UpdateRuleDTO
 
 
@@ -29,10 +32,16 @@ class RuleRepository:
     """
     Repository for managing rules in the database.
     Provides methods for creating, updating, and finding rules.
+    Every write invalidates the cached knowledge base of the affected regulation fragment once it is committed.
     """
 
-    def __init__(self, db: SQLAlchemy):
+    def __init__(self, db: SQLAlchemy, knowledge_base_cache: KnowledgeBaseCache, unit_of_work: UnitOfWork):
         self.db = db
+        self.knowledge_base_cache = knowledge_base_cache
+        self.unit_of_work = unit_of_work
+
+    def _invalidate(self, regulation_fragment_id: int) -> None:
+        self.unit_of_work.after_commit(lambda: self.knowledge_base_cache.invalidate(regulation_fragment_id))
 
     def save(self, rule_data: CreateRuleDTO) -> Rule:
         """
@@ -51,11 +60,47 @@ class RuleRepository:
             is_goal=rule_data.is_goal,
         )
 
-        self.db.session.add(rule)
-        self.db.session.commit()
+        with self.unit_of_work.transaction():
+            self.db.session.add(rule)
+        self._invalidate(rule.regulation_fragment_id)
 
         return rule
 
+    def save_many(self, rules: List[CreateRuleDTO]) -> None:
+        """
+        Create many rules in the database with a single statement.
+
+        Args:
+            rules: The data for the new rules
+        """
+        if not rules:
+            return
+
+        with self.unit_of_work.transaction():
+            self._insert_many(rules)
+
+        for regulation_fragment_id in {rule.regulation_fragment_id for rule in rules}:
+            self._invalidate(regulation_fragment_id)
+
+    def replace_for_regulation_fragment(self, regulation_fragment_id: int, rules: List[CreateRuleDTO]) -> None:
+        """
+        Replace all rules of a regulation fragment in a single transaction.
+        Either the old or the new rules are persisted, never a mix or neither.
+
+        Args:
+            regulation_fragment_id: The ID of the regulation fragment
+            rules: The data for the new rules, all belonging to the regulation fragment
+        """
+        if any(rule.regulation_fragment_id != regulation_fragment_id for rule in rules):
+            raise ValueError(f"All rules must belong to regulation fragment {regulation_fragment_id}")
+
+        with self.unit_of_work.transaction():
+            self.db.session.execute(delete(Rule).where(Rule.regulation_fragment_id == regulation_fragment_id))
+            if rules:
+                self._insert_many(rules)
+
+        self._invalidate(regulation_fragment_id)
+
     def update(self, rule_id: int, rule_data: UpdateRuleDTO) -> Optional[Rule]:
         """
         Update an existing rule in the database.
@@ -79,8 +124,9 @@ class RuleRepository:
         if rule_data.is_goal is not None:
             rule.is_goal = rule_data.is_goal
 
-        self.db.session.add(rule)
-        self.db.session.commit()
+        with self.unit_of_work.transaction():
+            self.db.session.add(rule)
+        self._invalidate(rule.regulation_fragment_id)
 
         return rule
 
@@ -123,7 +169,40 @@ class RuleRepository:
         if not rule:
             return False
 
-        self.db.session.delete(rule)
-        self.db.session.commit()
+        regulation_fragment_id = rule.regulation_fragment_id
+        with self.unit_of_work.transaction():
+            self.db.session.delete(rule)
+        self._invalidate(regulation_fragment_id)
+
+        return True
+
+    def delete_by_regulation_fragment_id(self, regulation_fragment_id: int) -> int:
+        """
+        Delete all rules of a regulation fragment with a single statement.
+
+        Args:
+            regulation_fragment_id: The ID of the regulation fragment
 
-        return True
\ No newline at end of file
+        Returns:
+            The number of rules deleted
+        """
+        with self.unit_of_work.transaction():
+            result = self.db.session.execute(
+                delete(Rule).where(Rule.regulation_fragment_id == regulation_fragment_id)
+            )
+        self._invalidate(regulation_fragment_id)
+
+        return result.rowcount
+
+    def _insert_many(self, rules: List[CreateRuleDTO]) -> None:
+        self.db.session.execute(
+            insert(Rule),
+            [
+                dict(
+                    regulation_fragment_id=rule.regulation_fragment_id,
+                    description=rule.description,
+                    definition=rule.definition,
+                    is_goal=rule.is_goal,
+                ) for rule in rules
+            ]
+        )
@@ -0,0 +1,178 @@
+% Driver for the local Prolog reasoner (LocalPrologReasoner), talking to the backend over stdin/stdout.
+%
+% Every request consists of a header line followed by length prefixed (in characters) payloads:
+%
+%   ask <limit> <time limit> <knowledge base length> <goal length> <fact set count>\n
+%   <knowledge base><goal>
+%   <fact set length>\n<fact set>          (once per fact set, facts are terminated by a period)
+%
+% The knowledge base is consulted once into a temporary module, then the goal is evaluated once per fact set.
+% For each fact set the answers are written back as
+%
+%   result <answer count>\n
+%   success <binding count>\n              followed by <name length> <value length>\n<name><value> per binding
+%   failure 0\n
+%   error <message length>\n<message>
+%
+% Knowledge bases are loaded and goals checked in sandboxed mode, like in the pengine service.
+
+:- use_module(library(modules)).
+:- use_module(library(readutil)).
+:- use_module(library(sandbox)).
+:- use_module(library(time)).
+
+:- initialization(main, main).
+
+:- dynamic collected_message/1.
+
+% Warnings and errors while loading a knowledge base are reported as answers instead of being printed.
+:- multifile user:message_hook/3.
+user:message_hook(_Term, Kind, Lines) :-
+    nb_current(collect_messages, true),
+    memberchk(Kind, [error, warning]),
+    with_output_to(string(Message), print_message_lines(current_output, '', Lines)),
+    assertz(collected_message(Message)).
+
+main :-
+    set_stream(user_input, encoding(utf8)),
+    set_stream(user_output, encoding(utf8)),
+    serve.
+
+serve :-
+    read_line_to_string(user_input, Header),
+    (   Header == end_of_file
+    ->  true
+    ;   split_string(Header, " ", "", ["ask", L, T, K, G, F]),
+        maplist(number_string, [Limit, TimeLimit, KLength, GLength, FCount], [L, T, K, G, F]),
+        read_string(user_input, KLength, KnowledgeBase),
+        read_string(user_input, GLength, GoalText),
+        read_fact_sets(FCount, FactSets),
+        handle(Limit, TimeLimit, KnowledgeBase, GoalText, FactSets, Results),
+        maplist(write_result, Results),
+        flush_output(user_output),
+        serve
+    ).
+
+read_fact_sets(0, []) :- !.
+read_fact_sets(N, [FactSet|FactSets]) :-
+    read_line_to_string(user_input, Line),
+    number_string(Length, Line),
+    read_string(user_input, Length, FactSet),
+    N1 is N - 1,
+    read_fact_sets(N1, FactSets).
+
+handle(Limit, TimeLimit, KnowledgeBase, GoalText, FactSets, Results) :-
+    same_length(FactSets, Results),
+    catch(
+        in_temporary_module(Module,
+            load_knowledge_base(Module, KnowledgeBase, Messages),
+            maplist(answers(Module, Limit, TimeLimit, GoalText, Messages), FactSets, Results)),
+        E,
+        (   error_message(E, Message),
+            maplist(=([error(Message)]), Results)
+        )).
+
+load_knowledge_base(Module, KnowledgeBase, Messages) :-
+    retractall(collected_message(_)),
+    setup_call_cleanup(
+        ( nb_setval(collect_messages, true), open_string(KnowledgeBase, Stream) ),
+        with_output_to(string(Output),
+            catch(load_files(Module:Module, [stream(Stream), sandboxed(true), silent(true)]),
+                  E, print_message(error, E))),
+        ( close(Stream), nb_setval(collect_messages, false) )),
+    findall(error(Message), retract(collected_message(Message)), Collected),
+    output_answers(Output, Collected, Messages).
+
+answers(Module, Limit, TimeLimit, GoalText, LoadMessages, FactText, Answers) :-
+    catch(evaluate(Module, Limit, TimeLimit, GoalText, FactText, Solutions),
+          E,
+          ( error_message(E, Message), Solutions = [error(Message)] )),
+    append(LoadMessages, Solutions, Answers).
+
+evaluate(Module, Limit, TimeLimit, GoalText, FactText, Answers) :-
+    term_string(Goal, GoalText, [variable_names(Bindings), module(Module)]),
+    read_facts(FactText, Module, Facts),
+    safe_goal(Module:Goal),
+    % The facts are asserted inside the protected goal, so those asserted before a failing one are erased as well.
+    Asserted = asserted([]),
+    setup_call_cleanup(
+        true,
+        ( maplist(assert_fact(Module, Asserted), Facts),
+          with_output_to(string(Output),
+              call_with_time_limit(TimeLimit, findall(Bindings, limit(Limit, Module:Goal), Solutions))) ),
+        erase_facts(Asserted)),
+    (   Solutions == []
+    ->  Results = [failure]
+    ;   maplist(solution_answer, Solutions, Results)
+    ),
+    output_answers(Output, Results, Answers).
+
+read_facts(FactText, Module, Facts) :-
+    setup_call_cleanup(
+        open_string(FactText, Stream),
+        read_terms(Stream, Module, Facts),
+        close(Stream)).
+
+read_terms(Stream, Module, Terms) :-
+    read_term(Stream, Term, [module(Module)]),
+    (   Term == end_of_file
+    ->  Terms = []
+    ;   Terms = [Term|Rest],
+        read_terms(Stream, Module, Rest)
+    ).
+
+assert_fact(Module, Asserted, Fact) :-
+    (   callable(Fact), Fact \= (_ :- _), Fact \= (:- _)
+    ->  assertz(Module:Fact, Ref),
+        arg(1, Asserted, Refs),
+        nb_setarg(1, Asserted, [Ref|Refs])
+    ;   type_error(fact, Fact)
+    ).
+
+% Only the clauses asserted for the fact set are erased, clauses of the knowledge base equal to a fact are kept.
+erase_facts(asserted(Refs)) :-
+    maplist(erase_fact, Refs).
+
+erase_fact(Ref) :-
+    catch(erase(Ref), _, true).
+
+% Anything printed is not part of the answers, it is reported as an error like the output events of pengines.
+output_answers("", Answers, Answers) :- !.
+output_answers(Output, Answers, [error(Output)|Answers]).
+
+solution_answer(Bindings, success(Pairs)) :-
+    exclude(anonymous_binding, Bindings, Named),
+    maplist(binding_pair, Named, Pairs).
+
+anonymous_binding(Name = _) :-
+    sub_atom(Name, 0, _, _, '_').
+
+binding_pair(Name = Value, Name-Text) :-
+    format(string(Text), "~w", [Value]).
+
+error_message(E, Message) :-
+    catch(( '$messages':translate_message(E, Lines, []),
+            with_output_to(string(Message), print_message_lines(current_output, '', Lines)) ),
+          _,
+          format(string(Message), "~q", [E])).
+
+write_result(Answers) :-
+    length(Answers, Count),
+    format("result ~d~n", [Count]),
+    maplist(write_answer, Answers).
+
+write_answer(failure) :-
+    format("failure 0~n").
+write_answer(error(Message)) :-
+    string_length(Message, Length),
+    format("error ~d~n", [Length]),
+    write(Message).
+write_answer(success(Pairs)) :-
+    length(Pairs, Count),
+    format("success ~d~n", [Count]),
+    forall(member(Name-Text, Pairs),
+           ( atom_length(Name, NameLength),
+             string_length(Text, TextLength),
+             format("~d ~d~n", [NameLength, TextLength]),
+             write(Name),
+             write(Text) )).
@@ -7,6 +7,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from db import create_db
 from modules.rules.application.dto.create_rule_dto import CreateRuleDTO
+from modules.reasoning.infra.knowledge_base_cache import KnowledgeBaseCache
 from modules.rules.infra.rule_repository import RuleRepository
 
 # Create a Flask app and configure it
@@ -22,7 +23,7 @@ db.init_app(app)
 def test_rule_goal_flag():
     with app.app_context():
         # Create a repository
-        rule_repository = RuleRepository(db)
+        rule_repository = RuleRepository(db, KnowledgeBaseCache())
         
         # Create a test rule with is_goal=False
         regular_rule = rule_repository.save(
@@ -26,12 +26,29 @@ export type LLMIdentifier =
  * Enum representing different formalisms for regulation fragments.
  */
 export type Formalism1 = "PROLOG";
+/**
+ * Enum representing the kinds of background jobs, one per LLM driven generation endpoint.
+ */
+export type JobType =
+  | "GENERATE_ATOMS"
+  | "REGENERATE_ATOMS"
+  | "GENERATE_RULES"
+  | "REGENERATE_RULES"
+  | "GENERATE_EXAMPLES";
+/**
+ * Enum representing the lifecycle of a background job.
+ */
+export type JobStatus = "PENDING" | "RUNNING" | "SUCCEEDED" | "FAILED";
+/**
+ * The part of the application an LLM call is made for, the usage ledger is aggregated per stage.
+ */
+export type LLMUsageStage = "ATOMS" | "RULES" | "EXAMPLES" | "CHAT" | "OTHER";
 
 /**
  * Data Transfer Object for an agentic log.
  *
  * id: Unique identifier for the log
- * user_prompt: The prompt issued by the human user
+ * user_prompt: The prompt issued by the human user, None if the prompts were not requested
  * system_prompt: Optional prompt issued from the application
  * message_source: The source of the message (USER, SYSTEM, MODEL)
  * regulation_fragment_id: ID of the regulation fragment this log is associated with
@@ -40,13 +57,57 @@ export type Formalism1 = "PROLOG";
  */
 export interface AgenticLogDTO {
   id: number;
-  user_prompt: string;
+  user_prompt?: string | null;
   system_prompt?: string | null;
   message_source: MessageSource;
   regulation_fragment_id: number;
   created_at: string;
   is_error?: boolean;
 }
+/**
+ * Data Transfer Object for a page of agentic logs.
+ *
+ * logs: The logs of the page, in the requested order
+ * start_cursor: Opaque position of the first log, pass it with the opposite order to page backwards
+ * end_cursor: Opaque position of the last log, pass it with the same order to get the next page
+ */
+export interface AgenticLogPageDTO {
+  logs: AgenticLogDTO[];
+  start_cursor?: string | null;
+  end_cursor?: string | null;
+}
+/**
+ * Data Transfer Object for the aggregated usage of a group of LLM calls.
+ *
+ * window_start: Start of the time window, None if not grouped by time
+ * llm_identifier: The LLM of the group, None if not grouped by model
+ * stage: The stage of the group, None if not grouped by stage
+ * calls: Number of calls
+ * error_rate: Share of the calls which failed
+ * input_tokens: Tokens of the prompts
+ * output_tokens: Tokens of the responses
+ * cached_input_tokens: Part of input_tokens which was read from the providers' prompt caches
+ * cost: Estimated cost in dollars
+ * mean_latency_ms: Mean duration of the calls
+ * p50_latency_ms: Median duration of the calls
+ * p90_latency_ms: 90th percentile of the durations
+ * p99_latency_ms: 99th percentile of the durations
+ */
+export interface LLMUsageSummaryDTO {
+  window_start?: string | null;
+  llm_identifier?: LLMIdentifier | null;
+  stage?: LLMUsageStage | null;
+  calls: number;
+  error_rate: number;
+  input_tokens: number;
+  output_tokens: number;
+  cached_input_tokens: number;
+  cost: number;
+  mean_latency_ms: number;
+  p50_latency_ms?: number | null;
+  p90_latency_ms?: number | null;
+  p99_latency_ms?: number | null;
+}
 export interface AtomDTO {
   id: number;
   regulation_fragment_id: number;
@@ -108,6 +169,57 @@ export interface Argument {
   variable: string;
   value: string;
 }
+/**
+ * Data Transfer Object for a background job.
+ *
+ * id: Unique identifier for the job
+ * type: What the job generates
+ * status: Where the job is in its lifecycle (PENDING, RUNNING, SUCCEEDED, FAILED)
+ * regulation_fragment_id: ID of the regulation fragment the job works on
+ * llm_identifier: The LLM the job talks to, concurrency is bounded per LLM
+ * pipeline_id: ID of the pipeline the job is a stage of, if any
+ * result: JSON result of the job, if the generation returns something (e.g. examples)
+ * error: Error message if the job failed
+ */
+export interface JobDTO {
+  id: number;
+  type: JobType;
+  status: JobStatus;
+  regulation_fragment_id: number;
+  llm_identifier: LLMIdentifier;
+  pipeline_id?: number | null;
+  result?: unknown;
+  error?: string | null;
+  created_at: string;
+  started_at?: string | null;
+  finished_at?: string | null;
+}
+/**
+ * Data Transfer Object for a pipeline running the generation stages for several regulation fragments.
+ *
+ * id: Unique identifier for the pipeline
+ * status: RUNNING or PENDING while stages are queued, SUCCEEDED once all fragments went through all stages,
+ *     FAILED if a fragment is stuck at a failed stage (see resume)
+ * stages: The stages every fragment goes through, in order
+ * regulation_fragment_ids: The regulation fragments of the pipeline
+ * jobs: The jobs of all stages run so far, succeeded jobs are the checkpoints
+ */
+export interface PipelineDTO {
+  id: number;
+  status: JobStatus;
+  stages: JobType[];
+  regulation_fragment_ids: number[];
+  jobs: JobDTO[];
+  created_at: string;
+}
+/**
+ * Data Transfer Object for starting a pipeline.
+ *
+ * regulation_fragment_ids: The regulation fragments to generate atoms, rules and examples for
+ */
+export interface CreatePipelineDTO {
+  regulation_fragment_ids: number[];
+}
 export interface PriceDTO {
   price: number;
 }
@@ -120,13 +232,21 @@ export interface PrologResultDTO {
   variable: string;
   value: string;
 }
-export interface PrologHttpResponseDTO {
-  status: "success" | "failure" | "error";
-  answers: PrologAnswerDTO[];
+export interface PrologBatchQueryDTO {
+  examples: PrologQueryDTO[];
 }
 export interface PrologQueryDTO {
   facts: string;
 }
+export interface PrologBatchResultDTO {
+  status: "success" | "failure" | "error";
+  answers: PrologAnswerDTO[];
+  index: number;
+}
+export interface PrologHttpResponseDTO {
+  status: "success" | "failure" | "error";
+  answers: PrologAnswerDTO[];
+}
 export interface RegenerateAtomsDTO {
   feedback: string;
 }
@@ -143,6 +263,38 @@ export interface RegulationFragmentDTO {
   formalism?: Formalism1;
   used_tokens_in?: number;
   used_tokens_out?: number;
+  used_tokens_in_cached?: number;
+}
+/**
+ * Data Transfer Object for a page of the regulation fragment listing.
+ *
+ * fragments: The fragments of the page
+ * total: Number of fragments matching the filters across all pages
+ */
+export interface RegulationFragmentPageDTO {
+  fragments: RegulationFragmentSummaryDTO[];
+  total: number;
+}
+/**
+ * Data Transfer Object for a regulation fragment in listings, without its full content.
+ *
+ * content_preview: The start of the content
+ * atom_count: Number of atoms of the fragment
+ * rule_count: Number of rules of the fragment
+ */
+export interface RegulationFragmentSummaryDTO {
+  id: number;
+  title: string;
+  created_at: string;
+  source?: string | null;
+  llm_identifier: LLMIdentifier;
+  formalism?: Formalism1;
+  used_tokens_in?: number;
+  used_tokens_out?: number;
+  used_tokens_in_cached?: number;
+  content_preview: string;
+  atom_count?: number;
+  rule_count?: number;
 }
 export interface RuleDTO {
   id: number;
@@ -90,7 +90,7 @@ export function AgenticLogs({ className }: Readonly<Props>) {
     fetchPreviousPage,
     hasPreviousPage,
   } = useAgenticLogs(selectedFragmentId);
-  const logs = data?.pages.flat() ?? [];
+  const logs = data?.pages.flatMap(page => page.logs) ?? [];
 
   const [shouldFollow, setShouldFollow] = useState(true);
 
@@ -158,7 +158,7 @@ export function AgenticLogs({ className }: Readonly<Props>) {
                 <div>
                   {/*TODO show system prompt*/}
                   <CollapsibleText maxLines={10} className={'whitespace-pre-wrap list-disc'}>
-                    <FormattedMarkdown content={log.user_prompt} />
+                    <FormattedMarkdown content={log.user_prompt ?? ''} />
                   </CollapsibleText>
                 </div>
               </div>
@@ -1,23 +1,25 @@
-import { AgenticLogDTO } from '@dtos/dto-types';
+import { AgenticLogDTO, AgenticLogPageDTO } from '@dtos/dto-types';
 
 /**
  * Get agentic logs for a specific regulation fragment with cursor-based pagination
  * @param fragmentId The ID of the regulation fragment
- * @param cursor Optional cursor for pagination (ID of the last log in previous batch)
+ * @param cursor Optional opaque cursor for pagination (start or end cursor of a previous page)
  * @param order
  * @param limit Maximum number of logs to fetch
- * @returns Promise with an array of AgenticLogDTO objects
+ * @param includePrompts Whether to include the prompts, without them only the log metadata is returned
+ * @returns Promise with a page of AgenticLogDTO objects and its cursors
  */
 export async function getAgenticLogs(
   fragmentId: number,
-  cursor?: number,
+  cursor?: string,
   order: 'asc' | 'desc' = 'desc',
-  limit: number = 20
-): Promise<Array<AgenticLogDTO>> {
+  limit: number = 20,
+  includePrompts: boolean = true
+): Promise<AgenticLogPageDTO> {
   const queryParams = new URLSearchParams();
 
   if (cursor) {
-    queryParams.append('cursor', cursor.toString());
+    queryParams.append('cursor', cursor);
   }
 
   if (limit) {
@@ -26,6 +28,10 @@ export async function getAgenticLogs(
 
   queryParams.append('order-date', order);
 
+  if (!includePrompts) {
+    queryParams.append('include-prompts', 'false');
+  }
+
   const queryString = queryParams.toString() ? `?${queryParams.toString()}` : '';
 
   const res = await fetch(
@@ -67,7 +73,8 @@ export async function getNewAgenticLogs(
     throw new Error('Failed to fetch new agentic logs');
   }
 
-  const logs = await res.json();
+  const page: AgenticLogPageDTO = await res.json();
+  const logs = page.logs;
 
   // If we have a timestamp, filter logs to only include those after the timestamp
   if (sinceTimestamp) {
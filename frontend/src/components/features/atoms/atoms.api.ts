@@ -1,4 +1,5 @@
 import { AtomDTO, CreateAtomDTO, RegenerateAtomsDTO, UpdateAtomDTO } from '@dtos/dto-types';
+import { waitForJob } from '@/components/features/jobs/jobs.api';
 
 /**
  * Regenerate atoms for a specific regulation fragment with feedback
@@ -24,6 +25,8 @@ export async function regenerateAtomsForFragment(
   if (!res.ok) {
     throw new Error('Failed to regenerate atoms for regulation fragment');
   }
+
+  await waitForJob(await res.json());
 }
 
 /**
@@ -59,6 +62,8 @@ export async function generateAtomsForFragment(fragmentId: number): Promise<void
   if (!res.ok) {
     throw new Error('Failed to generate atoms for regulation fragment');
   }
+
+  await waitForJob(await res.json());
 }
 
 /**
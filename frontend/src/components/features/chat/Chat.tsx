@@ -24,7 +24,7 @@ import { useSelectedRegulationFragmentId } from '@/hooks/useSelectedRegulationFr
 import { useChat } from '@/hooks/useChat';
 import { FormEvent, Fragment, useRef, useState, ReactNode } from 'react';
 import { Button } from '@/components/ui/Button';
-import { createChatMessage } from './chat.api';
+import { streamChatMessage } from './chat.api';
 import { useMutation, useQueryClient } from '@tanstack/react-query';
 import { Skeleton } from '@/components/ui/Skeleton';
 import { ChatMessageDTO } from '@dtos/dto-types';
@@ -38,6 +38,9 @@ interface Props {
   className?: string;
 }
 
+// Placeholder for the reply while it is streamed, replaced by the saved message once it is complete
+const STREAMING_MESSAGE_ID = -1;
+
 function ChatBox({ children, className }: { children: ReactNode; className?: string }) {
   return (
     <Box className={cn('shadow-violet-500 flex-col h-full', className)}>
@@ -63,7 +66,16 @@ export function Chat({ className }: Readonly<Props>) {
 
   const queryClient = useQueryClient();
   const sendMessageMutation = useMutation({
-    mutationFn: (content: string) => createChatMessage(selectedFragmentId!, { content }),
+    mutationFn: (content: string) =>
+      streamChatMessage(selectedFragmentId!, { content }, token =>
+        queryClient.setQueryData<Array<ChatMessageDTO>>(['chat', selectedFragmentId], messages =>
+          messages?.map(message =>
+            message.id === STREAMING_MESSAGE_ID
+              ? { ...message, content: message.content + token }
+              : message
+          )
+        )
+      ),
     onMutate: async content => {
       await queryClient.cancelQueries({ queryKey: ['chat', selectedFragmentId] });
       const previousMessages = queryClient.getQueryData<Array<ChatMessageDTO>>([
@@ -74,6 +86,12 @@ export function Chat({ className }: Readonly<Props>) {
         queryClient.setQueryData<Array<ChatMessageDTO>>(
           ['chat', selectedFragmentId],
           [
+            {
+              id: STREAMING_MESSAGE_ID,
+              created_at: new Date().toISOString(),
+              content: '',
+              agent: 'AI',
+            },
             {
               id: Date.now(),
               created_at: new Date().toISOString(),
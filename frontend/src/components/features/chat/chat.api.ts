@@ -21,7 +21,7 @@ export async function getChatForRegulation(regulationId: string): Promise<Array<
  * Create a new chat message for a regulation
  * @param regulationId The ID of the regulation
  * @param dto The CreateChatMessageDTO containing the message content
- * @returns Promise with the created ChatMessageDTO
+ * @returns Promise with the ChatMessageDTO of the reply
  */
 export async function createChatMessage(
   regulationId: number,
@@ -44,3 +44,70 @@ export async function createChatMessage(
 
   return await res.json();
 }
+
+/**
+ * Create a new chat message for a regulation and stream the reply
+ * @param regulationId The ID of the regulation
+ * @param dto The CreateChatMessageDTO containing the message content
+ * @param onToken Called with every chunk of the reply as it arrives
+ * @returns Promise with the ChatMessageDTO of the saved reply
+ */
+export async function streamChatMessage(
+  regulationId: number,
+  dto: CreateChatMessageDTO,
+  onToken: (token: string) => void
+): Promise<ChatMessageDTO> {
+  const res = await fetch(
+    `${process.env.NEXT_PUBLIC_BACKEND_URL}/regulations/${regulationId}/chat/stream`,
+    {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify(dto),
+    }
+  );
+
+  if (!res.ok || !res.body) {
+    throw new Error('Failed to create chat message');
+  }
+
+  const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = '';
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) {
+      throw new Error('Chat stream ended before the reply was complete');
+    }
+
+    buffer += value;
+    let boundary: number;
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const { event, data } = parseServerSentEvent(buffer.slice(0, boundary));
+      buffer = buffer.slice(boundary + 2);
+
+      if (event === 'token') {
+        onToken(data.content);
+      } else if (event === 'message') {
+        await reader.cancel();
+        return data;
+      } else if (event === 'error') {
+        throw new Error(data.error || 'Failed to create chat message');
+      }
+    }
+  }
+}
+
+function parseServerSentEvent(raw: string): { event: string; data: any } {
+  let event = 'message';
+  const data: string[] = [];
+  for (const line of raw.split('\n')) {
+    if (line.startsWith('event: ')) {
+      event = line.slice('event: '.length);
+    } else if (line.startsWith('data: ')) {
+      data.push(line.slice('data: '.length));
+    }
+  }
+  return { event, data: JSON.parse(data.join('\n')) };
+}
@@ -1,4 +1,5 @@
 import { ExamplesDTO, PrologHttpResponseDTO, PrologQueryDTO } from '@dtos/dto-types';
+import { waitForJob } from '@/components/features/jobs/jobs.api';
 
 /**
  * Fetch the formalism text for a specific regulation fragment
@@ -69,5 +70,6 @@ export async function generateExamples(
     throw new Error('Failed to generate examples for regulation fragment');
   }
 
-  return await res.json();
+  const job = await waitForJob(await res.json());
+  return job.result as ExamplesDTO;
 }
@@ -0,0 +1,89 @@
+import { CreatePipelineDTO, JobDTO, PipelineDTO } from '@dtos/dto-types';
+
+const POLL_INTERVAL_MS = 1000;
+
+/**
+ * Fetch the current state of a background job
+ * @param jobId The ID of the job
+ * @returns Promise with the JobDTO
+ */
+export async function getJob(jobId: number): Promise<JobDTO> {
+  const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/jobs/${jobId}`);
+
+  if (!res.ok) {
+    throw new Error('Failed to fetch job');
+  }
+
+  return await res.json();
+}
+
+/**
+ * Wait until a background job is finished
+ * @param job The job as returned when it was queued
+ * @returns Promise with the succeeded JobDTO
+ * @throws Error with the error message of the job if it failed
+ */
+export async function waitForJob(job: JobDTO): Promise<JobDTO> {
+  while (job.status === 'PENDING' || job.status === 'RUNNING') {
+    await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
+    job = await getJob(job.id);
+  }
+
+  if (job.status === 'FAILED') {
+    throw new Error(job.error || 'Job failed');
+  }
+
+  return job;
+}
+
+/**
+ * Queue the generation of atoms, rules and examples for several regulation fragments
+ * @param regulationFragmentIds The IDs of the regulation fragments
+ * @returns Promise with the PipelineDTO
+ */
+export async function startPipeline(regulationFragmentIds: number[]): Promise<PipelineDTO> {
+  const body: CreatePipelineDTO = { regulation_fragment_ids: regulationFragmentIds };
+  const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/pipelines`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(body),
+  });
+
+  if (!res.ok) {
+    throw new Error('Failed to start pipeline');
+  }
+
+  return await res.json();
+}
+
+/**
+ * Fetch the current state of a pipeline
+ * @param pipelineId The ID of the pipeline
+ * @returns Promise with the PipelineDTO
+ */
+export async function getPipeline(pipelineId: number): Promise<PipelineDTO> {
+  const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/pipelines/${pipelineId}`);
+
+  if (!res.ok) {
+    throw new Error('Failed to fetch pipeline');
+  }
+
+  return await res.json();
+}
+
+/**
+ * Queue the failed or interrupted stages of a pipeline again
+ * @param pipelineId The ID of the pipeline
+ * @returns Promise with the PipelineDTO
+ */
+export async function resumePipeline(pipelineId: number): Promise<PipelineDTO> {
+  const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/pipelines/${pipelineId}/resume`, {
+    method: 'POST',
+  });
+
+  if (!res.ok) {
+    throw new Error('Failed to resume pipeline');
+  }
+
+  return await res.json();
+}
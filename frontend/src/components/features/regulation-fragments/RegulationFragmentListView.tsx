@@ -18,7 +18,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 'use client';
 
-import { RegulationFragmentDTO } from '@dtos/dto-types';
+import { RegulationFragmentSummaryDTO } from '@dtos/dto-types';
 import { useMutation, useQueryClient } from '@tanstack/react-query';
 import { deleteRegulationFragment } from '@/components/features/regulation-fragments/regulation-fragments.api';
 import { LoaderCircle, Trash } from 'lucide-react';
@@ -26,7 +26,7 @@ import { Button } from '@/components/ui/Button';
 import { useSelectedRegulationFragmentId } from '@/hooks/useSelectedRegulationFragment';
 
 interface Props {
-  fragment: RegulationFragmentDTO;
+  fragment: RegulationFragmentSummaryDTO;
   onClick?: () => void;
 }
 
@@ -72,7 +72,7 @@ export function RegulationFragmentListView({ fragment, onClick }: Readonly<Props
 
       <hr className={'my-1 border-neutral-400'} />
       <p className={'whitespace-pre-wrap overflow-hidden overflow-ellipsis line-clamp-3'}>
-        {fragment.content}
+        {fragment.content_preview}
       </p>
     </div>
   );
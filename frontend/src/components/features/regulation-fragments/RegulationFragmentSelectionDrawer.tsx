@@ -21,7 +21,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import { Button } from '@/components/ui/Button';
 import { Menu, X } from 'lucide-react';
 import { parseAsString, useQueryState } from 'nuqs';
-import { useDeferredValue, useMemo, useState } from 'react';
+import { useDeferredValue, useEffect, useState } from 'react';
 import {
   Drawer,
   DrawerClose,
@@ -35,14 +35,13 @@ import {
   DrawerTrigger,
 } from '@/components/ui/Drawer';
 import { RegulationFragmentListView } from '@/components/features/regulation-fragments/RegulationFragmentListView';
-import { RegulationFragmentDTO } from '@dtos/dto-types';
 import { cn } from '@/lib/utils';
 import { useScrolledTo } from '@/hooks/useScrolledTo';
 import { VisuallyHidden } from '@radix-ui/react-visually-hidden';
 import { Input } from '@/components/ui/Input';
+import { useRegulationFragmentList } from '@/hooks/useRegulationFragmentList';
 
 interface Props {
-  fragments: Array<RegulationFragmentDTO>;
   container: {
     current: HTMLDivElement | null;
   };
@@ -50,7 +49,6 @@ interface Props {
 }
 
 export function RegulationFragmentSelectionDrawer({
-  fragments,
   container,
   onSelect,
 }: Readonly<Props>) {
@@ -64,14 +62,16 @@ export function RegulationFragmentSelectionDrawer({
     })
   );
   const deferredQuery = useDeferredValue(query);
-  const filteredFragments = useMemo(() => {
-    if (!deferredQuery) {
-      return fragments;
+  // Fragments are searched and paged on the server, the next page is loaded when scrolling to the bottom
+  const { data, hasNextPage, isFetchingNextPage, fetchNextPage } =
+    useRegulationFragmentList(deferredQuery);
+  const filteredFragments = data?.pages.flatMap(page => page.fragments) ?? [];
+
+  useEffect(() => {
+    if (isScrolledToBottom && hasNextPage && !isFetchingNextPage) {
+      fetchNextPage();
     }
-    return fragments.filter(fragment =>
-      fragment.title.toLowerCase().includes(deferredQuery.toLowerCase())
-    );
-  }, [deferredQuery, fragments]);
+  }, [isScrolledToBottom, hasNextPage, isFetchingNextPage, fetchNextPage]);
 
   return (
     <Drawer
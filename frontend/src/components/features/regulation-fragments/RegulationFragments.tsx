@@ -18,10 +18,8 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 'use client';
 
-import { useQuery } from '@tanstack/react-query';
-import { getRegulationFragments } from '@/components/features/regulation-fragments/regulation-fragments.api';
 import { cn } from '@/lib/utils';
-import { useMemo, useRef, useState } from 'react';
+import { useRef, useState } from 'react';
 import { Skeleton } from '@/components/ui/Skeleton';
 import { Plus } from 'lucide-react';
 import { Button } from '@/components/ui/Button';
@@ -39,27 +37,20 @@ import { RegulationFragmentSelectionDrawer } from '@/components/features/regulat
 import { Box } from '@/components/ui/Box';
 import { useSelectedRegulationFragmentId } from '@/hooks/useSelectedRegulationFragment';
 import { RegulationFragmentView } from '@/components/features/regulation-fragments/RegulationFragmentView';
+import { useRegulationFragmentList } from '@/hooks/useRegulationFragmentList';
+import { useRegulationFragment } from '@/hooks/useRegulationFragment';
 
 interface Props {
   className?: string;
 }
 
 export function RegulationFragments({ className }: Readonly<Props>) {
-  const {
-    data: fragments = [],
-    isPending,
-    isError,
-    refetch,
-  } = useQuery({
-    queryKey: ['regulation-fragments'],
-    queryFn: () => getRegulationFragments(),
-  });
+  // Only the first page is needed here, to know whether there are any fragments at all
+  const { data, isPending, isError, refetch } = useRegulationFragmentList(null);
+  const hasNoFragments = data?.pages[0]?.total === 0;
 
   const [selectedFragmentId, setSelectedFragmentId] = useSelectedRegulationFragmentId();
-  const selectedFragment = useMemo(
-    () => fragments.find(fragment => fragment.id === selectedFragmentId),
-    [fragments, selectedFragmentId]
-  );
+  const { data: selectedFragment } = useRegulationFragment(selectedFragmentId);
   const containerRef = useRef<HTMLDivElement>(null);
   const [isCreateModalOpen, setIsCreateModalOpen] = useState(false);
 
@@ -91,7 +82,6 @@ export function RegulationFragments({ className }: Readonly<Props>) {
           setSelectedFragmentId(id);
           setIsCreateModalOpen(false);
         }}
-        fragments={fragments}
         container={containerRef}
       />
 
@@ -126,7 +116,7 @@ export function RegulationFragments({ className }: Readonly<Props>) {
 
       <div className={'flex-grow flex flex-col size-full overflow-auto p-4'}>
         <h3 className="text-lg font-semibold">Regulation Fragments</h3>
-        {fragments?.length === 0 && (
+        {hasNoFragments && (
           <CreateRegulationFragmentForm
             className={'size-full mt-8'}
             onSuccess={async f => {
@@ -1,4 +1,9 @@
-import { CreateRegulationFragmentDTO, PriceDTO, RegulationFragmentDTO } from '@dtos/dto-types';
+import {
+  CreateRegulationFragmentDTO,
+  PriceDTO,
+  RegulationFragmentDTO,
+  RegulationFragmentPageDTO,
+} from '@dtos/dto-types';
 
 export async function createRegulationFragment(
   fragment: CreateRegulationFragmentDTO
@@ -18,8 +23,30 @@ export async function createRegulationFragment(
   return await res.json();
 }
 
-export async function getRegulationFragments(): Promise<Array<RegulationFragmentDTO>> {
-  const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/regulation-fragments`);
+/**
+ * Get a page of the regulation fragment listing, the fragments come without their full content
+ * @param query Optional search text, only fragments whose title contains it are returned
+ * @param offset Number of fragments to skip
+ * @param limit Maximum number of fragments to fetch
+ * @returns Promise with the fragments of the page and the total number of matching fragments
+ */
+export async function getRegulationFragments(
+  query?: string | null,
+  offset: number = 0,
+  limit: number = 50
+): Promise<RegulationFragmentPageDTO> {
+  const queryParams = new URLSearchParams();
+
+  if (query) {
+    queryParams.append('q', query);
+  }
+
+  queryParams.append('offset', offset.toString());
+  queryParams.append('limit', limit.toString());
+
+  const res = await fetch(
+    `${process.env.NEXT_PUBLIC_BACKEND_URL}/regulation-fragments?${queryParams.toString()}`
+  );
 
   if (!res.ok) {
     throw new Error('Failed to fetch regulation fragments');
@@ -28,6 +55,16 @@ export async function getRegulationFragments(): Promise<Array<RegulationFragment
   return await res.json();
 }
 
+export async function getRegulationFragment(id: number): Promise<RegulationFragmentDTO> {
+  const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/regulation-fragments/${id}`);
+
+  if (!res.ok) {
+    throw new Error('Failed to fetch regulation fragment');
+  }
+
+  return await res.json();
+}
+
 export async function deleteRegulationFragment(id: number): Promise<void> {
   const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/regulation-fragments/${id}`, {
     method: 'DELETE',
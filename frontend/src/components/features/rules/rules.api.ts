@@ -1,4 +1,5 @@
 import { RuleDTO, CreateRuleDTO, UpdateRuleDTO, RegenerateRulesDTO } from '@dtos/dto-types';
+import { waitForJob } from '@/components/features/jobs/jobs.api';
 
 /**
  * Regenerate rules for a specific regulation fragment with feedback
@@ -24,6 +25,8 @@ export async function regenerateRulesForFragment(
   if (!res.ok) {
     throw new Error('Failed to regenerate rules for regulation fragment');
   }
+
+  await waitForJob(await res.json());
 }
 
 /**
@@ -59,6 +62,8 @@ export async function generateRulesForFragment(fragmentId: number): Promise<void
   if (!res.ok) {
     throw new Error('Failed to generate rules for regulation fragment');
   }
+
+  await waitForJob(await res.json());
 }
 
 /**
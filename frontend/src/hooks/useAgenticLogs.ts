@@ -6,10 +6,17 @@ import { AgenticLogDTO } from '@dtos/dto-types';
 import { useEffect } from 'react';
 
 type PageParam = {
-  cursor: number;
+  cursor: string;
   direction: 'asc' | 'desc';
 };
 
+type LogsPage = {
+  // Logs in ascending order
+  logs: Array<AgenticLogDTO>;
+  oldestCursor?: string | null;
+  newestCursor?: string | null;
+};
+
 /**
  * Hook to fetch agentic logs for a specific fragment ID with efficient real-time updates
  * @param fragmentId The ID of the regulation fragment
@@ -21,24 +28,24 @@ export function useAgenticLogs(fragmentId: number | null) {
   const queryClient = useQueryClient();
   const queryKeyOld = ['agentic-logs', fragmentId];
 
-  const query = useInfiniteQuery<Array<AgenticLogDTO>>({
+  const query = useInfiniteQuery<LogsPage>({
     initialPageParam: undefined as PageParam | undefined,
     queryKey: queryKeyOld,
     queryFn: ({ pageParam }) => {
       const castPageParam = pageParam as PageParam | undefined;
       const usedDirection = castPageParam?.direction ?? 'desc';
-      return getAgenticLogs(fragmentId!, castPageParam?.cursor, usedDirection, LIMIT).then(data =>
-        usedDirection === 'asc' ? data : data.reverse()
+      return getAgenticLogs(fragmentId!, castPageParam?.cursor, usedDirection, LIMIT).then(page =>
+        usedDirection === 'asc'
+          ? { logs: page.logs, oldestCursor: page.start_cursor, newestCursor: page.end_cursor }
+          : { logs: page.logs.reverse(), oldestCursor: page.end_cursor, newestCursor: page.start_cursor }
       );
     },
     getNextPageParam: (lastPage, _, lastPageParam) => {
-      const lastLog = lastPage[lastPage.length - 1];
       // If there is no last log we just reuse the page param for next time
-      return lastLog ? { cursor: lastLog.id, direction: 'asc' } : lastPageParam;
+      return lastPage.newestCursor ? { cursor: lastPage.newestCursor, direction: 'asc' } : lastPageParam;
     },
     getPreviousPageParam: firstPage => {
-      const firstLog = firstPage[0];
-      return firstLog ? { cursor: firstLog.id, direction: 'desc' } : undefined;
+      return firstPage.oldestCursor ? { cursor: firstPage.oldestCursor, direction: 'desc' } : undefined;
     },
     select: data => {
       // Remove empty pages whilst keeping the "page params up to date"
@@ -46,7 +53,7 @@ export function useAgenticLogs(fragmentId: number | null) {
       const newPageParams: (typeof data)['pageParams'] = [];
 
       data.pages.forEach((item, index) => {
-        if (item.length > 0) {
+        if (item.logs.length > 0) {
           newPages.push(item);
           newPageParams.push(data.pageParams[index]);
         }
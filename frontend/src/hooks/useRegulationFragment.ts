@@ -0,0 +1,17 @@
+'use client';
+
+import { useQuery } from '@tanstack/react-query';
+import { getRegulationFragment } from '@/components/features/regulation-fragments/regulation-fragments.api';
+
+/**
+ * Hook to fetch a regulation fragment with its full content
+ * @param fragmentId The ID of the regulation fragment
+ * @returns Query result with the fragment, loading and error states
+ */
+export function useRegulationFragment(fragmentId: number | null) {
+  return useQuery({
+    queryKey: ['regulation-fragments', fragmentId],
+    queryFn: () => getRegulationFragment(fragmentId!),
+    enabled: !!fragmentId,
+  });
+}
@@ -0,0 +1,23 @@
+'use client';
+
+import { useInfiniteQuery } from '@tanstack/react-query';
+import { getRegulationFragments } from '@/components/features/regulation-fragments/regulation-fragments.api';
+
+/**
+ * Hook to page through the regulation fragment listing, filtered on the server
+ * @param query Optional search text for the fragment titles
+ * @returns Infinite query result with the pages of fragments, loading and error states
+ */
+export function useRegulationFragmentList(query: string | null) {
+  const LIMIT = 50;
+
+  return useInfiniteQuery({
+    queryKey: ['regulation-fragments', 'list', query ?? ''],
+    queryFn: ({ pageParam }) => getRegulationFragments(query, pageParam, LIMIT),
+    initialPageParam: 0,
+    getNextPageParam: (lastPage, _, lastPageParam) => {
+      const nextOffset = lastPageParam + lastPage.fragments.length;
+      return nextOffset < lastPage.total ? nextOffset : undefined;
+    },
+  });
+}